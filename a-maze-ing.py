@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
+import argparse
 import sys
-import random
-import os
+from typing import Callable, Optional
 
 try:
     from pydantic import ValidationError
@@ -11,14 +11,36 @@ except ModuleNotFoundError:
                      "Run: make install\n\033[0m")
     sys.exit(1)
 
-from typing import List, Tuple, Dict, Optional, Union
-from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.generator.MazeGenerator import (
+    MazeGenerator, ALGORITHMS, SOLVERS
+)
 from parse.config_parser import read_config, parse_config
 from parse.config_model import MazeConfig
 from maze_app.maze import Maze
+from maze_app.batch import run_batch
+from maze_app.disk_cache import MazeCache
+from maze_app.bulk import run_bulk
+from maze_app.output.read_maze import validate_hex_maze
+from maze_app.output.stream_maze import stream_file_maze
+from maze_app.profiling import Profiler
 from maze_app.themes import classic_theme, dark_theme, neon_theme
 
 
+def finish_profile(
+    profiler: Optional[Profiler], report: str, stats: Optional[str]
+) -> None:
+    """Stop ``profiler`` and write its report, if profiling is on."""
+    if profiler is None:
+        return
+    profiler.stop()
+    try:
+        profiler.dump(report, stats)
+    except OSError as e:
+        sys.stderr.write(f"Error writing profile: {e.strerror}\n")
+        return
+    print(f"Profile written to {report}")
+
+
 def main() -> None:
     """Run the maze application.
 
@@ -26,10 +48,128 @@ def main() -> None:
     renders the initial maze, and provides an interactive menu for
     regenerating, solving, and customizing the maze.
 
+    With ``--stream`` the maze is written row by row to the output file
+    with Eller's algorithm, without rendering or keeping it in memory.
+
+    With ``--count``, ``--out-dir`` or ``--no-render`` it runs headless:
+    the mazes are generated, solved and written without the menu;
+    ``--workers`` spreads them over a process pool.
+
+    ``--animate`` shows the mazes being carved and solved in the menu.
+
+    ``--profile`` writes the time spent in each phase (generate,
+    solve, render, write) and a few counters to a JSON report.
+
+    ``--cache`` keeps seeded mazes on disk, so running the same
+    configuration again loads the maze and its solution instead of
+    generating and solving it.
+
+    ``--verify`` checks every generated maze with ``maze_app.verify``,
+    which needs NumPy; with ``--stream`` the written file is checked
+    by the streaming hex reader instead.
+
     Raises:
         SystemExit: If configuration loading or maze generation fails.
     """
-    config_path = "config.txt"
+    parser = argparse.ArgumentParser(
+        description="Generate, solve and render mazes."
+    )
+    parser.add_argument(
+        "config", nargs="?", default="config.txt",
+        help="path to the configuration file (default: config.txt)",
+    )
+    parser.add_argument(
+        "--config", dest="config_option", metavar="PATH",
+        help="path to the configuration file (overrides the positional)",
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="stream a perfect Eller's maze to OUTPUT_FILE and exit",
+    )
+    parser.add_argument(
+        "--count", type=int, metavar="N",
+        help="generate N mazes (seeds SEED, SEED+1, ...) and exit",
+    )
+    parser.add_argument(
+        "--out-dir", metavar="DIR",
+        help="directory for the generated files (batch mode)",
+    )
+    parser.add_argument(
+        "--no-render", action="store_true",
+        help="do not draw the mazes; only write the files (batch mode)",
+    )
+    parser.add_argument(
+        "--workers", type=int, metavar="K",
+        help="generate the batch in K processes (implies --no-render)",
+    )
+    parser.add_argument(
+        "--verify", action="store_true",
+        help="check every generated maze (walls, border, '42', "
+             "connectivity) with NumPy",
+    )
+    parser.add_argument(
+        "--animate", action="store_true",
+        help="show generation and solving step by step (interactive)",
+    )
+    parser.add_argument(
+        "--fps", type=float, default=30.0,
+        help="frame rate cap of --animate (default: 30)",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=0, metavar="N",
+        help="events per --animate frame; slows the run down to --fps "
+             "(default: run at full speed)",
+    )
+    parser.add_argument(
+        "--profile", metavar="REPORT",
+        help="write per-phase timings and counters as JSON to REPORT",
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="add tracemalloc peaks and the generators' frontier peak "
+             "to --profile (slows the run down)",
+    )
+    parser.add_argument(
+        "--cprofile", metavar="STATS",
+        help="also write cProfile statistics to STATS (needs --profile)",
+    )
+    parser.add_argument(
+        "--cache", metavar="DIR",
+        help="reuse seeded mazes and their solutions stored in DIR",
+    )
+    parser.add_argument(
+        "--cache-mb", type=float, default=256.0,
+        help="size limit of the --cache directory in MB (default: 256)",
+    )
+    args = parser.parse_args()
+    if args.count is not None and args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.fps <= 0 or args.steps < 0:
+        parser.error("--fps must be positive and --steps not negative")
+    if (args.profile_memory or args.cprofile) and not args.profile:
+        parser.error("--profile-memory and --cprofile need --profile")
+    if args.profile and (args.stream or args.workers is not None):
+        parser.error("--profile does not support --stream or --workers")
+    if args.cache and (args.stream or args.workers is not None):
+        parser.error("--cache does not support --stream or --workers")
+    if args.cache_mb <= 0:
+        parser.error("--cache-mb must be positive")
+    config_path = args.config_option or args.config
+    batch = (
+        args.count is not None or args.out_dir is not None
+        or args.no_render or args.workers is not None
+    )
+    check: Optional[Callable[[MazeGenerator], None]] = None
+    if args.verify and not args.stream:
+        try:
+            from maze_app.verify import verify_maze
+        except ModuleNotFoundError:
+            sys.stderr.write("\033[91mError: --verify needs NumPy.\n"
+                             "Run: pip install numpy\n\033[0m")
+            sys.exit(1)
+        check = verify_maze
     try:
         raw_config = read_config(config_path)
         parsed_config = parse_config(raw_config)
@@ -44,7 +184,6 @@ def main() -> None:
         perfect = config.perfect
         algorithm = config.algorithm
         solver = config.solver
-        os.system("clear")
 
     except ValidationError as e:
         for error in e.errors():
@@ -69,13 +208,69 @@ def main() -> None:
     green = "\033[38;5;192m"
     reset = "\033[0m"
 
-    if seed is not None:
-        random.seed(seed)
-
     generator = MazeGenerator(
-        height, width, entry, exit_pos, perfect, seed, algorithm, solver
+        height, width, entry, exit_pos, perfect, seed, algorithm, solver,
+        check=check, loop_density=config.loop_density,
+        longest_path=config.longest_path,
     )
     maze = Maze(generator, file)
+    if args.animate:
+        maze.animation = (args.fps, args.steps)
+    profiler: Optional[Profiler] = None
+    if args.profile:
+        profiler = Profiler(args.profile_memory, args.cprofile is not None)
+        maze.profiler = profiler
+        profiler.start()
+    cache: Optional[MazeCache] = None
+    if args.cache:
+        try:
+            cache = MazeCache(args.cache, int(args.cache_mb * 2**20))
+        except OSError as e:
+            sys.stderr.write(f"Error: {args.cache}: {e.strerror}\n")
+            sys.exit(1)
+        maze.cache = cache
+
+    if args.stream:
+        if config.longest_path:
+            sys.stderr.write("Error: LONGEST_PATH needs the whole maze "
+                             "and does not work with --stream\n")
+            sys.exit(1)
+        try:
+            way = stream_file_maze(generator, file)
+            if args.verify:
+                validate_hex_maze(file)
+        except ValueError as e:
+            sys.stderr.write(f"Generation error: {e}\n")
+            sys.exit(1)
+        print(
+            f"Streamed {height}x{width} maze to {file} "
+            f"(solution length: {len(way)})"
+        )
+        return
+
+    if args.workers is not None:
+        try:
+            run_bulk(
+                config, args.count or 1, args.out_dir or "", args.workers,
+                check,
+            )
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Generation error: {e}\n")
+            sys.exit(1)
+        return
+
+    if batch:
+        try:
+            run_batch(
+                generator, file, args.count or 1, args.out_dir or "",
+                render=not args.no_render, profiler=profiler,
+                cache=cache,
+            )
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Generation error: {e}\n")
+            sys.exit(1)
+        finish_profile(profiler, args.profile, args.cprofile)
+        return
 
     try:
         maze.generate()
@@ -91,10 +286,6 @@ def main() -> None:
     )
 
     show_path = False
-    paths: Dict[str, Optional[Union[List[Tuple[int, int]], str]]] = {
-        "bfs": None,
-        "dfs": None,
-    }
     try:
         while True:
             curr_alg = (
@@ -123,9 +314,7 @@ def main() -> None:
                 break
 
             if choice == "1":
-                os.system("clear")
                 maze.generate()
-                paths = {"bfs": None, "dfs": None}
                 show_path = False
                 maze.render()
                 print(
@@ -138,20 +327,18 @@ def main() -> None:
                 )
 
             elif choice == "2":
-                os.system("clear")
                 show_path = not show_path
-                solver_key = maze.current_solver
-                if show_path and isinstance(solver_key, str):
-                    if paths.get(solver_key) is None:
-                        paths[solver_key] = maze.solve("way")
-                    path = paths[solver_key]
-                    if isinstance(path, list):
+                if show_path:
+                    maze.animate_solve()
+                    path = maze.solve("way")
+                    if isinstance(path, list) and path:
                         maze.render(show_path=True)
                         print("\nCoordinates:")
                         print(path)
+                        print(f"\nDirections:{maze.solve('str')}")
                         print(
-                            "\nDirections:"
-                            f"{generator.print_coordinates(path)}"
+                            "\nNodes expanded: "
+                            f"{generator.nodes_expanded}"
                         )
                     elif isinstance(path, str) and path != "":
                         maze.render(show_path=True)
@@ -171,22 +358,25 @@ def main() -> None:
                     )
 
             elif choice == "3":
+                algorithms = list(ALGORITHMS)
+                exit_option = str(len(algorithms) + 1)
                 while True:
-                    print(orange + "1: PRIM\n" "2: DFS\n" "3: Exit\n", reset)
+                    print(orange, end="")
+                    for n, name in enumerate(algorithms, 1):
+                        print(f"{n}: {name.upper()}")
+                    print(f"{exit_option}: Exit\n", reset)
                     a_choice = input(
                         f"{brown}Select Algorithm: "f"{reset}").strip()
-                    if a_choice == "1":
-                        maze.current_algorithm = "prim"
+                    if a_choice.isdigit() and 1 <= int(a_choice) < int(
+                        exit_option
+                    ):
+                        maze.current_algorithm = algorithms[int(a_choice) - 1]
                         break
-                    elif a_choice == "2":
-                        maze.current_algorithm = "dfs"
-                        break
-                    elif a_choice == "3":
+                    elif a_choice == exit_option:
                         break
                     else:
                         print(f"{red}Invalid option. Try again. {reset}")
 
-                os.system("clear")
                 generator.algorithm = maze.current_algorithm
                 maze.render(show_path)
                 alg_display = (
@@ -198,21 +388,25 @@ def main() -> None:
                 )
 
             elif choice == "4":
+                solvers = list(SOLVERS)
+                exit_option = str(len(solvers) + 1)
                 while True:
-                    print(orange + "1: BFS\n" "2: DFS\n" "3: Exit\n", reset)
+                    print(orange, end="")
+                    for n, name in enumerate(solvers, 1):
+                        print(f"{n}: {name.upper()}")
+                    print(f"{exit_option}: Exit\n", reset)
                     s_choice = input(f"{brown}Select Solver:{reset}").strip()
-                    if s_choice == "1":
-                        maze.current_solver = "bfs"
-                        break
-                    elif s_choice == "2":
-                        maze.current_solver = "dfs"
+                    if s_choice.isdigit() and 1 <= int(s_choice) < int(
+                        exit_option
+                    ):
+                        maze.current_solver = solvers[int(s_choice) - 1]
                         break
-                    elif s_choice == "3":
+                    elif s_choice == exit_option:
                         break
                     else:
                         print(f"{red}Invalid option. Try again.{reset}")
-                os.system("clear")
                 generator.solver = maze.current_solver
+                maze.save()
                 maze.render(show_path)
                 sol_display = (
                     maze.current_solver if maze.current_solver else ""
@@ -245,19 +439,18 @@ def main() -> None:
                         break
                     else:
                         print(f"{red}Invalid option. Try again.{reset}")
-                os.system("clear")
                 maze.render(show_path)
 
             elif choice == "6":
                 break
             else:
-                os.system("clear")
                 maze.render(show_path)
                 print(f"\n{red}Invalid option. Try again.{reset}")
     except KeyboardInterrupt:
         pass
     finally:
-        os.system("clear")
+        maze.screen.clear()
+        finish_profile(profiler, args.profile, args.cprofile)
         print()
         print(f"{pink}=" * 21)
         print("      Goodbye!")
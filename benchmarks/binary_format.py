@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Compare the hex and the packed binary maze files.
+
+Usage:
+    python3 benchmarks/binary_format.py [--sizes 500 1000 2000] [--seed N]
+
+For every size N an NxN perfect maze is saved in both formats. The
+script prints the file sizes, the time to load each one back into a
+generator (parsing every hex row against mapping the binary file) and
+the time of the first BFS solve on the loaded grid.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Tuple, TypeVar
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import MazeGenerator  # noqa: E402
+from maze_app.output.binary_maze import (  # noqa: E402
+    load_binary_maze, save_maze,
+)
+
+T = TypeVar("T")
+_HEX_VALUE = bytes.maketrans(b"0123456789ABCDEF", bytes(range(16)))
+
+
+def load_hex(path: str, generator: MazeGenerator) -> MazeGenerator:
+    """Read the grid rows of a hex file into a copy of ``generator``."""
+    loaded = MazeGenerator(
+        generator.height, generator.width, generator.entry,
+        generator.exit, generator.perfect,
+    )
+    cells = bytearray()
+    with open(path, "rb") as f:
+        for line in f:
+            row = line.rstrip(b"\n")
+            if not row:
+                break
+            cells += row.translate(_HEX_VALUE)
+    loaded.adopt(cells)
+    return loaded
+
+
+def timed(func: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """Return the result of ``func(*args)`` and the elapsed seconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the comparison and print one line per size and format."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[500, 1000, 2000]
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10} {'format':>7} {'bytes':>12} "
+        f"{'load s':>9} {'solve s':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            generator = MazeGenerator(
+                size, size, (0, 0), (size - 1, size - 1), True, args.seed,
+                "dfs",
+            )
+            generator.generate()
+            way = generator.get_solution()
+            way = way if isinstance(way, str) else ""
+            hex_path = os.path.join(tmp, "maze.txt")
+            bin_path = os.path.join(tmp, "maze.amz")
+            save_maze(generator, way, hex_path)
+            save_maze(generator, way, bin_path)
+            from_hex, hex_load = timed(load_hex, hex_path, generator)
+            (from_bin, _), bin_load = timed(load_binary_maze, bin_path)
+            label = f"{size}x{size}"
+            for name, path, loaded, load in (
+                ("hex", hex_path, from_hex, hex_load),
+                ("binary", bin_path, from_bin, bin_load),
+            ):
+                _, solve = timed(loaded.solve_cells)
+                print(
+                    f"{label:>10} {name:>7} {os.path.getsize(path):>12} "
+                    f"{load:>9.3f} {solve:>9.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Time the PNG and PPM export of large mazes and its peak memory.
+
+Usage:
+    python3 benchmarks/image_export.py [--sizes 1000 4000 10000]
+                                       [--scale 1] [--path] [--seed N]
+
+For every size N an NxN perfect maze is generated with Eller's
+algorithm (not timed; about two minutes and 200 MB for 10000x10000)
+and exported by ``export_image`` as PNG at zlib levels 1 and 6 and as
+PPM. The script prints the export time, the file size and the peak
+Python memory traced during the export, which stays at a few strips
+of rows whatever the maze size. ``--path`` also draws the BFS
+solution, which is solved before timing.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import MazeGenerator  # noqa: E402
+from maze_app.output.image_maze import export_image  # noqa: E402
+
+
+def main() -> None:
+    """Run the exports and print one line per size and format."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 4000, 10000]
+    )
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--path", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>12} {'format':>7} {'pixels':>14} {'export s':>9} "
+        f"{'file MB':>9} {'peak MB':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            generator = MazeGenerator(
+                size, size, (0, 0), (size - 1, size - 1), True, args.seed,
+                "eller",
+            )
+            generator.generate()
+            path = generator.solve_cells() if args.path else None
+            pixels = (
+                3 * size * args.scale * (2 * size + 1) * args.scale
+            )
+            label = f"{size}x{size}"
+            for name, ext, level in (
+                ("png-1", "png", 1), ("png-6", "png", 6), ("ppm", "ppm", 6),
+            ):
+                out = os.path.join(tmp, f"maze.{ext}")
+                tracemalloc.start()
+                start = time.perf_counter()
+                export_image(
+                    generator, out, path, None, args.scale, level
+                )
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(
+                    f"{label:>12} {name:>7} {pixels:>14} {elapsed:>9.2f} "
+                    f"{os.path.getsize(out) / 2**20:>9.1f} "
+                    f"{peak / 2**20:>8.1f}"
+                )
+                os.remove(out)
+
+
+if __name__ == "__main__":
+    main()
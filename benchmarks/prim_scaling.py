@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Measure how randomized Prim's generation scales with maze size.
+
+Usage:
+    python3 benchmarks/prim_scaling.py [--sizes 100 500 1000] [--seed N]
+
+For every size N an NxN perfect maze is generated with a fixed seed.
+The script prints the wall-clock time and the cost per cell; a roughly
+constant ``us/cell`` column means generation scales linearly.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import MazeGenerator  # noqa: E402
+
+
+def bench(size: int, seed: int) -> float:
+    """Generate one ``size``x``size`` maze and return elapsed seconds."""
+    generator = MazeGenerator(
+        size, size, (0, 0), (size - 1, size - 1), True, seed, "prim"
+    )
+    start = time.perf_counter()
+    generator.generate()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the scaling sweep and print one line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+",
+        default=[100, 250, 500, 1000, 2000, 5000],
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'cells':>12} {'seconds':>10} {'us/cell':>9}")
+    for size in args.sizes:
+        elapsed = bench(size, args.seed)
+        cells = size * size
+        label = f"{size}x{size}"
+        print(
+            f"{label:>10} {cells:>12} {elapsed:>10.3f} "
+            f"{elapsed / cells * 1e6:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
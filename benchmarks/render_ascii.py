@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Compare the buffered ASCII renderer with the previous per-block one.
+
+Usage:
+    python3 benchmarks/render_ascii.py [--sizes 50 200 500] [--repeat 3]
+
+Both renderers draw the same maze, with the solution path shown, into a
+throwaway stream. ``legacy`` is the former implementation, which built
+each line with ``+=`` and printed every line separately; ``buffered`` is
+``build_frame`` plus a single write. File output is not timed.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import MazeGenerator, Wall  # noqa: E402
+from maze_app.render.render import build_frame  # noqa: E402
+from maze_app.themes import classic_theme  # noqa: E402
+
+
+def legacy(mz: MazeGenerator, show_path: bool, themes: Dict[str, str]) -> None:
+    """Draw the maze the way ``render_ascii`` did before buffering."""
+    wall_char = "██"
+    path_set = set(mz.get_solution("way")) if show_path else set()
+    p42_set = mz.pattern42_coords
+    pattern42_color = "\033[35m"
+    w_col = themes["wall"]
+    e_col = themes["entry"]
+    x_col = themes["exit"]
+    p_col = themes["path"]
+    res = themes["reset"]
+    for y, row in enumerate(mz.grid):
+        line_h = ""
+        line_w = ""
+        for x, cell_bits in enumerate(row):
+            pos = (y, x)
+            if cell_bits & Wall.NORTH.value:
+                line_h += (f"{w_col}{wall_char}{res}" * 3)
+            elif pos in path_set and (y - 1, x) in path_set:
+                line_h += (
+                    f"{w_col}{wall_char}{res}"
+                    f"{p_col}{wall_char}{res}"
+                    f"{w_col}{wall_char}{res}"
+                )
+            else:
+                line_h += (
+                    f"{w_col}{wall_char}{res}"
+                    f"  {w_col}{wall_char}{res}"
+                )
+            if pos == mz.entry:
+                char_center = f"{e_col}{wall_char}{res}"
+            elif pos == mz.exit:
+                char_center = f"{x_col}{wall_char}{res}"
+            elif pos in path_set:
+                char_center = f"{p_col}{wall_char}{res}"
+            elif pos in p42_set:
+                char_center = f"{pattern42_color}{wall_char}{res}"
+            else:
+                char_center = "  "
+            if cell_bits & Wall.WEST.value:
+                line_w += f"{w_col}{wall_char}{res}"
+            else:
+                line_w += (
+                    f"{p_col}{wall_char}{res}"
+                    if (pos in path_set and (y, x - 1) in path_set)
+                    else "  "
+                )
+            line_w += char_center
+            if cell_bits & Wall.EAST.value:
+                line_w += f"{w_col}{wall_char}{res}"
+            else:
+                line_w += (
+                    f"{p_col}{wall_char}{res}"
+                    if (pos in path_set and (y, x + 1) in path_set)
+                    else "  "
+                )
+        print(line_h)
+        print(line_w)
+    print(f"{w_col}{wall_char}{res}" * 3 * len(mz.grid[0]))
+
+
+def buffered(
+    mz: MazeGenerator, show_path: bool, themes: Dict[str, str]
+) -> None:
+    """Draw the maze with ``build_frame`` and one write."""
+    sys.stdout.write(build_frame(mz, show_path, themes))
+    sys.stdout.flush()
+
+
+def bench(
+    draw: Callable[[MazeGenerator, bool, Dict[str, str]], None],
+    mz: MazeGenerator,
+    repeat: int,
+) -> tuple[float, int]:
+    """Return the best time of ``repeat`` draws and the bytes written."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        sink = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            draw(mz, True, classic_theme())
+        best = min(best, time.perf_counter() - start)
+        size = len(sink.getvalue().encode())
+    return best, size
+
+
+def main() -> None:
+    """Run both renderers on each size and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10} {'legacy s':>10} {'buffered s':>11} "
+        f"{'speedup':>8} {'legacy MB':>10} {'buffered MB':>12}"
+    )
+    for size in args.sizes:
+        mz = MazeGenerator(
+            size, size, (0, 0), (size - 1, size - 1), False, args.seed
+        )
+        mz.generate()
+        mz.get_solution()
+        old, old_bytes = bench(legacy, mz, args.repeat)
+        new, new_bytes = bench(buffered, mz, args.repeat)
+        label = f"{size}x{size}"
+        print(
+            f"{label:>10} {old:>10.3f} {new:>11.3f} {old / new:>7.1f}x "
+            f"{old_bytes / 1e6:>10.2f} {new_bytes / 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
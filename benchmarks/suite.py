@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Benchmark the generators, solvers, renderer and writers against a baseline.
+
+Usage:
+    python3 benchmarks/suite.py [--sizes 15 100 500] [--only generate]
+                                [--baseline FILE] [--save]
+                                [--tolerance 0.25] [--out FILE]
+
+Every case runs with a fixed seed:
+
+* ``generate/<algorithm>/<perfect|imperfect>/<size>``
+* ``solve/<solver>/<perfect|imperfect>/<size>`` on a prim maze
+* ``render/<size>``: ``build_frame`` with the path shown
+* ``diameter/<size>``: ``diameter`` of a perfect prim maze
+* ``write/<hex|binary>/<size>``: ``save_maze`` to a temporary file
+
+A case is repeated until each sample takes at least ``--min-time``
+seconds, and the best of ``--repeat`` samples is kept as seconds per
+call. It is then run once more under ``tracemalloc`` for its peak
+memory. Results go to ``--out`` as JSON, with cells per second.
+
+With ``--save`` the results become the baseline. Otherwise, if the
+baseline exists, every case in both is compared and the script exits
+with status 1 when a time or a peak grew by more than ``--tolerance``
+(0.25 means 25 %). Sizes up to 4000 are supported; a 4000x4000 sweep
+takes about half an hour.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import (  # noqa: E402
+    ALGORITHMS, SOLVERS, MazeGenerator,
+)
+from maze_app.output.binary_maze import save_maze  # noqa: E402
+from maze_app.render.render import build_frame  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "baseline.json")
+SEED = 42
+Case = Tuple[str, int, Callable[[], Any]]
+
+
+def maze(size: int, perfect: bool, algorithm: str = "prim") -> MazeGenerator:
+    """Return a generated square maze with the benchmark seed."""
+    generator = MazeGenerator(
+        size, size, (0, 0), (size - 1, size - 1), perfect, SEED, algorithm,
+    )
+    generator.generate()
+    return generator
+
+
+def cases(sizes: List[int], only: List[str], tmp: str) -> Iterator[Case]:
+    """Yield ``(name, cells, func)`` for every case to time.
+
+    Mazes are only built when their case is reached, so a large sweep
+    holds one size at a time.
+    """
+    for size in sizes:
+        cells = size * size
+        if "generate" in only:
+            for algorithm in ALGORITHMS:
+                for perfect in (True, False):
+                    generator = MazeGenerator(
+                        size, size, (0, 0), (size - 1, size - 1), perfect,
+                        SEED, algorithm,
+                    )
+                    mode = "perfect" if perfect else "imperfect"
+                    yield (
+                        f"generate/{algorithm}/{mode}/{size}", cells,
+                        generator.generate,
+                    )
+        if "solve" in only:
+            for perfect in (True, False):
+                generator = maze(size, perfect)
+                mode = "perfect" if perfect else "imperfect"
+                for name, solver in SOLVERS.items():
+                    yield (
+                        f"solve/{name}/{mode}/{size}", cells,
+                        lambda s=solver, g=generator: s(g),
+                    )
+        if "diameter" in only:
+            generator = maze(size, True)
+            yield f"diameter/{size}", cells, generator.diameter
+        if "render" in only or "write" in only:
+            generator = maze(size, True)
+            way = generator.get_solution()
+            way = way if isinstance(way, str) else ""
+        if "render" in only:
+            yield (
+                f"render/{size}", cells,
+                lambda g=generator: build_frame(g, True),
+            )
+        if "write" in only:
+            for fmt, ext in (("hex", ".txt"), ("binary", ".amz")):
+                path = os.path.join(tmp, "maze" + ext)
+                yield (
+                    f"write/{fmt}/{size}", cells,
+                    lambda g=generator, w=way, p=path: save_maze(g, w, p),
+                )
+
+
+def measure(
+    func: Callable[[], Any], repeat: int, min_time: float
+) -> Tuple[float, int]:
+    """Return the best seconds per call of ``func`` and its peak bytes."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Describe every case whose time or peak grew beyond ``tolerance``."""
+    found = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for key in ("seconds", "peak_bytes"):
+            if before[key] and now[key] > before[key] * (1 + tolerance):
+                found.append(
+                    f"{name}: {key} {before[key]:.6g} -> {now[key]:.6g} "
+                    f"(+{now[key] / before[key] - 1:.0%})"
+                )
+    return found
+
+
+def main() -> None:
+    """Run the suite, then save or check the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[15, 100, 500]
+    )
+    kinds = ["generate", "solve", "diameter", "render", "write"]
+    parser.add_argument("--only", nargs="+", default=kinds, choices=kinds)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--out", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'case':<40} {'seconds':>11} {'cells/s':>12} {'peak KB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cells, func in cases(args.sizes, args.only, tmp):
+            seconds, peak = measure(func, args.repeat, args.min_time)
+            results[name] = {
+                "seconds": seconds,
+                "peak_bytes": peak,
+                "cells_per_s": cells / seconds,
+            }
+            print(
+                f"{name:<40} {seconds:>11.6f} {cells / seconds:>12.0f} "
+                f"{peak / 1024:>9.0f}"
+            )
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": SEED,
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save first")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    found = regressions(results, baseline, args.tolerance)
+    for line in found:
+        print(f"REGRESSION {line}")
+    compared = len(results.keys() & baseline.keys())
+    print(f"{compared} cases compared, {len(found)} regressions")
+    if found:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
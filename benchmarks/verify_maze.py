@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare maze validation with NumPy against plain Python loops.
+
+Usage:
+    python3 benchmarks/verify_maze.py [--sizes 250 500 1000] [--seed N]
+
+For every size N an NxN perfect maze is generated, then checked by
+``maze_app.verify.maze_problems`` and by the same checks written as
+Python loops over ``grid`` (wall symmetry, closed border, closed '42'
+cells, a BFS for connectivity, and the edge count). The script prints
+the generation time next to both validation times.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_app.generator.MazeGenerator import MazeGenerator  # noqa: E402
+from maze_app.verify import maze_problems  # noqa: E402
+
+
+def loop_problems(generator: MazeGenerator) -> List[str]:
+    """The checks of ``maze_problems`` as nested Python loops."""
+    grid = [list(row) for row in generator.grid]
+    h, w = generator.height, generator.width
+    reserved = generator.pattern42_coords
+    problems: List[str] = []
+    edges = 0
+    for f in range(h):
+        for c in range(w):
+            v = grid[f][c]
+            if c + 1 < w:
+                if bool(v & 2) != bool(grid[f][c + 1] & 8):
+                    problems.append(f"east/west walls disagree at ({f},{c})")
+                edges += not v & 2
+            elif not v & 2:
+                problems.append(f"east border is open at ({f},{c})")
+            if f + 1 < h:
+                if bool(v & 4) != bool(grid[f + 1][c] & 1):
+                    problems.append(
+                        f"south/north walls disagree at ({f},{c})"
+                    )
+                edges += not v & 4
+            elif not v & 4:
+                problems.append(f"south border is open at ({f},{c})")
+            if (f == 0 and not v & 1) or (c == 0 and not v & 8):
+                problems.append(f"border is open at ({f},{c})")
+            if (f, c) in reserved and v != 15:
+                problems.append(f"'42' cell ({f},{c}) is not fully closed")
+    seen = {generator.entry}
+    queue = deque([generator.entry])
+    while queue:
+        f, c = queue.popleft()
+        for bit, df, dc in ((1, -1, 0), (2, 0, 1), (4, 1, 0), (8, 0, -1)):
+            nxt = (f + df, c + dc)
+            if not grid[f][c] & bit and nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    free = h * w - len(reserved)
+    if len(seen) != free:
+        problems.append(f"{free - len(seen)} cells are not reachable")
+    if generator.perfect and edges != free - 1:
+        problems.append(f"perfect maze has {edges} open edges")
+    return problems
+
+
+def main() -> None:
+    """Run the comparison and print one line per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[250, 500, 1000]
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>10} {'generate s':>11} {'numpy s':>9} {'loops s':>9} "
+        f"{'speedup':>8}"
+    )
+    for size in args.sizes:
+        generator = MazeGenerator(
+            size, size, (0, 0), (size - 1, size - 1), True, args.seed
+        )
+        start = time.perf_counter()
+        generator.generate()
+        generate = time.perf_counter() - start
+        start = time.perf_counter()
+        vectorized = maze_problems(generator)
+        numpy_s = time.perf_counter() - start
+        start = time.perf_counter()
+        looped = loop_problems(generator)
+        loops_s = time.perf_counter() - start
+        if vectorized or looped:
+            print(f"invalid maze: {vectorized or looped}")
+        label = f"{size}x{size}"
+        print(
+            f"{label:>10} {generate:>11.3f} {numpy_s:>9.3f} "
+            f"{loops_s:>9.3f} {loops_s / numpy_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
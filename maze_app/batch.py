@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.binary_maze import save_maze
+from maze_app.profiling import Profiler
+from maze_app.disk_cache import MazeCache
+from maze_app.render.render import build_frame
+from maze_app.themes import classic_theme
+
+
+def batch_file_name(
+    file_name: str, out_dir: str, index: int, count: int
+) -> str:
+    """Return the output path of maze ``index`` out of ``count``.
+
+    A single maze keeps the configured name; several mazes get a
+    zero-padded, 1-based suffix before the extension.
+
+    Args:
+        file_name: Configured output filename.
+        out_dir: Directory the files go to.
+        index: Zero-based position of the maze in the batch.
+        count: Number of mazes in the batch.
+
+    Returns:
+        The path of the output file.
+    """
+    stem, ext = os.path.splitext(os.path.basename(file_name))
+    if count > 1:
+        stem = f"{stem}_{index + 1:0{len(str(count))}d}"
+    return os.path.join(out_dir, stem + ext)
+
+
+def run_batch(
+    generator: MazeGenerator,
+    file_name: str,
+    count: int = 1,
+    out_dir: str = "",
+    render: bool = False,
+    themes: Dict[str, str] = classic_theme(),
+    profiler: Optional[Profiler] = None,
+    cache: Optional[MazeCache] = None,
+) -> List[str]:
+    """Generate, solve and save mazes without the interactive menu.
+
+    With a seed, maze ``n`` uses ``seed + n`` so every file of the batch
+    is reproducible on its own. Each maze produces one plain-text
+    summary line; the ANSI drawing is only emitted when ``render`` is
+    set.
+
+    Args:
+        generator: Configured maze generator.
+        file_name: Configured output filename.
+        count: Number of mazes to produce.
+        out_dir: Output directory; defaults to the one of ``file_name``.
+        render: Whether to draw each maze with its solution.
+        themes: Color theme used when rendering.
+        profiler: Optional profiler timing each phase.
+        cache: Optional cache of seeded mazes, read before generating.
+
+    Returns:
+        The paths of the written files.
+    """
+    out_dir = out_dir or os.path.dirname(file_name) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    base_seed = generator.seed
+    written: List[str] = []
+    prof = profiler
+    try:
+        for n in range(count):
+            if base_seed is not None:
+                generator.seed = base_seed + n
+            start = time.perf_counter()
+            cached = cache is not None and cache.fetch(generator)
+            if cached and generator.check is not None:
+                generator.check(generator)
+            elif not cached:
+                with nullcontext() if prof is None else (
+                    prof.generating(generator)
+                ):
+                    generator.generate()
+            with nullcontext() if prof is None else prof.solving(generator):
+                way = generator.get_solution()
+            if cache is not None and not cached:
+                cache.store(generator, time.perf_counter() - start)
+            way = way if isinstance(way, str) else ""
+            path = batch_file_name(file_name, out_dir, n, count)
+            with nullcontext() if prof is None else prof.writing(path):
+                save_maze(generator, way, path)
+            if render:
+                with nullcontext() if prof is None else prof.phase("render"):
+                    sys.stdout.write(build_frame(generator, True, themes))
+            print(
+                f"{path}: {generator.height}x{generator.width} "
+                f"algorithm={generator.algorithm} seed={generator.seed} "
+                f"solution={len(way)}"
+            )
+            written.append(path)
+    finally:
+        generator.seed = base_seed
+    return written
@@ -0,0 +1,145 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    Callable, Iterator, NamedTuple, Optional, Sequence, Tuple
+)
+from maze_app.batch import batch_file_name
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.binary_maze import save_maze
+from parse.config_model import MazeConfig
+
+BulkJob = Tuple[MazeConfig, int]
+# Validation run on each generated maze; it must be a module-level
+# function so that it can be sent to the worker processes.
+MazeCheck = Callable[[MazeGenerator], None]
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one bulk job.
+
+    Attributes:
+        job: Position of the job in the submitted list.
+        seed: Seed the maze was generated with.
+        path: File the maze was written to.
+        solution_length: Number of moves in the written solution.
+        seconds: Time the worker spent generating, solving and writing.
+    """
+
+    job: int
+    seed: int
+    path: str
+    solution_length: int
+    seconds: float
+
+
+def _run_job(
+    index: int,
+    total: int,
+    config: MazeConfig,
+    seed: int,
+    out_dir: str,
+    check: Optional[MazeCheck] = None,
+) -> BulkResult:
+    """Generate, solve and write one maze inside a worker process.
+
+    The generator gets its own ``random.Random`` seeded with ``seed``, so
+    the file only depends on the job, not on the worker that ran it.
+    """
+    start = time.perf_counter()
+    generator = MazeGenerator(
+        config.height, config.width, config.entry, config.exit_,
+        config.perfect, seed, config.algorithm, config.solver,
+        rng=random.Random(seed), check=check,
+        loop_density=config.loop_density,
+        longest_path=config.longest_path,
+    )
+    generator.generate()
+    way = generator.get_solution()
+    way = way if isinstance(way, str) else ""
+    path = batch_file_name(config.output_file, out_dir, index, total)
+    save_maze(generator, way, path)
+    return BulkResult(
+        index, seed, path, len(way), time.perf_counter() - start
+    )
+
+
+def generate_bulk(
+    jobs: Sequence[BulkJob],
+    out_dir: str,
+    workers: Optional[int] = None,
+    check: Optional[MazeCheck] = None,
+) -> Iterator[BulkResult]:
+    """Spread maze jobs across a process pool.
+
+    Results are yielded as soon as each file is written, so their order
+    follows completion, not submission; ``BulkResult.job`` maps them
+    back to ``jobs``.
+
+    Args:
+        jobs: ``(config, seed)`` pairs, one maze each.
+        out_dir: Directory the hex files are written to.
+        workers: Number of worker processes (default: CPU count).
+        check: Validation run on every maze before it is written.
+
+    Yields:
+        One ``BulkResult`` per finished job.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _run_job, n, len(jobs), config, seed, out_dir, check
+            )
+            for n, (config, seed) in enumerate(jobs)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_bulk(
+    config: MazeConfig,
+    count: int,
+    out_dir: str = "",
+    workers: Optional[int] = None,
+    check: Optional[MazeCheck] = None,
+) -> float:
+    """Generate ``count`` seeded mazes in parallel and report throughput.
+
+    Maze ``n`` uses ``SEED + n``. Without a configured seed a random base
+    seed is drawn and printed, so the batch can be reproduced.
+
+    Args:
+        config: Validated maze configuration.
+        count: Number of mazes to produce.
+        out_dir: Output directory; defaults to the one of OUTPUT_FILE.
+        workers: Number of worker processes (default: CPU count).
+        check: Validation run on every maze before it is written.
+
+    Returns:
+        Throughput in mazes per second per core in use, that is per
+        worker, but at most one worker per CPU.
+    """
+    out_dir = out_dir or os.path.dirname(config.output_file) or "."
+    workers = workers or os.cpu_count() or 1
+    base = config.seed
+    if base is None:
+        base = random.randrange(2 ** 31)
+        print(f"Base seed: {base}")
+    jobs = [(config, base + n) for n in range(count)]
+    start = time.perf_counter()
+    for result in generate_bulk(jobs, out_dir, workers, check):
+        print(
+            f"{result.path}: seed={result.seed} "
+            f"solution={result.solution_length} "
+            f"({result.seconds:.3f}s)"
+        )
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    cores = min(workers, os.cpu_count() or 1)
+    print(
+        f"{count} mazes in {elapsed:.2f}s with {workers} workers: "
+        f"{rate:.1f} mazes/s, {rate / cores:.1f} mazes/s per core"
+    )
+    return rate / cores
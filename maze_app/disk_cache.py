@@ -0,0 +1,259 @@
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.binary_maze import (
+    BINARY_SUFFIX, load_binary_maze, write_binary,
+)
+
+# Cache entries are binary maze files followed by this trailer: magic,
+# nodes expanded by the solver and seconds the maze took to build.
+# ``load_binary_maze`` ignores bytes after the solution.
+_TRAILER = struct.Struct("<4sQd")
+_TRAILER_MAGIC = b"AMZC"
+# Bumped whenever the algorithms change the maze of a seed, so older
+# entries stop matching.
+KEY_VERSION = 1
+_STATS_FILE = "stats.json"
+_STATS = ("hits", "misses", "stores", "evictions", "bytes_saved")
+
+
+class MazeCache:
+    """Persistent cache of seeded mazes and their solutions.
+
+    A seeded maze only depends on its configuration, so it is stored
+    under a hash of the normalized settings: size, entry, exit,
+    perfect, loop density, longest path, algorithm, solver and seed.
+    With ``longest_path`` the entry and exit come from the maze, so
+    the configured ones are hashed and the placed ones restored on a
+    hit. Entries are binary maze files, spread over 256 subdirectories
+    by the first byte of the hash. A hit maps the file and hands its
+    cells to the generator, with the stored solution, so neither
+    ``generate`` nor the solver runs.
+
+    Entries are touched on every hit. When the directory grows past
+    ``max_bytes`` the least recently used ones are deleted. Counters
+    are kept in ``stats.json`` across runs; ``bytes_saved`` counts the
+    bytes of the entries served, and ``seconds_saved`` the time their
+    first build took.
+    """
+    def __init__(self, directory: str, max_bytes: int = 256 << 20):
+        """Use ``directory``, created if needed, as the cache."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.stats = self._read_stats()
+
+    @staticmethod
+    def key(generator: MazeGenerator) -> Optional[str]:
+        """Hash the settings the maze depends on; None without a seed."""
+        if generator.seed is None:
+            return None
+        entry, exit_ = (
+            generator.configured_ends if generator.longest_path
+            else (generator.entry, generator.exit)
+        )
+        settings = {
+            "version": KEY_VERSION,
+            "height": generator.height,
+            "width": generator.width,
+            "entry": list(entry),
+            "exit": list(exit_),
+            "perfect": generator.perfect,
+            "loop_density": generator.loop_density,
+            "longest_path": generator.longest_path,
+            "algorithm": generator.algorithm,
+            "solver": generator.solver,
+            "seed": generator.seed,
+        }
+        text = json.dumps(settings, sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """Return the file of the entry ``key``."""
+        return os.path.join(self.directory, key[:2], key + BINARY_SUFFIX)
+
+    def fetch(self, generator: MazeGenerator) -> bool:
+        """Load the cached maze of ``generator``'s settings, if any.
+
+        On a hit the generator's cells become a copy-on-write mapping
+        of the entry and its solution cache holds the stored path.
+
+        Returns:
+            True on a hit.
+        """
+        key = self.key(generator)
+        if key is None:
+            return False
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                f.seek(-_TRAILER.size, os.SEEK_END)
+                magic, nodes, seconds = _TRAILER.unpack(f.read())
+            if magic != _TRAILER_MAGIC:
+                raise ValueError(f"{path}: missing cache trailer")
+            loaded, way = load_binary_maze(path)
+        except (OSError, ValueError):
+            self._count(misses=1)
+            return False
+        ends = (loaded.entry, loaded.exit)
+        same_size = (loaded.height, loaded.width) == (
+            generator.height, generator.width
+        )
+        same_ends = generator.longest_path or ends == (
+            generator.entry, generator.exit
+        )
+        if not (same_size and same_ends):
+            self._count(misses=1)
+            return False
+        # ``adopt`` reserves the '42' cells around the entry and exit,
+        # so it needs the ends generation started from.
+        if generator.longest_path:
+            generator.entry, generator.exit = generator.configured_ends
+        generator.adopt(loaded.cells)
+        generator.entry, generator.exit = ends
+        path_cells = generator.way_cells(way) if way else None
+        generator.remember_solution(path_cells, nodes)
+        size = os.path.getsize(path)
+        os.utime(path)
+        self._count(hits=1, bytes_saved=size, seconds_saved=seconds)
+        return True
+
+    def store(self, generator: MazeGenerator, seconds: float = 0.0) -> None:
+        """Save the maze of ``generator`` and its solution.
+
+        The current solver's solution is taken from the generator, so
+        store right after solving. The entry is written to a temporary
+        file and renamed, so readers never see a partial entry; if the
+        write fails, or the maze does not fit the binary format (a seed
+        beyond 64 bits), the maze is simply not cached.
+
+        Args:
+            generator: Generator holding a freshly generated maze.
+            seconds: Time it took to generate and solve, for the stats.
+        """
+        key = self.key(generator)
+        if key is None:
+            return
+        path = self.path(key)
+        way = generator.get_solution()
+        way = way if isinstance(way, str) else ""
+        tmp = ""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                write_binary(f, generator, way)
+                f.write(_TRAILER.pack(
+                    _TRAILER_MAGIC, generator.nodes_expanded, seconds
+                ))
+            os.replace(tmp, path)
+        except (OSError, ValueError):
+            if tmp and os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+        self._count(stores=1)
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """List ``(last use, size, path)`` of every entry, oldest first."""
+        found = []
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(BINARY_SUFFIX):
+                    st = entry.stat()
+                    found.append((st.st_mtime, st.st_size, entry.path))
+        return sorted(found)
+
+    def evict(self) -> int:
+        """Delete the least recently used entries beyond ``max_bytes``.
+
+        Returns:
+            The number of entries deleted.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        if removed:
+            self._count(evictions=removed)
+        return removed
+
+    def report(self) -> Dict[str, float]:
+        """Return the counters with the hit rate and current size."""
+        entries = self.entries()
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def _read_stats(self) -> Dict[str, float]:
+        """Load the counters kept in the cache directory."""
+        stats: Dict[str, float] = dict.fromkeys(_STATS, 0)
+        stats["seconds_saved"] = 0.0
+        try:
+            with open(os.path.join(self.directory, _STATS_FILE)) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return stats
+        for name in stats:
+            if isinstance(saved.get(name), (int, float)):
+                stats[name] = saved[name]
+        return stats
+
+    def _count(self, **deltas: float) -> None:
+        """Add to the counters and save them."""
+        for name, delta in deltas.items():
+            self.stats[name] += delta
+        try:
+            with open(os.path.join(self.directory, _STATS_FILE), "w") as f:
+                json.dump(self.stats, f)
+        except OSError:
+            pass
+
+
+def main() -> None:
+    """Show the statistics of a maze cache, or empty it."""
+    parser = argparse.ArgumentParser(
+        description="Show the statistics of a maze cache directory."
+    )
+    parser.add_argument("directory", help="cache directory")
+    parser.add_argument("--clear", action="store_true",
+                        help="delete every entry and reset the counters")
+    args = parser.parse_args()
+    if not os.path.isdir(args.directory):
+        sys.stderr.write(f"Error: {args.directory} is not a directory\n")
+        sys.exit(1)
+    cache = MazeCache(args.directory)
+    if args.clear:
+        cache.max_bytes = 0
+        cache.evict()
+        try:
+            os.remove(os.path.join(args.directory, _STATS_FILE))
+        except FileNotFoundError:
+            pass
+        cache = MazeCache(args.directory)
+    print(json.dumps(cache.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+import heapq
+import itertools
 import random
+from array import array
 from enum import IntEnum
-from typing import List, Tuple, Set, Optional, Dict, Union
+from typing import (
+    Callable, Iterable, Iterator, List, Tuple, Set, Optional, Dict, Sized,
+    Union, overload,
+)
 
 
 class Wall(IntEnum):
@@ -11,6 +17,278 @@ class Wall(IntEnum):
     WEST = 8
 
 
+# The walls, and the mask that clears each of them, indexed in ``Wall``
+# order (NORTH, EAST, SOUTH, WEST); ``k ^ 2`` is the opposite direction.
+_CARVE = tuple(15 & ~d for d in Wall)
+_WALLS = tuple(Wall)
+
+# Events sent to ``MazeGenerator.trace`` while an algorithm runs, packed
+# as ``cell << 3 | kind``. Kinds 0-3 open the wall of ``cell`` in that
+# direction (``Wall`` order); ``EVENT_VISIT`` is a cell a solver expands.
+EVENT_VISIT = 4
+
+# Per wall bit, 1 for the masks where that wall is closed and is not the
+# last closed wall of the cell; used by the loop injection passes.
+_REMOVABLE = {
+    d: bytes(1 if v & d and v & 15 != d else 0 for v in range(256))
+    for d in Wall
+}
+_UNRESERVED = bytes([1]) + bytes(255)
+
+
+GeneratorFunc = Callable[["MazeGenerator"], None]
+
+# Generation algorithms by name. Each one carves ``cells`` in place and
+# must leave the cells flagged in ``pattern42`` untouched.
+ALGORITHMS: Dict[str, GeneratorFunc] = {}
+
+
+def register_algorithm(
+    name: str,
+) -> Callable[[GeneratorFunc], GeneratorFunc]:
+    """Register a generation algorithm under ``name``.
+
+    The decorated callable receives the ``MazeGenerator`` after its cells
+    have been reset and the '42' pattern reserved, and must draw from its
+    ``rng`` rather than the ``random`` module; it becomes selectable
+    through ``MazeGenerator.algorithm`` and ``ALGORITHM=`` in the config.
+    """
+    def decorator(func: GeneratorFunc) -> GeneratorFunc:
+        ALGORITHMS[name] = func
+        return func
+    return decorator
+
+
+SolverFunc = Callable[["MazeGenerator"], Optional[List[int]]]
+
+# Solvers by name. Each one returns the path from entry to exit as flat
+# cell indices (or None) and records how many cells it expanded in
+# ``nodes_expanded``.
+SOLVERS: Dict[str, SolverFunc] = {}
+
+
+def register_solver(name: str) -> Callable[[SolverFunc], SolverFunc]:
+    """Register a solver under ``name``.
+
+    The decorated callable becomes selectable through
+    ``MazeGenerator.solver`` and ``SOLVER=`` in the config.
+    """
+    def decorator(func: SolverFunc) -> SolverFunc:
+        SOLVERS[name] = func
+        return func
+    return decorator
+
+
+def _find(parent: "array[int]", x: int) -> int:
+    """Return the union-find root of ``x``, halving the path on the way."""
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+# Nibble tables of ``PackedCells``: cell ``2k`` is the low nibble of byte
+# ``k`` and cell ``2k + 1`` the high one.
+_LOW_NIBBLE = bytes(b & 15 for b in range(256))
+_HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+
+
+class PackedCells:
+    """Cell buffer holding two wall masks per byte.
+
+    It wraps any writable buffer, typically a copy-on-write ``mmap`` of
+    a binary maze file, without copying it: ``cells[i]`` reads and
+    writes the nibble of cell ``i`` and ``cells[a:b]`` unpacks a run of
+    cells into ``bytes`` with two ``bytes.translate`` calls. Solvers and
+    the renderer only use those operations, so a loaded maze is usable
+    as soon as its header is read.
+    """
+    def __init__(self, buffer: Union[bytearray, memoryview], size: int):
+        """Wrap ``buffer``, which holds at least ``size`` packed cells."""
+        self._buffer = memoryview(buffer)
+        if len(self._buffer) < (size + 1) // 2:
+            raise ValueError("packed cell buffer is too short")
+        self._size = size
+
+    @classmethod
+    def pack(cls, cells: Union[bytes, bytearray]) -> "PackedCells":
+        """Pack one-byte-per-cell masks into a new buffer."""
+        data = bytes(cells) + b"\x00" * (len(cells) & 1)
+        packed = int.from_bytes(data[0::2], "big") + (
+            int.from_bytes(data[1::2], "big") << 4
+        )
+        buffer = bytearray(packed.to_bytes(len(data) // 2, "big"))
+        return cls(buffer, len(cells))
+
+    @property
+    def buffer(self) -> memoryview:
+        """The packed bytes, ``(len(self) + 1) // 2`` of them."""
+        return self._buffer[:(self._size + 1) // 2]
+
+    def __len__(self) -> int:
+        """Return the number of cells."""
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> bytes: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, bytes]:
+        """Return the mask of one cell, or the masks of a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return bytes(self[i] for i in range(start, stop, step))
+            if stop <= start:
+                return b""
+            chunk = self._buffer[start >> 1:(stop + 1) >> 1].tobytes()
+            out = bytearray(2 * len(chunk))
+            out[0::2] = chunk.translate(_LOW_NIBBLE)
+            out[1::2] = chunk.translate(_HIGH_NIBBLE)
+            skip = start & 1
+            return bytes(out[skip:skip + stop - start])
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("cell index out of range")
+        byte = self._buffer[index >> 1]
+        return byte >> 4 if index & 1 else byte & 15
+
+    @overload
+    def __setitem__(self, index: int, value: int) -> None: ...
+
+    @overload
+    def __setitem__(
+        self, index: slice, value: Union[bytes, bytearray]
+    ) -> None: ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[int, bytes, bytearray]
+    ) -> None:
+        """Set the mask of one cell, or of each cell in a slice."""
+        if isinstance(index, slice):
+            if isinstance(value, int):
+                raise TypeError("can only assign bytes to a slice")
+            for i, v in zip(range(*index.indices(self._size)), value):
+                self[i] = v
+            return
+        if isinstance(value, (bytes, bytearray)):
+            raise TypeError("can only assign an int to a cell")
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("cell index out of range")
+        j = index >> 1
+        byte = self._buffer[j]
+        if index & 1:
+            self._buffer[j] = (byte & 15) | (value << 4)
+        else:
+            self._buffer[j] = (byte & 240) | value
+
+    def unpack(self) -> bytearray:
+        """Return the masks as a plain one-byte-per-cell buffer."""
+        return bytearray(self[0:self._size])
+
+
+# Storage of ``MazeGenerator.cells``.
+CellBuffer = Union[bytearray, PackedCells]
+
+
+class GridView:
+    """List-of-lists view over a flat, row-major cell buffer.
+
+    Over a ``bytearray`` each row is a ``memoryview`` slice, so
+    ``view[f][c]`` reads and writes the buffer without copying. Over
+    ``PackedCells`` each row is an unpacked, read-only ``bytes`` copy.
+    """
+    def __init__(self, cells: CellBuffer, width: int):
+        """Wrap ``cells`` as rows of ``width`` cells."""
+        self._cells: Union[memoryview, PackedCells] = (
+            cells if isinstance(cells, PackedCells) else memoryview(cells)
+        )
+        self.width = width
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._cells) // self.width if self.width else 0
+
+    def __getitem__(self, row: int) -> Union[memoryview, bytes]:
+        """Return a view of a single row."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("grid row out of range")
+        start = row * self.width
+        return self._cells[start:start + self.width]
+
+    def __iter__(self) -> Iterator[Union[memoryview, bytes]]:
+        """Iterate over the rows of the grid."""
+        for row in range(len(self)):
+            yield self[row]
+
+
+class DistanceField:
+    """Breadth-first distances from one cell to every cell of a maze.
+
+    Built by ``MazeGenerator.distance_field`` in a single pass over the
+    flat grid. All tables are ``array('i')`` indexed by ``row * width +
+    col``, so they expose the buffer protocol and can be wrapped by
+    ``numpy.frombuffer(field.dist, dtype=numpy.int32)`` without a copy.
+
+    Attributes:
+        source (int): Flat index of the starting cell.
+        width (int): Row length of the maze.
+        version (int): Grid ``version`` the field was computed for.
+        dist (array): Steps from ``source``; -1 for unreachable cells.
+        parent (array): Previous cell on a shortest path from
+            ``source``; -1 for ``source`` and unreachable cells.
+        order (array): Reached cells in visiting order, so distances
+            never decrease along it.
+    """
+    def __init__(
+        self,
+        source: int,
+        width: int,
+        version: int,
+        dist: "array[int]",
+        parent: "array[int]",
+        order: "array[int]",
+    ):
+        """Store the tables of a finished traversal."""
+        self.source = source
+        self.width = width
+        self.version = version
+        self.dist = dist
+        self.parent = parent
+        self.order = order
+
+    def farthest(self) -> int:
+        """Return a reachable cell at the largest distance from source."""
+        return self.order[-1]
+
+    def path(self, target: int) -> Optional[List[int]]:
+        """Return a shortest path from ``source`` to ``target``.
+
+        Walks the parent table, so it costs the length of the path.
+        Returns None when ``target`` is unreachable.
+        """
+        n = self.dist[target]
+        if n < 0:
+            return None
+        parent = self.parent
+        path = [0] * (n + 1)
+        for k in range(n, -1, -1):
+            path[k] = target
+            target = parent[target]
+        return path
+
+    def paths(self, targets: Iterable[int]) -> List[Optional[List[int]]]:
+        """Return the shortest path to each of ``targets``, in order."""
+        return [self.path(target) for target in targets]
+
+
 class MazeGenerator:
     """Generates and solves mazes using various algorithms.
 
@@ -18,7 +296,25 @@ class MazeGenerator:
         height, width (int): Maze dimensions.
         entry, exit (tuple): Start and end points.
         perfect (bool): If True, no loops exist.
-        grid (List[List[int]]): 2D list storing wall states.
+        rng (random.Random): Random source used by the algorithms.
+        check (callable): Optional validation run after ``generate``.
+        loop_density (float): Wall removal rate of imperfect mazes.
+        longest_path (bool): If True, ``generate`` moves the entry and
+            exit to the two ends of the maze's ``diameter``.
+        configured_ends (tuple): Entry and exit given to the constructor;
+            with ``longest_path`` each generation restarts from them.
+        trace (callable): Optional sink for the events of the 'dfs' and
+            'prim' algorithms and the 'dfs' and 'bfs' solvers.
+        frontier (list): Open set of the running 'dfs' or 'prim'
+            algorithm, for trace sinks to sample.
+        nodes_expanded (int): Cells expanded by the last solver run.
+        version (int): Mutation counter of the grid, bumped by
+            ``generate``, ``_connect_cells`` and ``grid`` assignment.
+        cells (bytearray | PackedCells): Wall masks indexed by
+            ``row * width + col``; one byte per cell, or two per byte
+            for a maze loaded from a binary file.
+        pattern42 (bytearray): Membership map of the '42' pattern cells.
+        grid (GridView): List-of-lists view over ``cells``.
     """
     def __init__(
         self,
@@ -30,8 +326,23 @@ class MazeGenerator:
         seed: Optional[int] = None,
         algorithm: Optional[str] = "prim",
         solver: Optional[str] = "bfs",
+        rng: Optional[random.Random] = None,
+        check: Optional[Callable[["MazeGenerator"], None]] = None,
+        loop_density: Optional[float] = None,
+        longest_path: bool = False,
     ):
-        """Initialize maze parameters and configuration."""
+        """Initialize maze parameters and configuration.
+
+        ``rng`` is the random source of every algorithm; it is reseeded
+        with ``seed`` on each ``generate``. Giving each generator its own
+        instance keeps seeded runs independent of any other generator.
+        ``check`` is called with the generator after every ``generate``
+        and may raise to reject the maze. ``loop_density`` is the share
+        of interior walls removed from imperfect mazes; without it the
+        area-based ``calculate_chance`` table is used on east walls.
+        With ``longest_path`` the given entry and exit are replaced by
+        the ends of the longest path of each generated maze.
+        """
         self.height = height
         self.width = width
         self.entry = entry
@@ -40,161 +351,865 @@ class MazeGenerator:
         self.seed = seed
         self.algorithm = algorithm
         self.solver = solver
-        self.grid: List[List[int]] = []
-        self.pattern42_coords: Set[Tuple[int, int]] = set()
+        self.rng = rng if rng is not None else random.Random()
+        self.check = check
+        self.loop_density = loop_density
+        self.longest_path = longest_path
+        self.configured_ends = (entry, exit_)
+        self.trace: Optional[Callable[[int], None]] = None
+        self.frontier: Sized = ()
+        self.nodes_expanded = 0
+        self.version = 0
+        self._solutions: Dict[str, Tuple[int, Optional[List[int]], int]] = {}
+        self._field: Optional[DistanceField] = None
+        self.cells: CellBuffer = bytearray()
+        self.pattern42 = bytearray()
+        self._pattern42_cells: List[int] = []
+
+    @property
+    def grid(self) -> GridView:
+        """Row view over the flat cell buffer."""
+        return GridView(self.cells, self.width)
+
+    @grid.setter
+    def grid(self, rows: List[List[int]]) -> None:
+        """Replace the cell buffer with the contents of ``rows``."""
+        cells = bytearray()
+        for row in rows:
+            cells.extend(row)
+        self.cells = cells
+        self.pattern42 = bytearray(len(cells))
+        self._pattern42_cells = []
+        self._touch()
+
+    def adopt(self, cells: CellBuffer) -> None:
+        """Uses ``cells`` as the grid of a maze generated elsewhere.
+
+        The buffer is not copied. The '42' cells are placed where
+        ``generate`` puts them for these dimensions.
+        """
+        if len(cells) != self.height * self.width:
+            raise ValueError("cell buffer does not match the dimensions")
+        self.cells = cells
+        self.pattern42 = bytearray(len(cells))
+        self._pattern42_cells = []
+        if self.width >= 15 and self.height >= 15:
+            self._write_42()
+        self._touch()
+
+    def _touch(self) -> None:
+        """Records a grid mutation, which invalidates cached solutions.
+
+        Writes made directly to ``cells`` or through ``grid`` rows are
+        not seen; call this after changing the buffer by hand.
+        """
+        self.version += 1
+        self._solutions.clear()
+        self._field = None
+
+    @property
+    def pattern42_coords(self) -> Set[Tuple[int, int]]:
+        """Coordinates of the cells reserved by the '42' pattern."""
+        return {divmod(i, self.width) for i in self._pattern42_cells}
 
-    def generate(self) -> List[List[int]]:
+    def generate(self) -> GridView:
         """Orchestrates maze generation based on the selected algorithm."""
         if self.seed is not None:
-            random.seed(self.seed)
-        self.grid = [
-            [15 for _ in range(self.width)] for _ in range(self.height)
-        ]
-        if self.algorithm == "prim":
-            self._generate_prim()
-        elif self.algorithm == "dfs":
-            self._generate_dfs()
+            self.rng.seed(self.seed)
+        if self.longest_path:
+            self.entry, self.exit = self.configured_ends
+        algorithm = ALGORITHMS.get(self.algorithm or "")
+        if algorithm is None:
+            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        size = self.height * self.width
+        self.cells = bytearray(b"\x0f") * size
+        self.pattern42 = bytearray(size)
+        self._pattern42_cells = []
+        if self.width >= 15 and self.height >= 15:
+            self._write_42()
+        algorithm(self)
+        self._touch()
+        if self.perfect is False:
+            if self.loop_density is None:
+                self._apply_imperfect_logic(self.calculate_chance())
+            else:
+                self._apply_imperfect_logic(self.loop_density, south=True)
+        if self.longest_path:
+            path = self.diameter()
+            if len(path) > 1:
+                self.entry = divmod(path[0], self.width)
+                self.exit = divmod(path[-1], self.width)
+        if self.check is not None:
+            self.check(self)
         return self.grid
 
-    def _generate_dfs(self) -> List[List[int]]:
-        """Creates a maze path using Depth-First Search (Backtracking)."""
-        self.pattern42_coords = set()
-        visited: Set[Tuple[int, int]] = set()
-        if self.width >= 15 and self.height >= 15:
-            self._write_42(visited)
+    @register_algorithm("dfs")
+    def _generate_dfs(self) -> None:
+        """Creates a maze path using Depth-First Search (Backtracking).
+
+        Neighbours are found through flat-index offsets and collected
+        into a reusable scratch buffer, so no step allocates. Candidates
+        are gathered in ``Wall`` order and drawn with one ``randrange``
+        call, exactly like the former ``random.choice`` over a fresh
+        list, so a given seed still produces the same maze.
+        """
+        h, w = self.height, self.width
+        size = h * w
+        cells = self.cells
+        visited = bytearray(self.pattern42)
         start_f, start_c = self.entry
-        pila: List[Tuple[int, int]] = [(start_f, start_c)]
-        visited.add((start_f, start_c))
+        start = start_f * w + start_c
+        visited[start] = 1
+        offsets = (-w, 1, w, -1)
+        scratch = [0, 0, 0, 0]
+        randrange = self.rng.randrange
+        trace = self.trace
+        pila: List[int] = [start]
+        self.frontier = pila
+        push = pila.append
         while pila:
-            f, c = pila[-1]
-            unvisted_neighbors = []
-            for direction in list(Wall):
-                nf, nc = self._get_neighbor_coords(f, c, direction)
-                if (
-                    0 <= nf < self.height
-                    and 0 <= nc < self.width
-                    and (nf, nc) not in visited
-                ):
-                    unvisted_neighbors.append((nf, nc, direction))
-            if unvisted_neighbors:
-                nf, nc, direction = random.choice(unvisted_neighbors)
-                self._connect_cells(f, c, direction)
-                visited.add((nf, nc))
-                pila.append((nf, nc))
+            i = pila[-1]
+            c = i % w
+            n = 0
+            if i >= w and not visited[i - w]:
+                scratch[0] = 0
+                n = 1
+            if c + 1 < w and not visited[i + 1]:
+                scratch[n] = 1
+                n += 1
+            if i + w < size and not visited[i + w]:
+                scratch[n] = 2
+                n += 1
+            if c and not visited[i - 1]:
+                scratch[n] = 3
+                n += 1
+            if n:
+                k = scratch[randrange(n)]
+                j = i + offsets[k]
+                cells[i] &= _CARVE[k]
+                cells[j] &= _CARVE[k ^ 2]
+                visited[j] = 1
+                push(j)
+                if trace is not None:
+                    trace(i << 3 | k)
             else:
                 pila.pop()
-        if self.perfect is False:
-            self._apply_imperfect_logic(self.calculate_chance())
-        return self.grid
 
-    def _generate_prim(self) -> List[List[int]]:
-        """Creates a maze path using a randomized Prim's algorithm."""
-        self.pattern42_coords = set()
-        visited: Set[Tuple[int, int]] = set()
-        if self.width >= 15 and self.height >= 15:
-            self._write_42(visited)
+    @register_algorithm("prim")
+    def _generate_prim(self) -> None:
+        """Creates a maze path using a randomized Prim's algorithm.
+
+        The frontier only holds edges that lead to an in-bounds,
+        unvisited cell, encoded as ``cell * 4 + direction``. A random
+        edge is removed by swapping it with the last one, so every step
+        is O(1) and the same seed always yields the same maze.
+        """
+        h, w = self.height, self.width
+        size = h * w
+        cells = self.cells
+        visited = bytearray(self.pattern42)
         start_f, start_c = self.entry
-        visited.add((start_f, start_c))
-        walls: List[Tuple[int, int, Wall]] = [
-            (start_f, start_c, d) for d in Wall
-        ]
-        while walls:
-            idx = random.randrange(len(walls))
-            f, c, direction = walls.pop(idx)
-            nf, nc = self._get_neighbor_coords(f, c, direction)
-            if (
-                0 <= nf < self.height
-                and 0 <= nc < self.width
-                and (nf, nc) not in visited
-                and (nf, nc) not in self.pattern42_coords
-            ):
-                self._connect_cells(f, c, direction)
-                visited.add((nf, nc))
-                for d in Wall:
-                    walls.append((nf, nc, d))
-        if self.perfect is False:
-            self._apply_imperfect_logic(self.calculate_chance())
-        return self.grid
+        start = start_f * w + start_c
+        visited[start] = 1
+        offsets = (-w, 1, w, -1)
+        walls: List[int] = []
+        self.frontier = walls
+        push = walls.append
+        randrange = self.rng.randrange
+        trace = self.trace
+        i = start
+        while True:
+            c = i % w
+            if i >= w and not visited[i - w]:
+                push(i << 2)
+            if c + 1 < w and not visited[i + 1]:
+                push(i << 2 | 1)
+            if i + w < size and not visited[i + w]:
+                push(i << 2 | 2)
+            if c and not visited[i - 1]:
+                push(i << 2 | 3)
+            while walls:
+                idx = randrange(len(walls))
+                edge = walls[idx]
+                walls[idx] = walls[-1]
+                walls.pop()
+                k = edge & 3
+                src = edge >> 2
+                i = src + offsets[k]
+                if not visited[i]:
+                    break
+            else:
+                break
+            cells[src] &= _CARVE[k]
+            cells[i] &= _CARVE[k ^ 2]
+            visited[i] = 1
+            if trace is not None:
+                trace(src << 3 | k)
+
+    @register_algorithm("kruskal")
+    def _generate_kruskal(self) -> None:
+        """Creates a maze with randomized Kruskal's and a union-find.
+
+        Every east and south edge between two free cells is shuffled
+        once, then carved when it joins two different sets.
+        """
+        h, w = self.height, self.width
+        size = h * w
+        cells, blocked = self.cells, self.pattern42
+        edges = array("q")
+        for i in range(size):
+            if blocked[i]:
+                continue
+            if (i + 1) % w and not blocked[i + 1]:
+                edges.append(i << 1)
+            if i + w < size and not blocked[i + w]:
+                edges.append(i << 1 | 1)
+        self.rng.shuffle(edges)
+        parent = array("i", range(size))
+        for edge in edges:
+            i = edge >> 1
+            if edge & 1:
+                j, k = i + w, 2
+            else:
+                j, k = i + 1, 1
+            ri, rj = _find(parent, i), _find(parent, j)
+            if ri != rj:
+                parent[ri] = rj
+                cells[i] &= _CARVE[k]
+                cells[j] &= _CARVE[k ^ 2]
+
+    @register_algorithm("wilson")
+    def _generate_wilson(self) -> None:
+        """Creates an unbiased maze with Wilson's loop-erased random walks.
+
+        Starting from the entry, each free cell outside the tree walks
+        randomly until it hits the tree. Only the last direction taken
+        from each cell is kept, which erases loops, and the walk is then
+        carved into the tree.
+        """
+        h, w = self.height, self.width
+        size = h * w
+        cells, blocked = self.cells, self.pattern42
+        offsets = (-w, 1, w, -1)
+        in_tree = bytearray(size)
+        heading = bytearray(size)
+        scratch = [0, 0, 0, 0]
+        randrange = self.rng.randrange
+        entry_f, entry_c = self.entry
+        in_tree[entry_f * w + entry_c] = 1
+        for start in range(size):
+            if in_tree[start] or blocked[start]:
+                continue
+            i = start
+            while not in_tree[i]:
+                c = i % w
+                n = 0
+                if i >= w and not blocked[i - w]:
+                    scratch[0] = 0
+                    n = 1
+                if c + 1 < w and not blocked[i + 1]:
+                    scratch[n] = 1
+                    n += 1
+                if i + w < size and not blocked[i + w]:
+                    scratch[n] = 2
+                    n += 1
+                if c and not blocked[i - 1]:
+                    scratch[n] = 3
+                    n += 1
+                if not n:
+                    break
+                k = scratch[randrange(n)]
+                heading[i] = k
+                i += offsets[k]
+            else:
+                i = start
+                while not in_tree[i]:
+                    k = heading[i]
+                    j = i + offsets[k]
+                    cells[i] &= _CARVE[k]
+                    cells[j] &= _CARVE[k ^ 2]
+                    in_tree[i] = 1
+                    i = j
+
+    def stream_rows(self) -> Iterator[bytearray]:
+        """Returns the rows of an Eller's maze without building ``cells``.
+
+        The '42' pattern is kept as a handful of coordinates instead of
+        a full-size map, so the whole run holds O(width) state and can
+        produce mazes far larger than memory. The rows form a perfect
+        maze; ``perfect`` and ``algorithm`` are not consulted.
+        """
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        self.cells = bytearray()
+        self.pattern42 = bytearray()
+        self._pattern42_cells = []
+        if self.width >= 15 and self.height >= 15:
+            self._pattern42_cells = [
+                f * self.width + c for f, c in self._locate_42()
+            ]
+        return self.iter_eller_rows(self._pattern42_by_row())
+
+    @register_algorithm("eller")
+    def _generate_eller(self) -> None:
+        """Creates a maze with Eller's algorithm, one row at a time."""
+        w = self.width
+        blocked = self._pattern42_by_row()
+        for f, row in enumerate(self.iter_eller_rows(blocked)):
+            self.cells[f * w:(f + 1) * w] = row
+
+    def iter_eller_rows(
+        self, blocked: Optional[Dict[int, Set[int]]] = None
+    ) -> Iterator[bytearray]:
+        """Yields the rows of an Eller's maze, top to bottom.
+
+        Only the current row, its set labels and the set members are
+        kept, so memory is O(width) whatever the height. ``blocked``
+        maps a row to the columns that must stay closed (the '42'
+        pattern); a set that cannot reach the next row is merged with a
+        neighbour first so that no region is cut off.
+
+        Args:
+            blocked: Reserved columns for each row.
+
+        Yields:
+            The finished wall masks of each row.
+        """
+        h, w = self.height, self.width
+        blocked = blocked or {}
+        no_cols: Set[int] = set()
+        sets = [0] * w
+        next_set = 1
+        north_open = [False] * w
+        for f in range(h):
+            row = bytearray(b"\x0f") * w
+            closed = blocked.get(f, no_cols)
+            below = blocked.get(f + 1, no_cols)
+            members: Dict[int, List[int]] = {}
+            for c in range(w):
+                if c in closed:
+                    sets[c] = 0
+                    continue
+                if north_open[c]:
+                    row[c] &= _CARVE[0]
+                else:
+                    sets[c] = next_set
+                    next_set += 1
+                members.setdefault(sets[c], []).append(c)
+
+            def join(c: int) -> None:
+                """Carve east of ``c`` and merge the two sets."""
+                row[c] &= _CARVE[1]
+                row[c + 1] &= _CARVE[3]
+                keep, drop = sets[c], sets[c + 1]
+                if len(members[keep]) < len(members[drop]):
+                    keep, drop = drop, keep
+                moved = members.pop(drop)
+                for m in moved:
+                    sets[m] = keep
+                members[keep].extend(moved)
+
+            last = f == h - 1
+            for c in range(w - 1):
+                if (
+                    sets[c] and sets[c + 1] and sets[c] != sets[c + 1]
+                    and (last or self.rng.random() < 0.5)
+                ):
+                    join(c)
+            if last:
+                yield row
+                return
+            stranded = True
+            while stranded:
+                stranded = False
+                for label in list(members):
+                    cols = members.get(label)
+                    if not cols or any(c not in below for c in cols):
+                        continue
+                    for c in cols:
+                        if c + 1 < w and sets[c + 1] not in (0, label):
+                            join(c)
+                            stranded = True
+                            break
+                        if c and sets[c - 1] not in (0, label):
+                            join(c - 1)
+                            stranded = True
+                            break
+            north_open = [False] * w
+            for cols in members.values():
+                down = [c for c in cols if c not in below]
+                if not down:
+                    continue
+                self.rng.shuffle(down)
+                for n, c in enumerate(down):
+                    if n == 0 or self.rng.random() < 0.5:
+                        row[c] &= _CARVE[2]
+                        north_open[c] = True
+            yield row
+
+    @register_algorithm("binary_tree")
+    def _generate_binary_tree(self) -> None:
+        """Creates a maze by carving north or east from every cell."""
+        h, w = self.height, self.width
+        cells, blocked = self.cells, self.pattern42
+        rand = self.rng.random
+        for i in range(h * w):
+            if blocked[i]:
+                continue
+            north = i >= w and not blocked[i - w]
+            east = (i + 1) % w != 0 and not blocked[i + 1]
+            if north and (not east or rand() < 0.5):
+                cells[i] &= _CARVE[0]
+                cells[i - w] &= _CARVE[2]
+            elif east:
+                cells[i] &= _CARVE[1]
+                cells[i + 1] &= _CARVE[3]
+        if self._pattern42_cells:
+            self._join_regions()
+
+    @register_algorithm("sidewinder")
+    def _generate_sidewinder(self) -> None:
+        """Creates a maze with Sidewinder: east runs closed by one north."""
+        h, w = self.height, self.width
+        cells, blocked = self.cells, self.pattern42
+        rand = self.rng.random
+        randrange = self.rng.randrange
+        for f in range(h):
+            base = f * w
+            run: List[int] = []
+            for c in range(w):
+                i = base + c
+                if blocked[i]:
+                    run = []
+                    continue
+                run.append(i)
+                east = c + 1 < w and not blocked[i + 1]
+                if f and (not east or rand() < 0.5):
+                    up = [j for j in run if not blocked[j - w]]
+                    if up:
+                        j = up[randrange(len(up))]
+                        cells[j] &= _CARVE[0]
+                        cells[j - w] &= _CARVE[2]
+                    run = []
+                elif east:
+                    cells[i] &= _CARVE[1]
+                    cells[i + 1] &= _CARVE[3]
+        if self._pattern42_cells:
+            self._join_regions()
+
+    def _join_regions(self) -> None:
+        """Links disconnected regions so every free cell is reachable.
+
+        Algorithms that only carve north/east can strand cells next to
+        the '42' pattern. Regions are labelled with a union-find over
+        the open passages, then the first wall found between two
+        different regions is carved, which keeps a perfect maze perfect.
+        """
+        h, w = self.height, self.width
+        size = h * w
+        cells, blocked = self.cells, self.pattern42
+        parent = array("i", range(size))
+        for i in range(size):
+            if not cells[i] & Wall.EAST:
+                parent[_find(parent, i)] = _find(parent, i + 1)
+            if not cells[i] & Wall.SOUTH:
+                parent[_find(parent, i)] = _find(parent, i + w)
+        for i in range(size):
+            if blocked[i]:
+                continue
+            if (i + 1) % w and not blocked[i + 1]:
+                ri, rj = _find(parent, i), _find(parent, i + 1)
+                if ri != rj:
+                    parent[ri] = rj
+                    cells[i] &= _CARVE[1]
+                    cells[i + 1] &= _CARVE[3]
+            if i + w < size and not blocked[i + w]:
+                ri, rj = _find(parent, i), _find(parent, i + w)
+                if ri != rj:
+                    parent[ri] = rj
+                    cells[i] &= _CARVE[2]
+                    cells[i + w] &= _CARVE[0]
 
     def get_solution(
         self, output_type: Optional[str] = "str"
     ) -> Union[List[Tuple[int, int]], str]:
         """
         Returns the solution path as a list of tuples or a direction string.
+
+        Solvers work on flat cell indices; only the ``"way"`` form is
+        converted to ``(row, col)`` tuples. Both forms come from one
+        cached solve per solver, kept until the grid ``version`` changes.
         """
-        path = self.bfs() if self.solver == "bfs" else self.dfs_solution()
+        path = self.solve_cells()
         if output_type == "way":
-            return path if path is not None else []
-        return self.print_coordinates(path) if path else ""
+            return self._to_coords(path) or []
+        return self._flat_directions(path) if path else ""
+
+    def solve_cells(self) -> Optional[List[int]]:
+        """Returns the flat-index solution of the current solver, cached.
+
+        The cache is keyed by solver name and grid ``version``; a hit
+        also restores the ``nodes_expanded`` count of the original run.
+        """
+        solver = self.solver or ""
+        cached = self._solutions.get(solver)
+        if cached is not None and cached[0] == self.version:
+            self.nodes_expanded = cached[2]
+            return cached[1]
+        solve = SOLVERS.get(solver)
+        if solve is None:
+            raise ValueError(f"Unknown solver: {self.solver}")
+        path = solve(self)
+        self._solutions[solver] = (self.version, path, self.nodes_expanded)
+        return path
+
+    def is_solved(self) -> bool:
+        """Tell whether ``solve_cells`` would return a cached solution."""
+        cached = self._solutions.get(self.solver or "")
+        return cached is not None and cached[0] == self.version
 
     def dfs_solution(self) -> Optional[List[Tuple[int, int]]]:
         """Finds a solution path using Depth-First Search."""
-        way = self.entry
-        objective = self.exit
-        stack: List[Tuple[int, int]] = [way]
-        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {way: None}
-        directions = [
-            (-1, 0, Wall.NORTH),
-            (0, 1, Wall.EAST),
-            (1, 0, Wall.SOUTH),
-            (0, -1, Wall.WEST),
-        ]
+        return self._to_coords(self._dfs())
+
+    def bfs(self) -> Optional[List[Tuple[int, int]]]:
+        """Finds the shortest solution path using Breadth-First Search."""
+        return self._to_coords(self._bfs())
+
+    def astar(self) -> Optional[List[Tuple[int, int]]]:
+        """Finds the shortest solution path using A* search."""
+        return self._to_coords(self._astar())
+
+    def bidirectional_bfs(self) -> Optional[List[Tuple[int, int]]]:
+        """Finds the shortest solution path with a bidirectional BFS."""
+        return self._to_coords(self._bidirectional())
+
+    @register_solver("dfs")
+    def _dfs(self) -> Optional[List[int]]:
+        """Depth-First Search over flat indices with an array parent table.
+
+        ``parent`` holds -2 for unseen cells and -1 for the entry.
+        """
+        w = self.width
+        size = self.height * w
+        cells = self.cells
+        start = self.entry[0] * w + self.entry[1]
+        goal = self.exit[0] * w + self.exit[1]
+        parent = array("i", [-2]) * size
+        parent[start] = -1
+        stack = array("i", [start])
+        pop, push = stack.pop, stack.append
+        trace = self.trace
+        expanded = 0
         while stack:
-            actual = stack.pop()
-            y, x = actual
-            if actual == objective:
-                return self.reconstruct_path(parent, objective)
-            for dy, dx, wall_type in directions:
-                ny, nx = y + dy, x + dx
-                if 0 <= ny < self.height and 0 <= nx < self.width:
-                    if not (self.grid[y][x] & wall_type.value):
-                        if (ny, nx) not in parent:
-                            parent[(ny, nx)] = actual
-                            stack.append((ny, nx))
+            i = pop()
+            expanded += 1
+            if trace is not None:
+                trace(i << 3 | EVENT_VISIT)
+            if i == goal:
+                self.nodes_expanded = expanded
+                return self.reconstruct_path(parent, goal)
+            walls = cells[i]
+            if not walls & 1 and parent[i - w] == -2:
+                parent[i - w] = i
+                push(i - w)
+            if not walls & 2 and parent[i + 1] == -2:
+                parent[i + 1] = i
+                push(i + 1)
+            if not walls & 4 and parent[i + w] == -2:
+                parent[i + w] = i
+                push(i + w)
+            if not walls & 8 and parent[i - 1] == -2:
+                parent[i - 1] = i
+                push(i - 1)
+        self.nodes_expanded = expanded
         return None
 
-    def reconstruct_path(
+    @register_solver("bfs")
+    def _bfs(self) -> Optional[List[int]]:
+        """Breadth-First Search over flat indices with an array parent table.
+
+        The queue is an ``array('i')`` read through an index cursor, and
+        ``parent`` holds -2 for unseen cells and -1 for the entry.
+        """
+        w = self.width
+        size = self.height * w
+        cells = self.cells
+        start = self.entry[0] * w + self.entry[1]
+        goal = self.exit[0] * w + self.exit[1]
+        parent = array("i", [-2]) * size
+        parent[start] = -1
+        queue = array("i", [start])
+        push = queue.append
+        trace = self.trace
+        head = 0
+        while head < len(queue):
+            i = queue[head]
+            head += 1
+            if trace is not None:
+                trace(i << 3 | EVENT_VISIT)
+            if i == goal:
+                self.nodes_expanded = head
+                return self.reconstruct_path(parent, goal)
+            walls = cells[i]
+            if not walls & 1 and parent[i - w] == -2:
+                parent[i - w] = i
+                push(i - w)
+            if not walls & 2 and parent[i + 1] == -2:
+                parent[i + 1] = i
+                push(i + 1)
+            if not walls & 4 and parent[i + w] == -2:
+                parent[i + w] = i
+                push(i + w)
+            if not walls & 8 and parent[i - 1] == -2:
+                parent[i - 1] = i
+                push(i - 1)
+        self.nodes_expanded = head
+        return None
+
+    def distance_field(
+        self, source: Optional[Tuple[int, int]] = None
+    ) -> DistanceField:
+        """Returns the distances from ``source`` (default: the entry).
+
+        One breadth-first pass fills the distance and parent tables of
+        every cell; paths to any number of targets are then read from
+        the parent table. The last field is cached until the grid
+        ``version`` changes, so asking again for the same source is
+        free. Only one field is kept, as each costs 12 bytes per cell.
+        """
+        f, c = self.entry if source is None else source
+        start = f * self.width + c
+        field = self._field
+        if (
+            field is None or field.source != start
+            or field.version != self.version
+        ):
+            field = self._distance_field(start)
+            self._field = field
+        return field
+
+    def _distance_field(self, start: int) -> DistanceField:
+        """Breadth-first traversal of the whole grid from ``start``.
+
+        The queue doubles as the ``order`` table: it is an ``array('i')``
+        iterated while it grows, which array iterators allow.
+        """
+        w = self.width
+        size = self.height * w
+        cells = self.cells
+        dist = array("i", [-1]) * size
+        parent = array("i", [-1]) * size
+        dist[start] = 0
+        order = array("i", [start])
+        push = order.append
+        for i in order:
+            d = dist[i] + 1
+            walls = cells[i]
+            if not walls & 1 and dist[i - w] < 0:
+                dist[i - w] = d
+                parent[i - w] = i
+                push(i - w)
+            if not walls & 2 and dist[i + 1] < 0:
+                dist[i + 1] = d
+                parent[i + 1] = i
+                push(i + 1)
+            if not walls & 4 and dist[i + w] < 0:
+                dist[i + w] = d
+                parent[i + w] = i
+                push(i + w)
+            if not walls & 8 and dist[i - 1] < 0:
+                dist[i - 1] = d
+                parent[i - 1] = i
+                push(i - 1)
+        return DistanceField(start, w, self.version, dist, parent, order)
+
+    def diameter(self) -> List[int]:
+        """Returns a longest shortest path of the maze, as flat indices.
+
+        Two ``distance_field`` passes: the cell farthest from any open
+        cell is one end of a longest path, and the cell farthest from
+        that end is the other. On a perfect maze, a tree, the result is
+        exactly the longest path; with loops it is long but not always
+        the longest. Empty when the grid has no open cell.
+        """
+        start = self.pattern42.find(0)
+        if start < 0:
+            return []
+        w = self.width
+        end = self.distance_field(divmod(start, w)).farthest()
+        # Free the first field before the second one is built.
+        self._field = None
+        field = self.distance_field(divmod(end, w))
+        return field.path(field.farthest()) or []
+
+    def paths_to(
         self,
-        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]],
-        target: Optional[Tuple[int, int]],
-    ) -> List[Tuple[int, int]]:
+        targets: Iterable[Tuple[int, int]],
+        source: Optional[Tuple[int, int]] = None,
+    ) -> List[Optional[List[Tuple[int, int]]]]:
+        """Finds shortest paths from ``source`` to each of ``targets``.
+
+        All of them come from a single ``distance_field``; unreachable
+        targets get None.
+        """
+        field = self.distance_field(source)
+        w = self.width
+        return [
+            self._to_coords(field.path(f * w + c)) for f, c in targets
+        ]
+
+    def reconstruct_path(
+        self, parent: "array[int]", target: int
+    ) -> List[int]:
         """
         Traces back the path from the exit to the entry using parent nodes.
+
+        ``parent`` is a flat table where any negative value ends the walk.
         """
-        path: List[Tuple[int, int]] = []
-        while target is not None:
+        path: List[int] = []
+        while target >= 0:
             path.append(target)
             target = parent[target]
         return path[::-1]
 
-    def bfs(self) -> Optional[List[Tuple[int, int]]]:
-        """Finds the shortest solution path using Breadth-First Search."""
-        way = self.entry
-        objective = self.exit
-        queue: List[Tuple[int, int]] = [way]
-        head = 0
-        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {way: None}
-        directions = [
-            (-1, 0, Wall.NORTH),
-            (0, 1, Wall.EAST),
-            (1, 0, Wall.SOUTH),
-            (0, -1, Wall.WEST),
-        ]
-        while head < len(queue):
-            actual = queue[head]
-            head += 1
-            y, x = actual
-            if actual == objective:
-                return self.reconstruct_path(parent, objective)
-            for dy, dx, wall_type in directions:
-                ny, nx = y + dy, x + dx
-                if 0 <= ny < self.height and 0 <= nx < self.width:
-                    if not (self.grid[y][x] & wall_type.value):
-                        if (ny, nx) not in parent:
-                            parent[(ny, nx)] = actual
-                            queue.append((ny, nx))
+    @register_solver("astar")
+    def _astar(self) -> Optional[List[int]]:
+        """Finds the shortest solution path using A* search.
+
+        The Manhattan distance to the exit is an admissible heuristic on
+        a grid, so the first time the exit is expanded its path is the
+        shortest one. Ties prefer cells closer to the exit.
+        """
+        h, w = self.height, self.width
+        cells = self.cells
+        start = self.entry[0] * w + self.entry[1]
+        goal_f, goal_c = self.exit
+        goal = goal_f * w + goal_c
+        offsets = (-w, 1, w, -1)
+        dist = array("i", [-1]) * (h * w)
+        parent = array("i", [-1]) * (h * w)
+        dist[start] = 0
+        heap = [(0, 0, start)]
+        expanded = 0
+        while heap:
+            total, est, i = heapq.heappop(heap)
+            if total - est > dist[i]:
+                continue
+            expanded += 1
+            if i == goal:
+                self.nodes_expanded = expanded
+                return self.reconstruct_path(parent, goal)
+            g = dist[i] + 1
+            walls = cells[i]
+            for k in range(4):
+                if walls & (1 << k):
+                    continue
+                j = i + offsets[k]
+                if dist[j] == -1 or g < dist[j]:
+                    dist[j] = g
+                    parent[j] = i
+                    f, c = divmod(j, w)
+                    est = abs(goal_f - f) + abs(goal_c - c)
+                    heapq.heappush(heap, (g + est, est, j))
+        self.nodes_expanded = expanded
+        return None
+
+    @register_solver("bidirectional")
+    def _bidirectional(self) -> Optional[List[int]]:
+        """Finds the shortest solution path with a bidirectional BFS.
+
+        One frontier grows from the entry and one from the exit; the
+        smaller one is expanded a full level at a time. When they touch,
+        the level is finished so the shortest meeting point is kept.
+        """
+        size = self.height * self.width
+        w = self.width
+        cells = self.cells
+        offsets = (-w, 1, w, -1)
+        start = self.entry[0] * w + self.entry[1]
+        goal = self.exit[0] * w + self.exit[1]
+        if start == goal:
+            self.nodes_expanded = 1
+            return [start]
+        dist = (array("i", [-1]) * size, array("i", [-1]) * size)
+        parent = (array("i", [-1]) * size, array("i", [-1]) * size)
+        dist[0][start] = 0
+        dist[1][goal] = 0
+        frontier: Tuple[List[int], List[int]] = ([start], [goal])
+        expanded = 0
+        while frontier[0] and frontier[1]:
+            side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+            mine, other = dist[side], dist[1 - side]
+            best, meet = -1, (-1, -1)
+            level: List[int] = []
+            expanded += len(frontier[side])
+            for i in frontier[side]:
+                walls = cells[i]
+                for k in range(4):
+                    if walls & (1 << k):
+                        continue
+                    j = i + offsets[k]
+                    if other[j] != -1:
+                        length = mine[i] + 1 + other[j]
+                        if best == -1 or length < best:
+                            best, meet = length, (i, j)
+                    if mine[j] == -1:
+                        mine[j] = mine[i] + 1
+                        parent[side][j] = i
+                        level.append(j)
+            if best != -1:
+                self.nodes_expanded = expanded
+                near, far = meet if side == 0 else meet[::-1]
+                path = self.reconstruct_path(parent[0], near)
+                while far != -1:
+                    path.append(far)
+                    far = parent[1][far]
+                return path
+            frontier = (
+                (level, frontier[1]) if side == 0 else (frontier[0], level)
+            )
+        self.nodes_expanded = expanded
         return None
 
+    def _to_coords(
+        self, path: Optional[List[int]]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """Converts a flat-index path into ``(row, col)`` tuples."""
+        if path is None:
+            return None
+        w = self.width
+        return [divmod(i, w) for i in path]
+
+    def _flat_directions(self, path: List[int]) -> str:
+        """Converts a flat-index path into a direction string."""
+        w = self.width
+        letters = {-w: "N", 1: "E", w: "S", -1: "W"}
+        return "".join(
+            letters[b - a] for a, b in zip(path, path[1:])
+        )
+
+    def way_cells(self, way: str) -> List[int]:
+        """Converts a direction string from the entry into flat indices."""
+        w = self.width
+        steps = {"N": -w, "E": 1, "S": w, "W": -1}
+        start = self.entry[0] * w + self.entry[1]
+        return list(itertools.accumulate(
+            map(steps.__getitem__, way), initial=start
+        ))
+
+    def remember_solution(
+        self, path: Optional[List[int]], nodes_expanded: int = 0
+    ) -> None:
+        """Caches ``path`` as the current solver's solution of the grid.
+
+        For solutions computed elsewhere, such as a maze read back from
+        a cache: ``solve_cells`` then returns it without solving.
+        """
+        self._solutions[self.solver or ""] = (
+            self.version, path, nodes_expanded
+        )
+
     def print_coordinates(self, way: List[Tuple[int, int]]) -> str:
         """
         Converts a coordinate list into a
@@ -235,30 +1250,38 @@ class MazeGenerator:
     def _connect_cells(self, f: int, c: int, direction: Wall) -> bool:
         """
         Removes the wall between two adjacent cells (bitwise update).
+
+        A successful carve bumps ``version``, dropping cached solutions.
         """
-        if not (self.grid[f][c] & direction.value):
+        cells, w = self.cells, self.width
+        i = f * w + c
+        if not (cells[i] & direction.value):
             return False
         if direction == Wall.NORTH and f > 0:
-            self.grid[f][c] &= ~Wall.NORTH
-            self.grid[f - 1][c] &= ~Wall.SOUTH
+            cells[i] &= ~Wall.NORTH
+            cells[i - w] &= ~Wall.SOUTH
+            self._touch()
             return True
         elif direction == Wall.SOUTH and f + 1 < self.height:
-            self.grid[f][c] &= ~Wall.SOUTH
-            self.grid[f + 1][c] &= ~Wall.NORTH
+            cells[i] &= ~Wall.SOUTH
+            cells[i + w] &= ~Wall.NORTH
+            self._touch()
             return True
-        elif direction == Wall.EAST and c + 1 < self.width:
-            self.grid[f][c] &= ~Wall.EAST
-            self.grid[f][c + 1] &= ~Wall.WEST
+        elif direction == Wall.EAST and c + 1 < w:
+            cells[i] &= ~Wall.EAST
+            cells[i + 1] &= ~Wall.WEST
+            self._touch()
             return True
         elif direction == Wall.WEST and c > 0:
-            self.grid[f][c] &= ~Wall.WEST
-            self.grid[f][c - 1] &= ~Wall.EAST
+            cells[i] &= ~Wall.WEST
+            cells[i - 1] &= ~Wall.EAST
+            self._touch()
             return True
         return False
 
     def _get_neighbor_bits(self, f: int, c: int, direction: int = 0) -> int:
         """Return neighbor bits"""
-        return self.grid[f][c + direction]
+        return self.cells[f * self.width + c + direction]
 
     def calculate_chance(self) -> float:
         """
@@ -278,39 +1301,112 @@ class MazeGenerator:
                 return probability
         return 0.1
 
-    def _apply_imperfect_logic(self, chance: float) -> "MazeGenerator":
-        """Randomly removes walls to create loops in non-perfect mazes."""
+    def _apply_imperfect_logic(
+        self, chance: float, south: bool = False
+    ) -> "MazeGenerator":
+        """Randomly removes walls to create loops in non-perfect mazes.
+
+        Each interior east wall, and south wall with ``south``, is
+        removed with probability ``chance`` unless it touches a '42'
+        cell or is the last closed wall of one of its cells. Walls are
+        handled in passes over alternate columns (or rows), so the walls
+        of a pass never share a cell; each pass combines whole-grid byte
+        masks as big integers and clears all its walls at once. Each
+        pass draws its own two random bytes per cell, so the noise held
+        at any time is that of one pass.
+        """
+        h, w, size = self.height, self.width, self.height * self.width
+        passes = [
+            (d, p) for d in ((Wall.EAST, Wall.SOUTH) if south
+                             else (Wall.EAST,))
+            for p in (0, 1)
+        ]
+        limit = min(max(round(chance * 65536), 0), 65536)
+        high = bytes(1 if b < limit >> 8 else 0 for b in range(256))
+        tie = bytes(1 if b == limit >> 8 else 0 for b in range(256))
+        low = bytes(1 if b < limit & 255 else 0 for b in range(256))
+        free = int.from_bytes(self.pattern42.translate(_UNRESERVED), "big")
         walls_broken = 0
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 2):
-                if (y, x) in self.pattern42_coords or (
-                    y,
-                    x + 1,
-                ) in self.pattern42_coords:
-                    continue
-                if random.random() < chance and (
-                    self.grid[y][x] & Wall.EAST.value
-                ):
-                    if (
-                        self._get_neighbor_bits(y, x) != 2
-                        and self._get_neighbor_bits(y, x, 1) != 8
-                    ):
-                        self._connect_cells(y, x, Wall.EAST)
-                        walls_broken += 1
-        if walls_broken == 0:
-            possible = []
-            for y in range(self.height):
-                for x in range(self.width):
-                    for d in list(Wall):
-                        possible.append((y, x, d))
-            random.shuffle(possible)
-            for y, x, d in possible:
-                if self._connect_cells(y, x, d):
-                    break
+        for d, parity in passes:
+            step, opposite = (1, Wall.WEST) if d == Wall.EAST else (
+                w, Wall.NORTH
+            )
+            shift = 8 * step
+            if d == Wall.EAST:
+                cols = range(2 - parity, w - 2, 2)
+                lines = range(1, h - 1)
+            else:
+                cols = range(1, w - 1)
+                lines = range(1 + parity, h - 2, 2)
+            row = bytes(1 if c in cols else 0 for c in range(w))
+            region = int.from_bytes(b"".join(
+                row if f in lines else bytes(w) for f in range(h)
+            ), "big")
+            hi, lo = self.rng.randbytes(size), self.rng.randbytes(size)
+            lottery = int.from_bytes(hi.translate(high), "big") | (
+                int.from_bytes(hi.translate(tie), "big")
+                & int.from_bytes(lo.translate(low), "big")
+            )
+            cells = bytes(self.cells[0:size])
+            here = int.from_bytes(cells.translate(_REMOVABLE[d]), "big")
+            there = int.from_bytes(
+                cells.translate(_REMOVABLE[opposite]), "big"
+            ) << shift
+            picked = (
+                region & lottery & here & there & free & (free << shift)
+            )
+            if picked:
+                value = int.from_bytes(cells, "big")
+                value -= picked * d + (picked >> shift) * opposite
+                self.cells[:] = value.to_bytes(size, "big")
+                walls_broken += picked.bit_count()
+        if walls_broken:
+            self._touch()
+        else:
+            self._open_random_wall()
         return self
 
-    def _write_42(self, visited: Set[Tuple[int, int]]) -> None:
-        """Hardcodes a '42' pattern into the center of the maze grid."""
+    def _open_random_wall(self) -> bool:
+        """Opens one closed wall that does not touch a '42' cell.
+
+        A few walls are drawn at random; if none of them can be opened,
+        every wall is tried once from a random starting point. No list
+        of candidates is built either way.
+        """
+        h, w, total = self.height, self.width, 4 * self.height * self.width
+        start = self.rng.randrange(total)
+        draws = [self.rng.randrange(total) for _ in range(32)]
+        offsets = (-w, 1, w, -1)
+        for n in itertools.chain(draws, range(start, start + total)):
+            i, k = divmod(n % total, 4)
+            f, c = divmod(i, w)
+            j = i + offsets[k]
+            if not (0 <= j < h * w) or self.pattern42[i] or self.pattern42[j]:
+                continue
+            if self._connect_cells(f, c, _WALLS[k]):
+                return True
+        return False
+
+    def _pattern42_by_row(self) -> Dict[int, Set[int]]:
+        """Groups the reserved '42' cells by row."""
+        rows: Dict[int, Set[int]] = {}
+        for f, c in self.pattern42_coords:
+            rows.setdefault(f, set()).add(c)
+        return rows
+
+    def _write_42(self) -> None:
+        """Reserves a '42' pattern in the center of the maze grid.
+
+        The cells are flagged in ``pattern42``; generation algorithms
+        treat them as already visited and never carve into them.
+        """
+        for f, c in self._locate_42():
+            i = f * self.width + c
+            self.pattern42[i] = 1
+            self._pattern42_cells.append(i)
+
+    def _locate_42(self) -> List[Tuple[int, int]]:
+        """Finds where the '42' pattern fits around the center."""
         start_f, start_c = (self.height // 2) - 2, (self.width // 2) - 3
         pattern = [
             (0, 0),
@@ -353,7 +1449,5 @@ class MazeGenerator:
                 0 <= start_f <= self.height - 5
                 and 0 <= start_c <= self.width - 7
             ) and not (self.entry in current or self.exit in current):
-                for f, c in current:
-                    self.pattern42_coords.add((f, c))
-                    visited.add((f, c))
-                return
+                return sorted(current)
+        return []
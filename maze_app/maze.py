@@ -1,11 +1,24 @@
-from typing import Dict, Union, List, Tuple
-from maze_app.render.render import render_ascii
+import time
+from contextlib import nullcontext
+from typing import (
+    Callable, ContextManager, Dict, Optional, Union, List, Tuple
+)
+from maze_app.output.binary_maze import save_maze
+from maze_app.render.render import frame_rows, theme_glyphs
+from maze_app.render.screen import Screen
+from maze_app.render.animate import Animator
+from maze_app.profiling import Profiler
+from maze_app.disk_cache import MazeCache
 from maze_app.themes import classic_theme
-from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.generator.MazeGenerator import MazeGenerator, SOLVERS
 
 
 class Maze:
-    """Manage maze generation, solving, themes, and rendering."""
+    """Manage maze generation, solving, themes, and rendering.
+
+    Set ``profiler`` to time and count each phase; see ``Profiler``.
+    Set ``cache`` to reuse seeded mazes across runs; see ``MazeCache``.
+    """
 
     def __init__(self, generator: "MazeGenerator", file_name: str) -> None:
         """Initialize the maze wrapper.
@@ -19,10 +32,91 @@ class Maze:
         self.current_solver = generator.solver
         self.current_algorithm = generator.algorithm
         self.file_name = file_name
+        self.screen = Screen()
+        self.animation: Optional[Tuple[float, int]] = None
+        self.profiler: Optional[Profiler] = None
+        self.cache: Optional[MazeCache] = None
+        self._saved: Optional[Tuple[int, Optional[str]]] = None
 
     def generate(self) -> None:
-        """Generate a new maze using the current settings."""
-        self.generator.generate()
+        """Generate a new maze using the current settings and save it.
+
+        With ``animation`` set to ``(fps, steps)`` the carving is shown
+        on screen while it runs; see ``Animator``. With a ``cache``, a
+        seeded maze built before is read back with its solution instead,
+        and a new one is stored once solved.
+        """
+        gen = self.generator
+        if self.cache is not None and self.cache.fetch(gen):
+            if gen.check is not None:
+                gen.check(gen)
+            self.save()
+            return
+        start = time.perf_counter()
+        with self._generating():
+            if self.animation is None:
+                gen.generate()
+            else:
+                self._animate(gen.generate)
+        if self.cache is not None:
+            self.solve("str")
+            self.cache.store(gen, time.perf_counter() - start)
+        self.save()
+
+    def _generating(self) -> ContextManager[None]:
+        """Profile a generation when a ``profiler`` is set."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.generating(self.generator)
+
+    def animate_solve(self) -> None:
+        """Show the current solver exploring the maze.
+
+        The solver is run once more with an ``Animator`` attached; the
+        solution itself still comes from ``solve``.
+        """
+        solver = SOLVERS.get(self.generator.solver or "")
+        if self.animation is not None and solver is not None:
+            gen = self.generator
+            self._animate(lambda: solver(gen))
+
+    def _animate(self, run: Callable[[], object]) -> None:
+        """Call ``run`` with an ``Animator`` as the generator's trace."""
+        fps, steps = self.animation or (30.0, 0)
+        animator = Animator(
+            self.generator, self.screen, self.themes, fps, steps
+        )
+        self.generator.trace = animator
+        try:
+            run()
+        finally:
+            self.generator.trace = None
+        animator.finish()
+
+    def save(self) -> bool:
+        """Write the maze to the output file if it changed.
+
+        The file holds the grid and the current solver's solution, in
+        the binary format if its name ends in ``.amz``; it is only
+        rewritten when the grid version or the solver differs
+        from the last write.
+
+        Returns:
+            True if the file was written.
+        """
+        gen = self.generator
+        state = (gen.version, gen.solver)
+        if state == self._saved:
+            return False
+        prof = self.profiler
+        with nullcontext() if prof is None else prof.solving(gen):
+            way = gen.get_solution()
+        with nullcontext() if prof is None else prof.writing(self.file_name):
+            save_maze(
+                gen, way if isinstance(way, str) else "", self.file_name
+            )
+        self._saved = state
+        return True
 
     def solve(self, mode: str = "way") -> Union[List[Tuple[int, int]], str]:
         """Solve the maze.
@@ -33,7 +127,9 @@ class Maze:
         Returns:
             A list of coordinates or a direction string.
         """
-        return self.generator.get_solution(mode)
+        prof = self.profiler
+        with nullcontext() if prof is None else prof.solving(self.generator):
+            return self.generator.get_solution(mode)
 
     def set_theme(self, theme_dict: Dict[str, str]) -> None:
         """Set the color theme used for rendering.
@@ -46,12 +142,20 @@ class Maze:
     def render(self, show_path: bool = False) -> None:
         """Render the maze in ASCII.
 
+        Only the cells that changed since the previous call are redrawn
+        when the terminal allows it; see ``Screen``.
+
         Args:
             show_path: Whether to display the solution path.
         """
-        render_ascii(
-            mz=self.generator,
-            show_path=show_path,
-            themes=self.themes,
-            name_file=self.file_name,
-        )
+        prof = self.profiler
+        if prof is not None and show_path:
+            with prof.solving(self.generator):
+                self.generator.solve_cells()
+        with nullcontext() if prof is None else prof.phase("render"):
+            drawn = self.screen.draw(
+                frame_rows(self.generator, show_path),
+                theme_glyphs(self.themes),
+            )
+        if prof is not None:
+            prof.count("chars_drawn", drawn)
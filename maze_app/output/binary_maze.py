@@ -0,0 +1,293 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from typing import BinaryIO, Optional, Tuple
+from maze_app.generator.MazeGenerator import MazeGenerator, PackedCells
+from maze_app.output.file_maze import generetor_file_maze
+from maze_app.output.read_maze import (
+    HexMazeReader, row_wall_error, south_wall_error, south_walls,
+)
+
+# Layout of a binary maze file (little endian):
+#
+#   header     magic, format version, flags (bit 0: perfect, bit 1: the
+#              seed is set), length of the algorithm name, width,
+#              height, entry row/col, exit row/col, seed, solution
+#              length in moves
+#   algorithm  ASCII name of the generation algorithm
+#   cells      wall masks, two per byte: cell 2k in the low nibble of
+#              byte k, cell 2k + 1 in the high one
+#   solution   moves, four per byte, 2 bits each (N=0, E=1, S=2, W=3),
+#              the first move in the lowest bits
+_HEADER = struct.Struct("<4sBBBxIIIIIIqQ")
+MAGIC = b"AMZB"
+FORMAT_VERSION = 1
+BINARY_SUFFIX = ".amz"
+_PERFECT = 1
+_HAS_SEED = 2
+
+_MOVE_CODES = bytes.maketrans(b"NESW", bytes(range(4)))
+_MOVE_LETTERS = bytes.maketrans(bytes(range(4)), b"NESW")
+_CRUMBS = tuple(bytes((b >> s) & 3 for b in range(256)) for s in (0, 2, 4, 6))
+
+
+def pack_moves(way: str) -> bytes:
+    """Pack a direction string into 2-bit codes, four moves per byte."""
+    codes = way.encode().translate(_MOVE_CODES)
+    if codes.translate(None, bytes(range(4))):
+        raise ValueError("solution may only contain N, E, S and W")
+    codes += b"\x00" * (-len(codes) % 4)
+    packed = 0
+    for k in range(4):
+        packed |= int.from_bytes(codes[k::4], "little") << (2 * k)
+    return packed.to_bytes(len(codes) // 4, "little")
+
+
+def unpack_moves(data: "bytes | memoryview", moves: int) -> str:
+    """Inverse of ``pack_moves`` for the first ``moves`` moves."""
+    chunk = bytes(data[:(moves + 3) // 4])
+    codes = bytearray(4 * len(chunk))
+    for k in range(4):
+        codes[k::4] = chunk.translate(_CRUMBS[k])
+    return codes[:moves].translate(_MOVE_LETTERS).decode()
+
+
+def _header(
+    width: int,
+    height: int,
+    entry: Tuple[int, int],
+    exit: Tuple[int, int],
+    perfect: bool,
+    seed: Optional[int],
+    algorithm: str,
+    moves: int,
+) -> bytes:
+    """Encode the header followed by the algorithm name.
+
+    Raises:
+        ValueError: If a field does not fit the header, such as a seed
+            outside the signed 64-bit range.
+    """
+    name = algorithm.encode("ascii")
+    flags = (_PERFECT if perfect else 0) | (
+        _HAS_SEED if seed is not None else 0
+    )
+    try:
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, flags, len(name), width, height,
+            entry[0], entry[1], exit[0], exit[1], seed or 0, moves,
+        )
+    except struct.error as e:
+        raise ValueError(f"cannot encode the maze header: {e}") from None
+    return header + name
+
+
+def write_binary(f: BinaryIO, generator: MazeGenerator, way: str) -> None:
+    """Write the maze in the packed binary format to an open file."""
+    cells = generator.cells
+    packed = cells if isinstance(cells, PackedCells) else (
+        PackedCells.pack(cells)
+    )
+    f.write(_header(
+        generator.width, generator.height, generator.entry,
+        generator.exit, generator.perfect, generator.seed,
+        generator.algorithm or "", len(way),
+    ))
+    f.write(packed.buffer)
+    f.write(pack_moves(way))
+
+
+def write_binary_maze(
+    generator: MazeGenerator, way: str, name_file: str
+) -> None:
+    """Save the maze and its solution in the packed binary format.
+
+    The cells take half a byte each and the solution a quarter of a
+    byte per move, against a byte per cell and per move in the hex
+    format; the header keeps the seed and the algorithm too.
+
+    Args:
+        generator: Maze generator holding the grid.
+        way: Solution path as a direction string.
+        name_file: Output filename.
+
+    Raises:
+        SystemExit: If the file cannot be written.
+        ValueError: If the maze does not fit the format; the truncated
+            file is removed.
+    """
+    try:
+        with open(name_file, "wb") as f:
+            write_binary(f, generator, way)
+    except OSError as e:
+        sys.stderr.write(f"Error writing output file: {e.strerror}")
+        sys.exit(1)
+    except ValueError:
+        os.remove(name_file)
+        raise
+
+
+def check_cells(
+    cells: PackedCells, width: int, height: int, name_file: str
+) -> None:
+    """Check the walls of a grid like ``HexMazeReader`` does.
+
+    Rows are unpacked one at a time, so memory stays at one row.
+
+    Raises:
+        ValueError: On an open border wall, or neighbours that
+            disagree on their shared wall.
+    """
+    prev_south = b""
+    for f in range(height):
+        row = cells[f * width:(f + 1) * width]
+        problem = row_wall_error(row, prev_south)
+        if problem is not None:
+            raise ValueError(
+                f"{name_file}: cell ({f},{problem[0]}): {problem[1]}"
+            )
+        prev_south = south_walls(row)
+    problem = south_wall_error(prev_south)
+    if problem is not None:
+        raise ValueError(
+            f"{name_file}: cell ({height - 1},{problem[0]}): {problem[1]}"
+        )
+
+
+def load_binary_maze(name_file: str) -> Tuple[MazeGenerator, str]:
+    """Open a binary maze file without copying its cells.
+
+    The file is mapped copy-on-write and the generator's ``cells`` is a
+    ``PackedCells`` view over the mapping, so the grid is never copied
+    and writes to it stay in memory. The cells are read once by
+    ``check_cells``, since the solvers rely on a closed border and on
+    neighbours agreeing on their walls.
+
+    Args:
+        name_file: Path of a file written by ``write_binary_maze``.
+
+    Returns:
+        The generator holding the maze, and the stored solution.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ValueError: If the file is not a valid binary maze.
+    """
+    with open(name_file, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError:
+            raise ValueError(f"{name_file}: empty file") from None
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise ValueError(f"{name_file}: truncated header")
+    (
+        magic, version, flags, name_len, width, height,
+        entry_f, entry_c, exit_f, exit_c, seed, moves,
+    ) = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{name_file}: not a binary maze file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{name_file}: unsupported version {version}")
+    start = _HEADER.size + name_len
+    size = width * height
+    end = start + (size + 1) // 2
+    if len(view) < end + (moves + 3) // 4:
+        raise ValueError(f"{name_file}: truncated data")
+    if not size:
+        raise ValueError(f"{name_file}: empty grid")
+    for what, (f, c) in (
+        ("entry", (entry_f, entry_c)), ("exit", (exit_f, exit_c))
+    ):
+        if not (f < height and c < width):
+            raise ValueError(f"{name_file}: {what} ({f},{c}) is outside "
+                             "the grid")
+    cells = PackedCells(view[start:end], size)
+    check_cells(cells, width, height, name_file)
+    generator = MazeGenerator(
+        height, width, (entry_f, entry_c), (exit_f, exit_c),
+        bool(flags & _PERFECT),
+        seed if flags & _HAS_SEED else None,
+        bytes(view[_HEADER.size:start]).decode("ascii") or None,
+    )
+    generator.adopt(cells)
+    return generator, unpack_moves(view[end:], moves)
+
+
+def save_maze(generator: MazeGenerator, way: str, name_file: str) -> None:
+    """Save the maze in the format given by the file extension.
+
+    Files ending in ``BINARY_SUFFIX`` get the packed binary format, any
+    other name the hex text format.
+    """
+    if name_file.endswith(BINARY_SUFFIX):
+        write_binary_maze(generator, way, name_file)
+    else:
+        generetor_file_maze(
+            generator.grid, generator.entry, generator.exit, way, name_file
+        )
+
+
+def hex_to_binary(src: str, dst: str) -> None:
+    """Convert a hex maze file into the binary format.
+
+    Rows are checked by ``HexMazeReader`` and packed as they are read,
+    so only one row is held in memory. Hex files carry no seed or
+    algorithm; both are left unset.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        MazeFileError: If ``src`` is not a valid hex maze file.
+    """
+    pending = b""
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        fout.write(_header(0, 0, (0, 0), (0, 0), False, None, "", 0))
+        reader = HexMazeReader(fin, src)
+        for row in reader.rows():
+            values = pending + row
+            even = len(values) & ~1
+            fout.write(PackedCells.pack(values[:even]).buffer)
+            pending = values[even:]
+        if pending:
+            fout.write(PackedCells.pack(pending).buffer)
+        entry, exit, way = reader.trailer()
+        fout.write(pack_moves(way))
+        fout.seek(0)
+        fout.write(_header(
+            reader.width, reader.height, entry, exit, False, None, "",
+            len(way),
+        ))
+
+
+def binary_to_hex(src: str, dst: str) -> None:
+    """Convert a binary maze file into the hex format, row by row."""
+    generator, way = load_binary_maze(src)
+    generetor_file_maze(
+        generator.grid, generator.entry, generator.exit, way, dst
+    )
+
+
+def main() -> None:
+    """Convert maze files between the hex and binary formats."""
+    parser = argparse.ArgumentParser(
+        description="Convert maze files between the hex and binary formats."
+    )
+    parser.add_argument("mode", choices=("pack", "unpack"),
+                        help="pack: hex to binary; unpack: binary to hex")
+    parser.add_argument("src", help="input file")
+    parser.add_argument("dst", help="output file")
+    args = parser.parse_args()
+    try:
+        if args.mode == "pack":
+            hex_to_binary(args.src, args.dst)
+        else:
+            binary_to_hex(args.src, args.dst)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
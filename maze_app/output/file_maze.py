@@ -1,8 +1,32 @@
 import sys
+from typing import BinaryIO, Iterable, Sequence
+
+HEX_DIGITS = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+
+def write_hex_maze(
+    f: BinaryIO,
+    matrix: Iterable[Sequence[int]],
+    entry: tuple[int, int],
+    exit: tuple[int, int],
+    way: str,
+) -> None:
+    """Write the maze in the hex format to an open binary file.
+
+    Rows may be lists of ints or ``memoryview`` slices of the flat cell
+    buffer; each one is turned into hex digits with a single
+    ``bytes.translate`` call.
+    """
+    for line in matrix:
+        f.write(bytes(line).translate(HEX_DIGITS) + b'\n')
+    f.write(b'\n')
+    f.write(f"{entry[0]},{entry[1]}\n".encode())
+    f.write(f"{exit[0]},{exit[1]}\n".encode())
+    f.write(f"{way}\n".encode())
 
 
 def generetor_file_maze(
-    matrix: list[list[int]],
+    matrix: Iterable[Sequence[int]],
     entry: tuple[int, int],
     exit: tuple[int, int],
     way: str,
@@ -21,14 +45,8 @@ def generetor_file_maze(
         SystemExit: If the file cannot be written.
     """
     try:
-        with open(name_file, 'w') as f:
-            for line in matrix:
-                line_hex = "".join(format(x, 'X') for x in line)
-                f.write(line_hex + '\n')
-            f.write('\n')
-            f.write(f"{entry[0]},{entry[1]}\n")
-            f.write(f"{exit[0]},{exit[1]}\n")
-            f.write(f"{way}\n")
+        with open(name_file, 'wb') as f:
+            write_hex_maze(f, matrix, entry, exit, way)
     except OSError as e:
         sys.stderr.write(f"Error writing output file: {e.strerror}")
         sys.exit(1)
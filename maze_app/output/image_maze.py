@@ -0,0 +1,259 @@
+import argparse
+import re
+import struct
+import sys
+import zlib
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.binary_maze import BINARY_SUFFIX, load_binary_maze
+from maze_app.output.read_maze import load_hex_maze
+from maze_app.render.render import (
+    PATTERN42_COLOR, VISITED_COLOR, iter_frame_rows,
+)
+from maze_app.themes import classic_theme, dark_theme, neon_theme
+
+RGB = Tuple[int, int, int]
+
+THEMES = {
+    "classic": classic_theme,
+    "dark": dark_theme,
+    "neon": neon_theme,
+}
+
+# xterm colours of the 16 basic ANSI codes: 30-37, then 90-97.
+_BASIC = (
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+_CUBE = (0, 95, 135, 175, 215, 255)
+_SGR = re.compile(r"\033\[([0-9;]*)m")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Rows of tokens turned into pixels and compressed at a time.
+STRIP_ROWS = 64
+
+
+def ansi_rgb(code: str) -> RGB:
+    """Return the colour an xterm shows for a foreground escape.
+
+    Supports the basic (``\\033[31m``, ``\\033[91m``), 256-colour
+    (``\\033[38;5;Nm``) and true-colour (``\\033[38;2;R;G;Bm``) forms
+    used by the themes.
+
+    Raises:
+        ValueError: If ``code`` is not one of these.
+    """
+    match = _SGR.fullmatch(code)
+    params = [int(p) for p in match.group(1).split(";")] if match else []
+    if len(params) == 1 and 30 <= params[0] <= 37:
+        return _BASIC[params[0] - 30]
+    if len(params) == 1 and 90 <= params[0] <= 97:
+        return _BASIC[params[0] - 82]
+    if len(params) == 3 and params[:2] == [38, 5] and params[2] < 256:
+        n = params[2]
+        if n < 16:
+            return _BASIC[n]
+        if n < 232:
+            n -= 16
+            return _CUBE[n // 36], _CUBE[n // 6 % 6], _CUBE[n % 6]
+        return (8 + 10 * (n - 232),) * 3
+    if len(params) == 5 and params[:2] == [38, 2]:
+        r, g, b = params[2:]
+        if max(r, g, b) < 256:
+            return r, g, b
+    raise ValueError(f"unsupported colour escape {code!r}")
+
+
+def theme_palette(
+    themes: Dict[str, str], background: RGB = (0, 0, 0)
+) -> List[RGB]:
+    """Return the colour of every render token for a theme.
+
+    The list is indexed by the tokens of ``maze_app.render.render``;
+    blank blocks take ``background``, the terminal's own colour.
+    """
+    return [background] + [
+        ansi_rgb(code) for code in (
+            themes["wall"], PATTERN42_COLOR, themes["path"],
+            themes["exit"], themes["entry"], VISITED_COLOR,
+        )
+    ]
+
+
+def _scanlines(rows: Iterable[bytes], scale: int) -> Iterator[bytes]:
+    """Yield the token rows as pixel rows, ``scale`` pixels per token."""
+    for row in rows:
+        if scale > 1:
+            wide = bytearray(len(row) * scale)
+            for k in range(scale):
+                wide[k::scale] = row
+            row = bytes(wide)
+        for _ in range(scale):
+            yield row
+
+
+def _strips(lines: Iterable[bytes], size: int) -> Iterator[List[bytes]]:
+    """Group pixel rows into lists of at most ``size`` rows."""
+    strip: List[bytes] = []
+    for line in lines:
+        strip.append(line)
+        if len(strip) == size:
+            yield strip
+            strip = []
+    if strip:
+        yield strip
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    """Frame one PNG chunk with its length and CRC."""
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+
+def write_png(
+    f: BinaryIO,
+    rows: Iterable[bytes],
+    size: Tuple[int, int],
+    palette: List[RGB],
+    scale: int = 1,
+    level: int = 6,
+) -> None:
+    """Write token rows as an indexed-colour PNG.
+
+    The tokens are the palette indices, so a pixel row is the token row
+    itself with each token repeated ``scale`` times. Rows are filtered
+    with "None" and compressed strip by strip into one IDAT chunk per
+    strip, so only ``STRIP_ROWS`` rows are held at a time.
+
+    Args:
+        f: Binary file to write to.
+        rows: Token rows, as yielded by ``iter_frame_rows``.
+        size: Size of the token grid as (columns, rows).
+        palette: Colour of each token.
+        scale: Pixels per token along each axis.
+        level: zlib compression level; 1 is several times faster than
+            6 for files about 1.6 times larger.
+    """
+    columns, count = size
+    f.write(_PNG_SIGNATURE)
+    f.write(_chunk(b"IHDR", struct.pack(
+        ">IIBBBBB", columns * scale, count * scale, 8, 3, 0, 0, 0
+    )))
+    f.write(_chunk(b"PLTE", bytes(v for rgb in palette for v in rgb)))
+    z = zlib.compressobj(level)
+    for strip in _strips(_scanlines(rows, scale), STRIP_ROWS * scale):
+        data = z.compress(b"\x00" + b"\x00".join(strip))
+        if data:
+            f.write(_chunk(b"IDAT", data))
+    f.write(_chunk(b"IDAT", z.flush()))
+    f.write(_chunk(b"IEND", b""))
+
+
+def write_ppm(
+    f: BinaryIO,
+    rows: Iterable[bytes],
+    size: Tuple[int, int],
+    palette: List[RGB],
+    scale: int = 1,
+) -> None:
+    """Write token rows as a binary PPM (P6) image.
+
+    Each channel of a strip is one ``bytes.translate`` of its tokens,
+    and the three channels are interleaved by slice assignment. The
+    arguments are those of ``write_png``; PPM is not compressed.
+    """
+    columns, count = size
+    f.write(f"P6\n{columns * scale} {count * scale}\n255\n".encode())
+    channels = [
+        bytes(palette[t][k] if t < len(palette) else 0 for t in range(256))
+        for k in range(3)
+    ]
+    for strip in _strips(_scanlines(rows, scale), STRIP_ROWS * scale):
+        tokens = b"".join(strip)
+        pixels = bytearray(3 * len(tokens))
+        for k in range(3):
+            pixels[k::3] = tokens.translate(channels[k])
+        f.write(pixels)
+
+
+def export_image(
+    generator: MazeGenerator,
+    name_file: str,
+    path: Optional[Iterable[int]] = None,
+    themes: Optional[Dict[str, str]] = None,
+    scale: int = 1,
+    level: int = 6,
+) -> None:
+    """Rasterize the maze into a PNG or PPM file.
+
+    The picture is the terminal view, one square of ``scale`` pixels
+    per block: a cell takes 3x2 blocks, walls and the '42' cells are
+    filled, and the path, entry and exit take the theme colours. The
+    format follows the extension, PPM for ``.ppm`` and PNG otherwise.
+
+    Rows come from ``iter_frame_rows`` and are encoded in strips, so
+    memory does not depend on the maze size beyond the path.
+
+    Args:
+        generator: Generator holding the maze.
+        name_file: Output filename.
+        path: Flat indices of the path cells to draw, if any.
+        themes: Colour theme; the classic one by default.
+        scale: Pixels per block along each axis.
+        level: zlib compression level of PNG files.
+
+    Raises:
+        OSError: If the file cannot be written.
+        ValueError: If ``scale`` is not positive or a theme colour is
+            not supported.
+    """
+    if scale < 1:
+        raise ValueError("scale must be at least 1")
+    palette = theme_palette(themes or classic_theme())
+    size = (3 * generator.width, 2 * generator.height + 1)
+    rows = iter_frame_rows(generator, path)
+    with open(name_file, "wb") as f:
+        if name_file.lower().endswith(".ppm"):
+            write_ppm(f, rows, size, palette, scale)
+        else:
+            write_png(f, rows, size, palette, scale, level)
+
+
+def main() -> None:
+    """Render a hex or binary maze file as a PNG or PPM image."""
+    parser = argparse.ArgumentParser(
+        description="Render a maze file as a PNG or PPM image."
+    )
+    parser.add_argument("src", help=f"hex or binary ({BINARY_SUFFIX}) maze")
+    parser.add_argument("dst", help="output image (.png or .ppm)")
+    parser.add_argument("--theme", choices=list(THEMES), default="classic",
+                        help="colour theme (default: classic)")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="pixels per block (default: 1)")
+    parser.add_argument("--level", type=int, default=6,
+                        choices=range(10), metavar="0-9",
+                        help="PNG compression level (default: 6)")
+    parser.add_argument("--no-path", action="store_true",
+                        help="do not draw the stored solution")
+    args = parser.parse_args()
+    try:
+        if args.src.endswith(BINARY_SUFFIX):
+            generator, way = load_binary_maze(args.src)
+        else:
+            generator, way = load_hex_maze(args.src, packed=True)
+        path = None
+        if way and not args.no_path:
+            path = generator.way_cells(way)
+        export_image(
+            generator, args.dst, path, THEMES[args.theme](), args.scale,
+            args.level,
+        )
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+import argparse
+import mmap
+import sys
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+from maze_app.generator.MazeGenerator import MazeGenerator, PackedCells
+
+_HEX = b"0123456789ABCDEFabcdef"
+_HEX_VALUE = bytes.maketrans(_HEX, bytes(range(16)) + bytes(range(10, 16)))
+_LETTERS = "NESW"
+_STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+# Per-value tables holding 1 where the wall is closed, so a whole row of
+# walls can be compared with its neighbours in one ``bytes`` comparison.
+_NORTH, _EAST, _SOUTH, _WEST = (
+    bytes(1 if v & bit else 0 for v in range(256)) for bit in (1, 2, 4, 8)
+)
+
+
+def row_wall_error(
+    cells: bytes, prev_south: bytes
+) -> Optional[Tuple[int, str]]:
+    """Check one row of wall masks against its neighbours and the border.
+
+    ``prev_south`` holds 1 per closed south wall of the row above, as
+    ``cells.translate`` with the south table gives it, and is empty for
+    the first row; the south border is checked by ``south_wall_error``
+    once the last row is known.
+
+    Returns:
+        The 0-based column and a message for the first problem, or
+        None if the row is consistent.
+    """
+    east, west = cells.translate(_EAST), cells.translate(_WEST)
+    if east[:-1] != west[1:]:
+        col = _first_difference(east[:-1], west[1:])
+        return col, "east wall does not match the next cell"
+    if not west[0]:
+        return 0, "west wall of the border is open"
+    if not east[-1]:
+        return len(cells) - 1, "east wall of the border is open"
+    north = cells.translate(_NORTH)
+    if not prev_south and 0 in north:
+        return north.index(0), "north wall of the border is open"
+    if prev_south and north != prev_south:
+        col = _first_difference(north, prev_south)
+        return col, "north wall does not match the cell above"
+    return None
+
+
+def south_walls(cells: bytes) -> bytes:
+    """Return 1 per closed south wall of a row, for ``row_wall_error``."""
+    return cells.translate(_SOUTH)
+
+
+def south_wall_error(last_south: bytes) -> Optional[Tuple[int, str]]:
+    """Check that the last row, given by ``south_walls``, is closed."""
+    if 0 in last_south:
+        return last_south.index(0), "south wall of the border is open"
+    return None
+
+
+class MazeFileError(ValueError):
+    """A maze file that cannot be read, with the offending position.
+
+    Attributes:
+        line (int): 1-based line number.
+        column (int): 1-based column number.
+    """
+    def __init__(self, name_file: str, line: int, column: int, msg: str):
+        """Build the ``file:line:column: msg`` message."""
+        super().__init__(f"{name_file}:{line}:{column}: {msg}")
+        self.line = line
+        self.column = column
+
+
+def _first_difference(a: bytes, b: bytes) -> int:
+    """Index of the first byte where ``a`` and ``b`` differ."""
+    return next(i for i, (x, y) in enumerate(zip(a, b)) if x != y)
+
+
+class HexMazeReader:
+    """Streaming reader of the hex format written by ``generetor_file_maze``.
+
+    ``rows`` yields the grid one row at a time as wall masks, checking
+    that every row has the same width, holds only hex digits, agrees
+    with its left, right and upper neighbours on their shared walls and
+    keeps the outer border closed.
+    Only the previous row is kept, so memory does not depend on the
+    height. ``trailer`` then reads the entry, exit and path lines and
+    ``check_path`` walks the path over the walls.
+
+    Attributes:
+        width, height (int): Grid size read so far.
+        line (int): Number of the last line read.
+        stride (int): Bytes per grid line, line ending included.
+    """
+    def __init__(self, f: BinaryIO, name_file: str):
+        """Read from the binary file object ``f`` named ``name_file``."""
+        self._f = f
+        self.name_file = name_file
+        self.width = 0
+        self.height = 0
+        self.line = 0
+        self.stride = 0
+
+    def error(self, column: int, msg: str, line: int = 0) -> MazeFileError:
+        """Build an error at ``column`` of ``line`` (default: last one)."""
+        return MazeFileError(self.name_file, line or self.line, column, msg)
+
+    def rows(self) -> Iterator[bytes]:
+        """Yield the validated wall masks of each grid row.
+
+        The south border is only known once the last row is read, so
+        that error is raised after every row has been yielded.
+
+        Raises:
+            MazeFileError: On a malformed row, mismatched walls or an
+                open border wall.
+        """
+        prev_south = b""
+        for raw in self._f:
+            self.line += 1
+            row = raw.rstrip(b"\r\n")
+            if not row:
+                break
+            if not self.width:
+                self.width, self.stride = len(row), len(raw)
+            if len(row) != self.width:
+                raise self.error(
+                    min(len(row), self.width) + 1,
+                    f"expected {self.width} cells, got {len(row)}",
+                )
+            if len(raw) != self.stride:
+                raise self.error(self.width + 1, "inconsistent line ending")
+            if row.translate(None, _HEX):
+                col = next(i for i, b in enumerate(row) if b not in _HEX)
+                raise self.error(
+                    col + 1, f"invalid hex digit {row[col:col + 1]!r}"
+                )
+            cells = row.translate(_HEX_VALUE)
+            problem = row_wall_error(cells, prev_south)
+            if problem is not None:
+                raise self.error(problem[0] + 1, problem[1])
+            prev_south = south_walls(cells)
+            self.height += 1
+            last_line = self.line
+            yield cells
+        if not self.height:
+            raise self.error(1, "no grid rows", self.line + 1)
+        problem = south_wall_error(prev_south)
+        if problem is not None:
+            raise self.error(problem[0] + 1, problem[1], last_line)
+
+    def _coord(self, what: str) -> Tuple[int, int]:
+        """Read a ``row,col`` line and check it lies on the grid."""
+        raw = self._f.readline()
+        self.line += 1
+        if not raw:
+            raise self.error(1, f"missing {what} line")
+        try:
+            f, c = (int(v) for v in raw.split(b","))
+        except ValueError:
+            raise self.error(1, f"{what} must be 'row,col'") from None
+        if not (0 <= f < self.height and 0 <= c < self.width):
+            raise self.error(1, f"{what} ({f},{c}) is outside the grid")
+        return f, c
+
+    def trailer(self) -> Tuple[Tuple[int, int], Tuple[int, int], str]:
+        """Read the entry, exit and path lines that follow the grid.
+
+        Returns:
+            Entry, exit and the path, which may be empty.
+
+        Raises:
+            MazeFileError: If a line is missing or malformed.
+        """
+        entry = self._coord("entry")
+        exit = self._coord("exit")
+        way = self._f.readline().rstrip(b"\r\n")
+        self.line += 1
+        if way.translate(None, b"NESW"):
+            col = next(i for i, b in enumerate(way) if b not in b"NESW")
+            raise self.error(
+                col + 1, f"invalid move {way[col:col + 1]!r}"
+            )
+        return entry, exit, way.decode()
+
+    def check_path(
+        self,
+        way: str,
+        walls: Callable[[int], int],
+        entry: Tuple[int, int],
+        exit: Tuple[int, int],
+    ) -> None:
+        """Check that ``way`` leads from entry to exit through open walls.
+
+        An empty path is accepted as "no solution recorded".
+
+        Args:
+            way: Direction string from ``trailer``.
+            walls: Returns the wall mask of a flat cell index.
+            entry: Entry coordinate (row, col).
+            exit: Exit coordinate (row, col).
+
+        Raises:
+            MazeFileError: At the first move that is blocked or leaves
+                the grid, or if the path stops short of the exit.
+        """
+        if not way:
+            return
+        f, c = entry
+        for col, letter in enumerate(way, 1):
+            d = _LETTERS.index(letter)
+            if walls(f * self.width + c) & (1 << d):
+                raise self.error(col, f"move {letter} from ({f},{c}) "
+                                      "goes through a wall")
+            f += _STEPS[d][0]
+            c += _STEPS[d][1]
+            if not (0 <= f < self.height and 0 <= c < self.width):
+                raise self.error(col, f"move {letter} leaves the grid")
+        if (f, c) != exit:
+            raise self.error(len(way), f"path ends at ({f},{c}), not at "
+                                       f"the exit ({exit[0]},{exit[1]})")
+
+
+def load_hex_maze(
+    name_file: str, packed: bool = False
+) -> Tuple[MazeGenerator, str]:
+    """Read a hex maze file back into a generator.
+
+    The rows are checked while they are read and appended straight to
+    the cell buffer, so the only memory used besides the grid itself
+    is one row. With ``packed`` the grid is kept as ``PackedCells``,
+    half the size of a ``bytearray``. The stored path is then checked
+    against the grid.
+
+    Args:
+        name_file: Path of a file written by ``generetor_file_maze``.
+        packed: Whether to store two cells per byte.
+
+    Returns:
+        The generator holding the maze, and the stored solution.
+
+    Raises:
+        OSError: If the file cannot be read.
+        MazeFileError: If the file is malformed, with line and column.
+    """
+    cells = bytearray()
+    pending = b""
+    with open(name_file, "rb") as f:
+        reader = HexMazeReader(f, name_file)
+        for row in reader.rows():
+            if packed:
+                row = pending + row
+                even = len(row) & ~1
+                cells += PackedCells.pack(row[:even]).buffer
+                pending = row[even:]
+            else:
+                cells += row
+        entry, exit, way = reader.trailer()
+    if pending:
+        cells += PackedCells.pack(pending).buffer
+    size = reader.width * reader.height
+    grid = PackedCells(cells, size) if packed else cells
+    reader.check_path(way, grid.__getitem__, entry, exit)
+    generator = MazeGenerator(
+        reader.height, reader.width, entry, exit, False, None, None
+    )
+    generator.adopt(grid)
+    return generator, way
+
+
+def validate_hex_maze(name_file: str) -> Tuple[int, int]:
+    """Check a hex maze file without loading its grid.
+
+    Rows are streamed through ``HexMazeReader`` and the path is then
+    walked over the memory-mapped file, so memory stays at one row
+    whatever the file size.
+
+    Returns:
+        The grid size as (height, width).
+
+    Raises:
+        OSError: If the file cannot be read.
+        MazeFileError: If the file is malformed, with line and column.
+    """
+    with open(name_file, "rb") as f:
+        reader = HexMazeReader(f, name_file)
+        for _ in reader.rows():
+            pass
+        entry, exit, way = reader.trailer()
+        if way:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                stride, width = reader.stride, reader.width
+
+                def walls(i: int) -> int:
+                    row, col = divmod(i, width)
+                    return _HEX_VALUE[data[row * stride + col]]
+
+                reader.check_path(way, walls, entry, exit)
+    return reader.height, reader.width
+
+
+def main() -> None:
+    """Validate hex maze files and report the first error of each."""
+    parser = argparse.ArgumentParser(
+        description="Validate maze files in the hex format."
+    )
+    parser.add_argument("files", nargs="+", help="maze files to check")
+    args = parser.parse_args()
+    failed = False
+    for name in args.files:
+        try:
+            height, width = validate_hex_maze(name)
+        except OSError as e:
+            sys.stderr.write(f"{name}: {e.strerror}\n")
+            failed = True
+        except MazeFileError as e:
+            sys.stderr.write(f"{e}\n")
+            failed = True
+        else:
+            print(f"{name}: ok ({height}x{width})")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import mmap
+import sys
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.file_maze import HEX_DIGITS
+
+# Wall bit of each direction, in N, E, S, W order, with its row/column
+# step and the letter used in the solution string.
+_STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+_LETTERS = b"NESW"
+_HEX_VALUE = bytes.maketrans(b"0123456789ABCDEF", bytes(range(16)))
+
+
+def follow_wall(
+    grid: "mmap.mmap | bytes",
+    width: int,
+    height: int,
+    entry: tuple[int, int],
+    exit: tuple[int, int],
+) -> str:
+    """Solve a perfect maze stored as hex rows with the left-hand rule.
+
+    In a perfect maze the left-hand walk is an Euler tour of the
+    spanning tree, so it always reaches the exit. Stepping back through
+    the previous move cancels it, which leaves only the unique path.
+    Only the cells under the walker are read and the only state is that
+    path, so it works on memory-mapped files of any size.
+
+    Args:
+        grid: Hex rows of ``width`` digits, each followed by a newline.
+        width: Number of columns.
+        height: Number of rows.
+        entry: Entry coordinate (row, col).
+        exit: Exit coordinate (row, col).
+
+    Returns:
+        The solution as a direction string (N, E, S, W).
+
+    Raises:
+        ValueError: If the exit cannot be reached from the entry.
+    """
+    stride = width + 1
+    f, c = entry
+    heading = 2
+    path = bytearray()
+    for _ in range(4 * width * height):
+        if (f, c) == exit:
+            return path.decode()
+        walls = _HEX_VALUE[grid[f * stride + c]]
+        for turn in (3, 0, 1, 2):
+            d = (heading + turn) & 3
+            if not walls & (1 << d):
+                break
+        else:
+            break
+        heading = d
+        if path and path[-1] == _LETTERS[d ^ 2]:
+            path.pop()
+        else:
+            path.append(_LETTERS[d])
+        f += _STEPS[d][0]
+        c += _STEPS[d][1]
+    raise ValueError("Exit is not reachable from the entry")
+
+
+def stream_file_maze(generator: MazeGenerator, name_file: str) -> str:
+    """Generate a maze row by row straight into an output file.
+
+    Rows come from ``MazeGenerator.stream_rows`` and are written in the
+    same hex format as ``generetor_file_maze`` as soon as they are
+    finished. The solution trailer is then computed by a second pass
+    that walks the memory-mapped rows with ``follow_wall``.
+
+    Args:
+        generator: Maze generator holding size, entry, exit and seed.
+        name_file: Output filename.
+
+    Returns:
+        The solution path as a direction string.
+
+    Raises:
+        ValueError: If the generator is not configured for a perfect
+            maze, which the wall-following pass relies on.
+        SystemExit: If the file cannot be written.
+    """
+    if generator.perfect is False:
+        raise ValueError("Streaming only supports perfect mazes")
+    entry, exit = generator.entry, generator.exit
+    try:
+        with open(name_file, "w+b") as f:
+            for row in generator.stream_rows():
+                f.write(row.translate(HEX_DIGITS) + b"\n")
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as grid:
+                way = follow_wall(
+                    grid, generator.width, generator.height, entry, exit
+                )
+            f.write(b"\n")
+            f.write(f"{entry[0]},{entry[1]}\n".encode())
+            f.write(f"{exit[0]},{exit[1]}\n".encode())
+            f.write(f"{way}\n".encode())
+    except OSError as e:
+        sys.stderr.write(f"Error writing output file: {e.strerror}")
+        sys.exit(1)
+    return way
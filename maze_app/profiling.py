@@ -0,0 +1,179 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from maze_app.generator.MazeGenerator import MazeGenerator
+
+# Number of open walls of each wall mask.
+_OPEN_WALLS = bytes(4 - bin(b & 15).count("1") for b in range(256))
+
+
+def carved_passages(generator: MazeGenerator) -> int:
+    """Count the open walls between two cells of the grid.
+
+    Every passage opens one wall on each side, so this is half the
+    number of open walls; the outer border is closed.
+    """
+    cells = generator.cells
+    masks = bytes(cells[0:len(cells)])
+    return sum(masks.translate(_OPEN_WALLS)) // 2
+
+
+class _FrontierPeak:
+    """Trace sink keeping the largest ``frontier`` seen during a run."""
+    def __init__(self, generator: MazeGenerator):
+        """Watch the frontier published by ``generator``."""
+        self.generator = generator
+        self.peak = 0
+
+    def __call__(self, event: int) -> None:
+        """Sample the frontier size at each event."""
+        size = len(self.generator.frontier)
+        if size > self.peak:
+            self.peak = size
+
+
+class Profiler:
+    """Opt-in timers, counters and memory peaks for the phases of a run.
+
+    Code under measurement wraps each phase in ``with
+    profiler.phase(name):`` and keeps ``None`` instead of a profiler
+    when profiling is off, so a normal run does none of this work.
+    Phases are not nested: 'generate', 'solve', 'render' and 'write'
+    are timed apart even when one triggers the other.
+
+    With ``memory``, ``tracemalloc`` runs from ``start`` to ``stop``
+    and every phase records the peak of the memory allocated above its
+    start, and the frontier of the generators is sampled; both slow
+    the run down. With ``cprofile``, a ``cProfile`` profiler runs over
+    the same span.
+
+    Attributes:
+        phases (dict): Per phase, the number of calls, the wall-clock
+            and CPU seconds and, with ``memory``, the peak bytes.
+        counters (dict): Totals and peaks counted during the run.
+    """
+    def __init__(self, memory: bool = False, cprofile: bool = False):
+        """Create a profiler; nothing is measured until ``start``."""
+        self.memory = memory
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self._started = 0.0
+        self._wall = 0.0
+
+    def start(self) -> None:
+        """Start the overall clock and the optional tracers."""
+        if self.memory:
+            tracemalloc.start()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop the overall clock and the optional tracers."""
+        self._wall = time.perf_counter() - self._started
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        if self.memory:
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the ``with`` block as one call of ``name``."""
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+            stats = self.phases.setdefault(
+                name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0}
+            )
+            stats["calls"] += 1
+            stats["wall_s"] += wall
+            stats["cpu_s"] += cpu
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                stats["peak_bytes"] = max(stats.get("peak_bytes", 0), peak)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to the counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def peak(self, name: str, value: int) -> None:
+        """Keep the largest ``value`` seen under ``name``."""
+        self.counters[name] = max(self.counters.get(name, 0), value)
+
+    @contextmanager
+    def generating(self, generator: MazeGenerator) -> Iterator[None]:
+        """Time a ``generate`` call and count what it carved.
+
+        With ``memory`` and no other trace sink attached, the frontier
+        of the 'dfs' and 'prim' algorithms is sampled at every carved
+        wall, which makes the phase up to a third slower.
+        """
+        sampler = None
+        if self.memory and generator.trace is None:
+            sampler = _FrontierPeak(generator)
+            generator.trace = sampler
+        try:
+            with self.phase("generate"):
+                yield
+        finally:
+            if sampler is not None:
+                generator.trace = None
+        self.count("mazes")
+        self.count("passages_carved", carved_passages(generator))
+        if sampler is not None and sampler.peak:
+            self.peak("frontier_peak", sampler.peak)
+
+    @contextmanager
+    def solving(self, generator: MazeGenerator) -> Iterator[None]:
+        """Time a solve and count the nodes expanded.
+
+        Cached solutions are not counted, as no solver runs.
+        """
+        if generator.is_solved():
+            yield
+            return
+        with self.phase("solve"):
+            yield
+        self.count("nodes_expanded", generator.nodes_expanded)
+
+    @contextmanager
+    def writing(self, name_file: str) -> Iterator[None]:
+        """Time a file write and count the bytes written."""
+        with self.phase("write"):
+            yield
+        self.count("bytes_written", os.path.getsize(name_file))
+
+    def report(self) -> Dict[str, Any]:
+        """Return the measurements as a JSON-serializable dictionary."""
+        return {
+            "wall_s": self._wall,
+            "memory_traced": self.memory,
+            "phases": self.phases,
+            "counters": self.counters,
+        }
+
+    def dump(
+        self, name_file: str, cprofile_file: Optional[str] = None
+    ) -> None:
+        """Write the JSON report, and the ``cProfile`` stats if kept.
+
+        Raises:
+            OSError: If a file cannot be written.
+        """
+        with open(name_file, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+        if self.cprofile is not None and cprofile_file:
+            self.cprofile.dump_stats(cprofile_file)
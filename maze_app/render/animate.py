@@ -0,0 +1,106 @@
+import time
+from typing import Dict, List, Tuple
+from maze_app.generator.MazeGenerator import EVENT_VISIT, MazeGenerator
+from maze_app.render.render import (
+    BLANK, ENTRY, EXIT, P42, VISIT, _MID, _TOP, frame_rows, theme_glyphs,
+)
+from maze_app.render.screen import Screen
+
+
+class Animator:
+    """Paints the events of a running algorithm at a bounded frame rate.
+
+    Set as ``MazeGenerator.trace``, it is called with every carved wall
+    and every cell a solver expands. Events are buffered, and at most
+    ``fps`` times per second the cells they touched are recomputed and
+    patched on the ``Screen``. A frame therefore costs in proportion to
+    the cells that changed, not to the size of the maze.
+
+    With ``steps``, every frame holds at most that many events and the
+    run is slowed down to ``fps`` frames per second, so that small mazes
+    can be watched.
+
+    Attributes:
+        frames (int): Number of frames painted so far.
+    """
+    def __init__(
+        self,
+        mz: MazeGenerator,
+        screen: Screen,
+        themes: Dict[str, str],
+        fps: float = 30.0,
+        steps: int = 0,
+    ):
+        """Animate ``mz`` on ``screen`` with the colours of ``themes``."""
+        self.mz = mz
+        self.screen = screen
+        self.glyphs = theme_glyphs(themes)
+        self.interval = 1.0 / fps
+        self.steps = steps
+        self.frames = 0
+        self._batch = steps or 64
+        self._events: List[int] = []
+        self._visited = bytearray()
+        self._fixed: Dict[int, int] = {}
+        self._started = False
+        self._next = 0.0
+
+    def __call__(self, event: int) -> None:
+        """Record one event; paint a frame when one is due."""
+        self._events.append(event)
+        if len(self._events) < self._batch:
+            return
+        now = time.perf_counter()
+        if self.steps:
+            if self._next > now:
+                time.sleep(self._next - now)
+            self.flush()
+            self._next = max(now, self._next) + self.interval
+        elif now >= self._next:
+            self.flush()
+            self._next = now + self.interval
+
+    def _centers(self) -> Dict[int, int]:
+        """Center tokens of the cells that never change colour."""
+        w = self.mz.width
+        centers = {f * w + c: P42 for f, c in self.mz.pattern42_coords}
+        for (f, c), token in ((self.mz.exit, EXIT), (self.mz.entry, ENTRY)):
+            centers[f * w + c] = token
+        return centers
+
+    def flush(self) -> None:
+        """Paint the cells touched by the buffered events."""
+        mz = self.mz
+        w = mz.width
+        if not self._started:
+            self.screen.draw(frame_rows(mz, False), self.glyphs)
+            self._visited = bytearray(mz.height * w)
+            self._fixed = self._centers()
+            self._started = True
+        offsets = (-w, 1, w, -1)
+        visited = self._visited
+        touched = set()
+        for event in self._events:
+            i, kind = event >> 3, event & 7
+            touched.add(i)
+            if kind == EVENT_VISIT:
+                visited[i] = 1
+            else:
+                touched.add(i + offsets[kind])
+        self._events.clear()
+        cells, centers = mz.cells, self._fixed
+        changes: List[Tuple[int, int, bytes]] = []
+        for i in touched:
+            f, c = divmod(i, w)
+            walls = cells[i]
+            mid = bytearray(_MID[walls])
+            mid[1] = centers.get(i, VISIT if visited[i] else BLANK)
+            changes.append((2 * f, 3 * c, _TOP[walls]))
+            changes.append((2 * f + 1, 3 * c, bytes(mid)))
+        self.screen.patch(changes, self.glyphs)
+        self.frames += 1
+
+    def finish(self) -> None:
+        """Paint the events still buffered at the end of the run."""
+        if self._events:
+            self.flush()
@@ -1,94 +1,223 @@
-from typing import Optional, Dict
-from maze_app.output.file_maze import generetor_file_maze
-from maze_app.generator.MazeGenerator import MazeGenerator, Wall
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from maze_app.generator.MazeGenerator import MazeGenerator
 from maze_app.themes import classic_theme
 
+WALL_CHAR = "██"
+PATTERN42_COLOR = "\033[35m"
+VISITED_COLOR = "\033[34m"
 
-def render_ascii(
+# Every 2-character block of the frame is one of these tokens. A row is
+# first laid out as a byte string of tokens, then translated to text in
+# one pass. Cell centers are painted in token order, so ENTRY wins over
+# EXIT, PATH and P42. VISIT only appears in animations.
+BLANK, WALL, P42, PATH, EXIT, ENTRY, VISIT = range(7)
+
+# Tokens drawn for a cell on its top line (north wall) and its middle
+# line (west wall, center, east wall), indexed by the cell's wall bits.
+# A cell ``(f, c)`` covers tokens ``3c`` to ``3c + 2`` of frame rows
+# ``2f`` and ``2f + 1``.
+_TOP = [bytes((WALL, WALL if b & 1 else BLANK, WALL)) for b in range(16)]
+_MID = [
+    bytes((WALL if b & 8 else BLANK, BLANK, WALL if b & 2 else BLANK))
+    for b in range(16)
+]
+
+Glyphs = Tuple[Dict[int, str], str]
+
+
+@lru_cache(maxsize=8)
+def _glyphs(theme: Tuple[Tuple[str, str], ...]) -> Glyphs:
+    """Precompute the text of every token transition for a theme.
+
+    Args:
+        theme: Sorted items of a theme dictionary.
+
+    Returns:
+        A ``str.translate`` table keyed by ``previous * 8 + token`` and
+        the reset sequence. A colour escape is only emitted where the
+        colour changes, so a run of equal blocks costs one escape.
+    """
+    colors = dict(theme)
+    res = colors["reset"]
+    palette = (
+        "", colors["wall"], PATTERN42_COLOR, colors["path"],
+        colors["exit"], colors["entry"], VISITED_COLOR,
+    )
+    table: Dict[int, str] = {}
+    for prev in range(len(palette)):
+        for token in range(len(palette)):
+            if token == BLANK:
+                text = "  " if prev == BLANK else f"{res}  "
+            elif token == prev:
+                text = WALL_CHAR
+            elif prev == BLANK:
+                text = f"{palette[token]}{WALL_CHAR}"
+            else:
+                text = f"{res}{palette[token]}{WALL_CHAR}"
+            table[prev * 8 + token] = text
+    return table, res
+
+
+def _encode_run(tokens: Union[bytes, bytearray], glyphs: Glyphs) -> str:
+    """Turn a run of tokens into text with one escape per colour run.
+
+    Each token is paired with the one before it as ``previous * 8 +
+    token``; tokens fit in three bits, so that is a single big-integer
+    multiply-add over the run with no carries between bytes. The pairs
+    are then translated in one ``str.translate`` call. The run starts
+    and ends with the default colour.
+    """
+    table, res = glyphs
+    prev = int.from_bytes(b"\x00" + tokens[:-1], "big")
+    pairs = (prev * 8 + int.from_bytes(tokens, "big")).to_bytes(
+        len(tokens), "big"
+    )
+    line = pairs.decode("latin-1").translate(table)
+    return line + res if tokens[-1] != BLANK else line
+
+
+def _encode(tokens: Union[bytes, bytearray], glyphs: Glyphs) -> str:
+    """Turn a whole row of tokens into one line of the frame."""
+    return _encode_run(tokens, glyphs) + "\n"
+
+
+def theme_glyphs(themes: Dict[str, str]) -> Glyphs:
+    """Return the cached translation table of a theme."""
+    return _glyphs(tuple(sorted(themes.items())))
+
+
+# Per-value tables holding 1 where the north, east or west wall is open,
+# to find the path connectors of a whole row with big-integer ANDs.
+_OPEN_N, _OPEN_E, _OPEN_W = (
+    bytes(0 if b & bit else 1 for b in range(256)) for bit in (1, 2, 8)
+)
+_PATH_CENTERS = bytes.maketrans(b"\x01", bytes((PATH,)))
+
+
+def _add_tokens(slots: bytearray, marks: int, token: int) -> bytes:
+    """Add ``token`` to the tokens of ``slots`` where ``marks`` has a 1.
+
+    Only used on BLANK slots, so the sums never carry between bytes.
+    """
+    total = int.from_bytes(slots, "big") + marks * token
+    return total.to_bytes(len(slots), "big")
+
+
+def iter_frame_rows(
+    mz: MazeGenerator, path: Optional[Iterable[int]] = None
+) -> Iterator[bytes]:
+    """Lay out the maze as rows of tokens, one row at a time.
+
+    Only the current grid row and the path cells are held, so the
+    rows of a maze too large for a full frame can be streamed.
+
+    Args:
+        mz: Maze generator instance.
+        path: Flat indices of the path cells to highlight, if any.
+
+    Yields:
+        Two token strings per maze row, then the bottom border.
+    """
+    w = mz.width
+    cells = sorted(path) if path is not None else []
+    by_row = _pattern42_by_row(mz)
+    for (f, c), token in ((mz.entry, ENTRY), (mz.exit, EXIT)):
+        by_row.setdefault(f, []).append((c, token))
+
+    k = 0
+    zeros = bytes(w)
+    above = zeros
+    for y, row in enumerate(mz.grid):
+        top = bytearray(b"".join(map(_TOP.__getitem__, row)))
+        mid = bytearray(b"".join(map(_MID.__getitem__, row)))
+        marks = zeros
+        if k < len(cells) and cells[k] < (y + 1) * w:
+            on = bytearray(w)
+            while k < len(cells) and cells[k] < (y + 1) * w:
+                on[cells[k] - y * w] = 1
+                k += 1
+            marks, bits = bytes(on), bytes(row)
+            m = int.from_bytes(marks, "big")
+            north = m & int.from_bytes(above, "big") & int.from_bytes(
+                bits.translate(_OPEN_N), "big"
+            )
+            west = m & (m >> 8) & int.from_bytes(
+                bits.translate(_OPEN_W), "big"
+            )
+            east = m & (m << 8) & int.from_bytes(
+                bits.translate(_OPEN_E), "big"
+            )
+            top[1::3] = _add_tokens(top[1::3], north, PATH)
+            mid[0::3] = _add_tokens(mid[0::3], west, PATH)
+            mid[2::3] = _add_tokens(mid[2::3], east, PATH)
+            mid[1::3] = marks.translate(_PATH_CENTERS)
+        above = marks
+        for x, token in sorted(by_row.get(y, ()), key=lambda s: s[1]):
+            if mid[3 * x + 1] != PATH or token > PATH:
+                mid[3 * x + 1] = token
+        yield bytes(top)
+        yield bytes(mid)
+    yield bytes((WALL,)) * (3 * w)
+
+
+def _pattern42_by_row(mz: MazeGenerator) -> Dict[int, List[Tuple[int, int]]]:
+    """Group the '42' cells by row as ``(col, P42)`` pairs."""
+    by_row: Dict[int, List[Tuple[int, int]]] = {}
+    for f, c in mz.pattern42_coords:
+        by_row.setdefault(f, []).append((c, P42))
+    return by_row
+
+
+def frame_rows(mz: MazeGenerator, show_path: bool = True) -> List[bytes]:
+    """Lay out the maze as rows of tokens, two rows per maze row.
+
+    Args:
+        mz: Maze generator instance.
+        show_path: Whether to display the solution path.
+
+    Returns:
+        One token string per line of the frame.
+    """
+    path = mz.solve_cells() if show_path else None
+    return list(iter_frame_rows(mz, path))
+
+
+def build_frame(
     mz: MazeGenerator,
     show_path: bool = True,
     themes: Dict[str, str] = classic_theme(),
-    name_file: Optional[str] = "maze.txt"
-) -> None:
-    """Render the maze in ASCII and save it to a file.
+) -> str:
+    """Build the full ASCII frame of the maze as one string.
 
     Args:
         mz: Maze generator instance.
         show_path: Whether to display the solution path.
         themes: Color theme used for rendering.
-        name_file: Output filename.
+
+    Returns:
+        The frame, every line terminated by a newline.
     """
-    wall_char = "\u2588\u2588"
+    glyphs = theme_glyphs(themes)
+    return "".join(_encode(row, glyphs) for row in frame_rows(mz, show_path))
 
-    path_list = mz.get_solution("way") if show_path else []
-    path_set = set(path_list)
 
-    p42_set = mz.pattern42_coords if mz.pattern42_coords else set()
-    pattern42_color = "\033[35m"
+def render_ascii(
+    mz: MazeGenerator,
+    show_path: bool = True,
+    themes: Dict[str, str] = classic_theme(),
+) -> None:
+    """Render the maze in ASCII.
 
-    w_col = themes["wall"]
-    e_col = themes["entry"]
-    x_col = themes["exit"]
-    p_col = themes["path"]
-    res = themes["reset"]
+    The whole frame is built by ``build_frame`` and sent to
+    ``sys.stdout`` in a single write. Nothing is written to disk; see
+    ``Maze.save`` for the output file.
 
-    for y, row in enumerate(mz.grid):
-        line_h = ""
-        line_w = ""
-        for x, cell_bits in enumerate(row):
-            pos = (y, x)
-            if cell_bits & Wall.NORTH.value:
-                line_h += (f"{w_col}{wall_char}{res}" * 3)
-            else:
-                if pos in path_set and (y - 1, x) in path_set:
-                    line_h += (
-                        f"{w_col}{wall_char}{res}"
-                        f"{p_col}{wall_char}{res}"
-                        f"{w_col}{wall_char}{res}"
-                    )
-                else:
-                    line_h += (
-                        f"{w_col}{wall_char}{res}"
-                        f"  {w_col}{wall_char}{res}"
-                    )
-            if pos == mz.entry:
-                char_center = f"{e_col}{wall_char}{res}"
-            elif pos == mz.exit:
-                char_center = f"{x_col}{wall_char}{res}"
-            elif pos in path_set:
-                char_center = f"{p_col}{wall_char}{res}"
-            elif pos in p42_set:
-                char_center = f"{pattern42_color}{wall_char}{res}"
-            else:
-                char_center = "  "
-            if cell_bits & Wall.WEST.value:
-                line_w += f"{w_col}{wall_char}{res}"
-            else:
-                line_w += (
-                    f"{p_col}{wall_char}{res}"
-                    if (pos in path_set and (y, x - 1) in path_set)
-                    else "  "
-                )
-            line_w += char_center
-            if cell_bits & Wall.EAST.value:
-                line_w += f"{w_col}{wall_char}{res}"
-            else:
-                line_w += (
-                    f"{p_col}{wall_char}{res}"
-                    if (pos in path_set and (y, x + 1) in path_set)
-                    else "  "
-                )
-        print(line_h)
-        print(line_w)
-    print(f"{w_col}{wall_char}{res}" * 3 * len(mz.grid[0]))
-    sol = mz.get_solution()
-    if not isinstance(sol, str):
-        sol = mz.print_coordinates(sol) if sol else ""
-    final_name = name_file if name_file is not None else "maze.txt"
-    generetor_file_maze(
-        mz.grid,
-        mz.entry,
-        mz.exit,
-        sol,
-        final_name
-    )
+    Args:
+        mz: Maze generator instance.
+        show_path: Whether to display the solution path.
+        themes: Color theme used for rendering.
+    """
+    sys.stdout.write(build_frame(mz, show_path, themes))
+    sys.stdout.flush()
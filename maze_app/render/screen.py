@@ -0,0 +1,136 @@
+import shutil
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+from maze_app.render.render import Glyphs, _encode, _encode_run
+
+# Reset the scrolling region, move home and erase the screen.
+CLEAR = "\033[r\033[H\033[2J"
+
+# Unchanged tokens between two changed runs are re-sent instead of
+# moving the cursor when the gap is shorter than this, since a cursor
+# move costs about as many bytes as a few blocks.
+_MERGE_GAP = 4
+
+
+def _changed_runs(old: bytes, new: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, stop)`` ranges of the tokens that differ."""
+    start = stop = -1
+    for x, (a, b) in enumerate(zip(old, new)):
+        if a == b:
+            continue
+        if start < 0:
+            start = x
+        elif x - stop >= _MERGE_GAP:
+            yield start, stop
+            start = x
+        stop = x + 1
+    if start >= 0:
+        yield start, stop
+
+
+class Screen:
+    """Terminal frame model that repaints only what changed.
+
+    The first frame, and any frame after the terminal was resized or
+    the theme changed, is drawn in full from a cleared screen. Later
+    frames of the same shape only emit the runs of tokens that differ
+    from the last one, each preceded by a cursor-positioning escape.
+
+    The lines below the maze become the scrolling region, so menus and
+    messages printed there never move the maze and the positions stay
+    valid. When the maze does not fit in the terminal, every frame is
+    drawn in full and the region is left alone.
+
+    Each draw goes out in a single write.
+    """
+    def __init__(self, out: TextIO = sys.stdout, reserve: int = 8):
+        """Draw on ``out``, keeping ``reserve`` lines for the menu."""
+        self.out = out
+        self.reserve = reserve
+        self._rows: List[bytes] = []
+        self._glyphs: Optional[Glyphs] = None
+        self._size: Tuple[int, int] = (0, 0)
+
+    def _fits(self, rows: List[bytes]) -> Tuple[bool, int]:
+        """Tell whether ``rows`` fit on screen, with the screen height."""
+        if not self.out.isatty():
+            return False, 0
+        columns, lines = shutil.get_terminal_size()
+        width = 2 * max(map(len, rows), default=0)
+        return len(rows) + self.reserve <= lines and width <= columns, lines
+
+    def clear(self) -> None:
+        """Clear the screen and forget the last frame."""
+        self._rows = []
+        self.out.write(CLEAR)
+        self.out.flush()
+
+    def draw(self, rows: List[bytes], glyphs: Glyphs) -> int:
+        """Show a frame given as token rows, repainting what changed.
+
+        Args:
+            rows: Token rows, as built by ``frame_rows``.
+            glyphs: Translation table of the theme.
+
+        Returns:
+            The number of characters written.
+        """
+        fits, lines = self._fits(rows)
+        below = f"\033[{len(rows) + 1};1H"
+        if (
+            fits and glyphs is self._glyphs
+            and self._size == (len(rows), lines)
+            and list(map(len, rows)) == list(map(len, self._rows))
+        ):
+            parts = []
+            for y, (old, new) in enumerate(zip(self._rows, rows)):
+                if old == new:
+                    continue
+                for start, stop in _changed_runs(old, new):
+                    parts.append(
+                        f"\033[{y + 1};{2 * start + 1}H"
+                        + _encode_run(new[start:stop], glyphs)
+                    )
+            parts.append(below + "\033[J")
+        else:
+            parts = [CLEAR]
+            parts.extend(_encode(row, glyphs) for row in rows)
+            if fits:
+                parts.append(f"\033[{len(rows) + 1};{lines}r{below}")
+        self._rows = list(rows) if fits else []
+        self._glyphs = glyphs
+        self._size = (len(rows), lines)
+        text = "".join(parts)
+        self.out.write(text)
+        self.out.flush()
+        return len(text)
+
+    def patch(
+        self, changes: Iterable[Tuple[int, int, bytes]], glyphs: Glyphs
+    ) -> int:
+        """Repaint runs of tokens of the frame on screen.
+
+        Unlike ``draw``, nothing is compared: each ``(row, start,
+        tokens)`` is written into the last frame and sent as is. Does
+        nothing unless the last frame fitted the terminal and used the
+        same theme.
+
+        Returns:
+            The number of characters written.
+        """
+        if not self._rows or glyphs is not self._glyphs:
+            return 0
+        parts = []
+        for y, start, tokens in changes:
+            row = self._rows[y]
+            self._rows[y] = row[:start] + tokens + row[start + len(tokens):]
+            parts.append(
+                f"\033[{y + 1};{2 * start + 1}H" + _encode_run(tokens, glyphs)
+            )
+        if not parts:
+            return 0
+        parts.append(f"\033[{len(self._rows) + 1};1H")
+        text = "".join(parts)
+        self.out.write(text)
+        self.out.flush()
+        return len(text)
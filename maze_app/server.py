@@ -0,0 +1,382 @@
+import argparse
+import asyncio
+import io
+import json
+import random
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from pydantic import ValidationError
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output.binary_maze import write_binary
+from maze_app.output.file_maze import write_hex_maze
+from parse.config_model import MazeConfig
+from parse.config_parser import parse_config
+
+# Query parameters accepted by the maze endpoints; they take the values
+# and checks of the configuration file keys of the same name.
+PARAMS = (
+    "width", "height", "entry", "exit", "perfect", "seed", "algorithm",
+    "solver", "loop_density", "longest_path",
+)
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+_JSON = "application/json"
+_CONTENT_TYPES = {
+    "hex": "text/plain; charset=ascii",
+    "binary": "application/octet-stream",
+}
+
+
+class MazeResult(NamedTuple):
+    """A generated and solved maze in both file formats.
+
+    Attributes:
+        hex: The maze as written by ``generetor_file_maze``.
+        binary: The maze as written by ``write_binary_maze``.
+        entry, exit_: Where the maze was opened, which differs from
+            the config with ``longest_path``.
+        solution: Direction string of the solution, empty if none.
+        nodes_expanded: Cells the solver expanded.
+        seconds: Time the worker spent on it.
+    """
+
+    hex: bytes
+    binary: bytes
+    entry: Tuple[int, int]
+    exit_: Tuple[int, int]
+    solution: str
+    nodes_expanded: int
+    seconds: float
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the result, as charged to the cache."""
+        return len(self.hex) + len(self.binary) + len(self.solution)
+
+
+def build_maze(config: MazeConfig) -> MazeResult:
+    """Generate, solve and encode one maze inside a worker process.
+
+    A seeded config gets its own ``random.Random``, so the result only
+    depends on the config, like in ``maze_app.bulk``.
+    """
+    start = time.perf_counter()
+    seed = config.seed
+    generator = MazeGenerator(
+        config.height, config.width, config.entry, config.exit_,
+        config.perfect, seed, config.algorithm, config.solver,
+        rng=random.Random(seed) if seed is not None else None,
+        loop_density=config.loop_density,
+        longest_path=config.longest_path,
+    )
+    generator.generate()
+    way = generator.get_solution()
+    way = way if isinstance(way, str) else ""
+    hex_file, binary_file = io.BytesIO(), io.BytesIO()
+    write_hex_maze(
+        hex_file, generator.grid, generator.entry, generator.exit, way
+    )
+    write_binary(binary_file, generator, way)
+    return MazeResult(
+        hex_file.getvalue(), binary_file.getvalue(), generator.entry,
+        generator.exit, way,
+        generator.nodes_expanded, time.perf_counter() - start,
+    )
+
+
+class ResultCache:
+    """Least recently used cache of ``MazeResult`` under a byte budget.
+
+    Every entry is charged ``MazeResult.size``; the oldest entries are
+    dropped until the total fits ``max_bytes``. A result larger than
+    the whole budget is not stored.
+
+    Attributes:
+        hits, misses, evictions (int): Lookup and eviction counts.
+        bytes (int): Bytes currently held.
+    """
+    def __init__(self, max_bytes: int):
+        """Create an empty cache holding at most ``max_bytes``."""
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, MazeResult]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[MazeResult]:
+        """Return the result under ``key`` and mark it as recently used."""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: MazeResult) -> None:
+        """Store ``result``, evicting the least recently used entries."""
+        if result.size > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = result
+        self.bytes += result.size
+        while self.bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old.size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return the counters and the current occupancy."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class HTTPError(Exception):
+    """An error answered with ``status`` and a JSON message."""
+    def __init__(self, status: int, message: str):
+        """Store the status code next to the message."""
+        super().__init__(message)
+        self.status = status
+
+
+def maze_config(query: Dict[str, str]) -> MazeConfig:
+    """Validate query parameters like the keys of a configuration file.
+
+    On top of the file checks, the entry and exit must be ``row,col``
+    cells of the grid, as the generator reads them.
+
+    Raises:
+        HTTPError: 400 on an unknown, missing or invalid parameter.
+    """
+    unknown = set(query) - set(PARAMS)
+    if unknown:
+        raise HTTPError(400, f"unknown parameter: {sorted(unknown)[0]}")
+    raw = {key.upper(): value for key, value in query.items()}
+    raw.setdefault("PERFECT", "true")
+    raw["OUTPUT_FILE"] = "maze.txt"
+    try:
+        config = MazeConfig(**parse_config(raw))
+    except ValidationError as e:
+        message = "; ".join(
+            error["msg"].removeprefix("Value error, ") for error in e.errors()
+        )
+        raise HTTPError(400, message) from None
+    except ValueError as e:
+        raise HTTPError(400, str(e)) from None
+    for name, (f, c) in (("entry", config.entry), ("exit", config.exit_)):
+        if not (0 <= f < config.height and 0 <= c < config.width):
+            raise HTTPError(400, f"{name} ({f},{c}) is outside the "
+                                 f"{config.height}x{config.width} grid")
+    return config
+
+
+class MazeServer:
+    """Asyncio HTTP front end that generates mazes in a process pool.
+
+    Endpoints, all ``GET`` with the parameters of ``PARAMS``:
+
+    * ``/generate``: generate a maze and describe it in JSON;
+    * ``/solve``: the solution of the maze, in JSON;
+    * ``/maze``: the maze file, ``format=hex`` (default) or ``binary``;
+    * ``/stats``: cache counters, and ``shared`` requests that waited
+      for an identical job already running.
+
+    Generation runs in ``pool`` so the event loop only parses requests
+    and copies bytes. Seeded requests are deterministic, so they are
+    served from a ``ResultCache`` keyed by the whole validated config,
+    and concurrent requests for the same config share one job.
+    Without a seed every request gets a new maze.
+    """
+    def __init__(
+        self,
+        pool: Executor,
+        cache_bytes: int = 64 << 20,
+        max_cells: int = 4_000_000,
+    ):
+        """Serve mazes of at most ``max_cells`` cells built in ``pool``."""
+        self.pool = pool
+        self.cache = ResultCache(cache_bytes)
+        self.max_cells = max_cells
+        self.shared = 0
+        self._pending: Dict[str, "asyncio.Future[MazeResult]"] = {}
+
+    async def maze(self, config: MazeConfig) -> Tuple[MazeResult, bool]:
+        """Return the maze of ``config`` and whether it was reused."""
+        if config.width * config.height > self.max_cells:
+            raise HTTPError(413, f"mazes are limited to {self.max_cells} "
+                                 "cells")
+        if config.seed is None:
+            return await self._build(config), False
+        key = config.model_dump_json()
+        result = self.cache.get(key)
+        if result is not None:
+            return result, True
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.shared += 1
+            return await asyncio.shield(pending), True
+        future = asyncio.ensure_future(self._build(config))
+        self._pending[key] = future
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            del self._pending[key]
+        self.cache.put(key, result)
+        return result, False
+
+    async def _build(self, config: MazeConfig) -> MazeResult:
+        """Run ``build_maze`` in the pool."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.pool, build_maze, config)
+        except ValueError as e:
+            raise HTTPError(400, f"generation failed: {e}") from None
+
+    async def respond(self, target: str) -> Tuple[int, str, bytes]:
+        """Answer a ``GET`` of ``target`` with status, type and body."""
+        url = urlsplit(target)
+        query: Dict[str, str] = {}
+        for key, values in parse_qs(url.query).items():
+            if len(values) > 1:
+                raise HTTPError(400, f"repeated parameter: {key}")
+            query[key] = values[0]
+        if url.path == "/stats":
+            return 200, _JSON, _json(
+                {**self.cache.stats(), "shared": self.shared}
+            )
+        if url.path == "/maze":
+            fmt = query.pop("format", "hex")
+            if fmt not in _CONTENT_TYPES:
+                raise HTTPError(400, "format must be hex or binary")
+            result, _ = await self.maze(maze_config(query))
+            body = result.hex if fmt == "hex" else result.binary
+            return 200, _CONTENT_TYPES[fmt], body
+        if url.path == "/generate":
+            config = maze_config(query)
+            result, cached = await self.maze(config)
+            return 200, _JSON, _json({
+                "width": config.width,
+                "height": config.height,
+                "entry": result.entry,
+                "exit": result.exit_,
+                "perfect": config.perfect,
+                "longest_path": config.longest_path,
+                "seed": config.seed,
+                "algorithm": config.algorithm,
+                "solver": config.solver,
+                "solution_length": len(result.solution),
+                "bytes": {"hex": len(result.hex),
+                          "binary": len(result.binary)},
+                "seconds": result.seconds,
+                "cached": cached,
+            })
+        if url.path == "/solve":
+            config = maze_config(query)
+            result, cached = await self.maze(config)
+            return 200, _JSON, _json({
+                "solver": config.solver,
+                "solution": result.solution,
+                "length": len(result.solution),
+                "nodes_expanded": result.nodes_expanded,
+                "cached": cached,
+            })
+        raise HTTPError(404, f"no such endpoint: {url.path}")
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one request and close the connection.
+
+        Any unexpected error, such as a crash in a worker, is printed
+        and answered with 500 so the client always gets a response.
+        """
+        head = False
+        try:
+            try:
+                line = await reader.readline()
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+                while (await reader.readline()).strip():
+                    pass
+            except ValueError:
+                raise HTTPError(400, "malformed request") from None
+            head = method == "HEAD"
+            if method not in ("GET", "HEAD"):
+                raise HTTPError(405, f"method {method} not allowed")
+            status, content_type, body = await self.respond(target)
+        except HTTPError as e:
+            status, content_type = e.status, _JSON
+            body = _json({"error": str(e)})
+        except Exception as e:
+            traceback.print_exc()
+            status, content_type = 500, _JSON
+            body = _json({"error": f"internal error: {type(e).__name__}"})
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1")
+        )
+        if not head:
+            writer.write(body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        """Listen on ``host``:``port`` until cancelled."""
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            print(f"Serving mazes on http://{host}:{port}/")
+            await server.serve_forever()
+
+
+def _json(data: Any) -> bytes:
+    """Encode a response body as JSON."""
+    return json.dumps(data).encode() + b"\n"
+
+
+def main() -> None:
+    """Run the maze server until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Serve mazes over HTTP."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8042)
+    parser.add_argument("--workers", type=int, metavar="K",
+                        help="generator processes (default: CPU count)")
+    parser.add_argument("--cache-mb", type=float, default=64,
+                        help="result cache budget in MB (default: 64)")
+    parser.add_argument("--max-cells", type=int, default=4_000_000,
+                        help="largest maze served (default: 4000000)")
+    args = parser.parse_args()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        server = MazeServer(
+            pool, int(args.cache_mb * 2**20), args.max_cells
+        )
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            sys.stderr.write(f"Error: {e.strerror}\n")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+from typing import List
+import numpy as np
+from numpy.typing import NDArray
+from maze_app.generator.MazeGenerator import MazeGenerator, PackedCells
+
+
+def cell_array(generator: MazeGenerator) -> NDArray[np.uint8]:
+    """Return the wall masks as a ``height`` x ``width`` array.
+
+    A ``bytearray`` grid is wrapped without copying; ``PackedCells``
+    are unpacked with two vectorized nibble extractions.
+    """
+    cells = generator.cells
+    shape = (generator.height, generator.width)
+    if isinstance(cells, PackedCells):
+        packed = np.frombuffer(cells.buffer, dtype=np.uint8)
+        flat = np.empty(2 * packed.size, dtype=np.uint8)
+        flat[0::2] = packed & 15
+        flat[1::2] = packed >> 4
+        return flat[:len(cells)].reshape(shape)
+    return np.frombuffer(cells, dtype=np.uint8).reshape(shape)
+
+
+def _first(mask: NDArray[np.bool_]) -> str:
+    """Format the first ``True`` position of a 2-D mask as ``(row,col)``."""
+    f, c = np.argwhere(mask)[0]
+    return f"({f},{c})"
+
+
+def _components(
+    size: int, u: NDArray[np.intp], v: NDArray[np.intp]
+) -> NDArray[np.intp]:
+    """Label the connected components of a graph given by its edges.
+
+    Each round points the larger label of every edge at the smaller one
+    and halves the pointer chains twice. Labels only decrease, and the
+    loop stops once both ends of every edge share a label, which then
+    names the component. Every round is a few whole-array passes, and
+    few rounds are needed in practice.
+    """
+    labels = np.arange(size)
+    while True:
+        lu, lv = labels[u], labels[v]
+        split = lu != lv
+        if not split.any():
+            return labels
+        lo = np.minimum(lu[split], lv[split])
+        hi = np.maximum(lu[split], lv[split])
+        np.minimum.at(labels, hi, lo)
+        labels = labels[labels[labels]]
+
+
+def maze_problems(generator: MazeGenerator) -> List[str]:
+    """Check a generated maze with whole-array NumPy operations.
+
+    The checks are:
+
+    * neighbouring cells agree on each shared wall, by comparing the
+      grid with itself shifted one column and one row;
+    * the outer border is closed;
+    * the '42' cells are fully closed;
+    * every other cell is reachable from the entry;
+    * a perfect maze has exactly ``cells - 1`` open edges, which for a
+      connected graph means it is a tree.
+
+    Args:
+        generator: Generator holding the maze.
+
+    Returns:
+        One message per failed check; empty if the maze is valid.
+    """
+    grid = cell_array(generator)
+    h, w = grid.shape
+    problems: List[str] = []
+
+    east_open = (grid[:, :-1] & 2) == 0
+    west_open = (grid[:, 1:] & 8) == 0
+    south_open = (grid[:-1] & 4) == 0
+    north_open = (grid[1:] & 1) == 0
+    if (east_open != west_open).any():
+        problems.append(
+            "east/west walls disagree at "
+            + _first(east_open != west_open)
+        )
+    if (south_open != north_open).any():
+        problems.append(
+            "south/north walls disagree at "
+            + _first(south_open != north_open)
+        )
+
+    for name, edge, bit, at in (
+        ("north", grid[0], 1, lambda i: (0, i)),
+        ("south", grid[-1], 4, lambda i: (h - 1, i)),
+        ("west", grid[:, 0], 8, lambda i: (i, 0)),
+        ("east", grid[:, -1], 2, lambda i: (i, w - 1)),
+    ):
+        open_at = np.flatnonzero((edge & bit) == 0)
+        if open_at.size:
+            f, c = at(int(open_at[0]))
+            problems.append(f"{name} border is open at ({f},{c})")
+
+    reserved = np.flatnonzero(
+        np.frombuffer(generator.pattern42, dtype=np.uint8)
+    )
+    flat = grid.reshape(-1)
+    if reserved.size and (flat[reserved] != 15).any():
+        f, c = divmod(int(reserved[flat[reserved] != 15][0]), w)
+        problems.append(f"'42' cell ({f},{c}) is not fully closed")
+    if problems:
+        return problems
+
+    # With the border closed and the walls symmetric, every open east or
+    # south wall is an edge to cell ``i + 1`` or ``i + w``.
+    east = np.flatnonzero((flat & 2) == 0)
+    south = np.flatnonzero((flat & 4) == 0)
+    u = np.concatenate((east, south))
+    v = np.concatenate((east + 1, south + w))
+    free = h * w - reserved.size
+    labels = _components(h * w, u, v)
+    outside = np.ones(h * w, dtype=bool)
+    outside[reserved] = False
+    entry = generator.entry[0] * w + generator.entry[1]
+    outside &= labels != labels[entry]
+    if outside.any():
+        f, c = divmod(int(np.flatnonzero(outside)[0]), w)
+        problems.append(f"cell ({f},{c}) is not reachable from the entry")
+    if generator.perfect and u.size != free - 1:
+        problems.append(
+            f"perfect maze has {u.size} open edges, expected {free - 1}"
+        )
+    return problems
+
+
+def verify_maze(generator: MazeGenerator) -> None:
+    """Raise if ``maze_problems`` finds anything wrong with the maze.
+
+    Raises:
+        ValueError: With every problem found.
+    """
+    problems = maze_problems(generator)
+    if problems:
+        raise ValueError("Invalid maze: " + "; ".join(problems))
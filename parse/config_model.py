@@ -11,7 +11,9 @@ class MazeConfig(BaseModel):
     """Configuration model for maze generation and solving.
 
     Validates dimensions, entry and exit positions, algorithm selection,
-    solver choice, and optional seed values.
+    solver choice, and optional seed and loop density values. With
+    ``longest_path`` the generator replaces the entry and exit by the
+    ends of the longest path of the maze.
     """
 
     width: int = Field(ge=2)
@@ -21,6 +23,8 @@ class MazeConfig(BaseModel):
     output_file: str
     seed: int | None = None
     perfect: bool = True
+    loop_density: float | None = Field(default=None, ge=0, le=1)
+    longest_path: bool = False
     algorithm: str = "prim"
     solver: str = "bfs"
 
@@ -1,4 +1,5 @@
 from typing import Any, Dict
+from maze_app.generator.MazeGenerator import ALGORITHMS, SOLVERS
 
 
 def read_config(path: str) -> Dict[str, str]:
@@ -24,7 +25,7 @@ def read_config(path: str) -> Dict[str, str]:
             check = [
                 "WIDTH", "HEIGHT", "ENTRY", "EXIT",
                 "ALGORITHM", "SOLVER", "OUTPUT_FILE",
-                "PERFECT", "SEED"
+                "PERFECT", "SEED", "LOOP_DENSITY", "LONGEST_PATH"
                 ]
             checking = set()
             for line in file:
@@ -54,7 +55,7 @@ def parse_value(key: str, value: str) -> Any:
         value: Raw string value from the config file.
 
     Returns:
-        The parsed value, converted to int, tuple, bool,
+        The parsed value, converted to int, float, tuple, bool,
         or str depending on the key.
 
     Raises:
@@ -65,24 +66,37 @@ def parse_value(key: str, value: str) -> Any:
     if key in ("ENTRY", "EXIT"):
         return tuple(map(int, value.split(",")))
     if key == "SEED":
-        return int(value) if value.strip() else None
-    if key == "PERFECT":
+        if not value.strip():
+            return None
+        seed = int(value)
+        if not -2**63 <= seed < 2**63:
+            raise ValueError("SEED must fit in a signed 64-bit integer")
+        return seed
+    if key == "LOOP_DENSITY":
+        return float(value) if value.strip() else None
+    if key in ("PERFECT", "LONGEST_PATH"):
         v = value.strip().lower()
         if v in ("true", "yes", "y", "t", "1"):
             return True
         if v in ("false", "no", "n", "f", "0"):
             return False
-        raise ValueError(f"Invalid boolean for PERFECT: '{value}'")
+        raise ValueError(f"Invalid boolean for {key}: '{value}'")
     if key == "ALGORITHM":
         v = value.strip().lower()
-        if v in ("prim", "dfs"):
+        if v in ALGORITHMS:
             return v
-        raise ValueError(f"Invalid ALGORITHM: '{value}' (use prim or dfs)")
+        raise ValueError(
+            f"Invalid ALGORITHM: '{value}' "
+            f"(use one of: {', '.join(ALGORITHMS)})"
+        )
     if key == "SOLVER":
         v = value.strip().lower()
-        if v in ("bfs", "dfs"):
+        if v in SOLVERS:
             return v
-        raise ValueError(f"Invalid SOLVER: '{value}' (use bfs or dfs)")
+        raise ValueError(
+            f"Invalid SOLVER: '{value}' "
+            f"(use one of: {', '.join(SOLVERS)})"
+        )
     return value
 
 
@@ -0,0 +1,70 @@
+"""Every registered generation algorithm must carve a perfect maze
+around the reserved '42' cells.
+"""
+
+import pytest
+from maze_app.generator.MazeGenerator import ALGORITHMS, MazeGenerator
+
+HEIGHT, WIDTH = 17, 21
+
+
+def generated(algorithm, seed):
+    """A perfect maze large enough to hold the '42' pattern."""
+    generator = MazeGenerator(
+        HEIGHT, WIDTH, (0, 0), (HEIGHT - 1, WIDTH - 1), True, seed,
+        algorithm,
+    )
+    generator.generate()
+    return generator
+
+
+def passages(generator):
+    """Open walls between neighbouring cells, each counted once."""
+    w = generator.width
+    found = []
+    for i, walls in enumerate(generator.cells):
+        f, c = divmod(i, w)
+        if not walls & 2 and c + 1 < w:
+            found.append((i, i + 1))
+        if not walls & 4 and f + 1 < generator.height:
+            found.append((i, i + w))
+    return found
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+@pytest.mark.parametrize("seed", (0, 7))
+def test_perfect_maze(algorithm, seed):
+    """Every open cell is reached through exactly one spanning tree."""
+    generator = generated(algorithm, seed)
+    h, w, cells = generator.height, generator.width, generator.cells
+    for i, walls in enumerate(cells):
+        f, c = divmod(i, w)
+        assert (f > 0 or walls & 1) and (c < w - 1 or walls & 2)
+        assert (f < h - 1 or walls & 4) and (c > 0 or walls & 8)
+        if c < w - 1:
+            assert bool(walls & 2) == bool(cells[i + 1] & 8)
+        if f < h - 1:
+            assert bool(walls & 4) == bool(cells[i + w] & 1)
+    dist = generator.distance_field().dist
+    open_cells = [i for i in range(h * w) if not generator.pattern42[i]]
+    assert all(dist[i] >= 0 for i in open_cells)
+    assert len(passages(generator)) == len(open_cells) - 1
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_42_cells_stay_closed(algorithm):
+    """The 18 cells of the '42' keep all walls and stay unreachable."""
+    generator = generated(algorithm, 3)
+    reserved = [i for i, b in enumerate(generator.pattern42) if b]
+    assert len(reserved) == 18
+    assert {divmod(i, WIDTH) for i in reserved} == generator.pattern42_coords
+    assert all(generator.cells[i] == 15 for i in reserved)
+    dist = generator.distance_field().dist
+    assert all(dist[i] < 0 for i in reserved)
+
+
+def test_small_maze_has_no_42():
+    """Below 15x15 there is no room for the pattern."""
+    generator = MazeGenerator(10, 14, (0, 0), (9, 13), True, 1, "kruskal")
+    generator.generate()
+    assert not any(generator.pattern42)
@@ -0,0 +1,81 @@
+import re
+import pytest
+from maze_app.generator.MazeGenerator import MazeGenerator
+from maze_app.output import binary_maze
+from maze_app.output.binary_maze import (
+    load_binary_maze, write_binary_maze,
+)
+
+
+@pytest.fixture
+def amz(tmp_path):
+    """A solved 15x15 maze saved in the binary format."""
+    generator = MazeGenerator(15, 15, (0, 0), (14, 14), True, 3)
+    generator.generate()
+    way = generator.get_solution()
+    path = tmp_path / "maze.amz"
+    write_binary_maze(generator, way, str(path))
+    return path, generator, way
+
+
+def set_cell(path, i, value):
+    """Overwrite the wall mask of flat cell ``i`` in a binary file."""
+    data = bytearray(path.read_bytes())
+    k = binary_maze._HEADER.size + len("prim") + i // 2
+    if i & 1:
+        data[k] = (data[k] & 15) | value << 4
+    else:
+        data[k] = (data[k] & 240) | value
+    path.write_bytes(bytes(data))
+
+
+def test_round_trip(amz):
+    """A valid file loads with the same cells and solution."""
+    path, generator, way = amz
+    loaded, loaded_way = load_binary_maze(str(path))
+    assert loaded_way == way
+    assert bytes(loaded.cells[0:225]) == bytes(generator.cells)
+
+
+@pytest.mark.parametrize("cell, clear, message", [
+    (3, 1, "cell (0,3): north wall of the border is open"),
+    (15, 8, "cell (1,0): west wall of the border is open"),
+    (29, 2, "cell (1,14): east wall of the border is open"),
+    (220, 4, "cell (14,10): south wall of the border is open"),
+])
+def test_open_border_is_rejected(amz, cell, clear, message):
+    """An edited border would let the solvers leave the grid."""
+    path, generator, _ = amz
+    set_cell(path, cell, generator.cells[cell] & ~clear)
+    with pytest.raises(ValueError, match=re.escape(message)):
+        load_binary_maze(str(path))
+
+
+def test_mismatched_walls_are_rejected(amz):
+    """A wall open on one side only is reported."""
+    path, generator, _ = amz
+    cell = next(
+        i for i in range(16, 200) if generator.cells[i] & 2
+        and generator.cells[i] != 15
+    )
+    set_cell(path, cell, generator.cells[cell] & ~2)
+    with pytest.raises(ValueError, match="does not match"):
+        load_binary_maze(str(path))
+
+
+def test_truncated_file_is_rejected(amz):
+    """A file cut inside the cells is refused before any check."""
+    path, _, _ = amz
+    path.write_bytes(path.read_bytes()[:60])
+    with pytest.raises(ValueError, match="truncated"):
+        load_binary_maze(str(path))
+
+
+def test_out_of_range_seed_leaves_no_file(tmp_path):
+    """A seed the header cannot hold raises without a partial file."""
+    generator = MazeGenerator(15, 15, (0, 0), (14, 14), True, 2**64)
+    generator.generate()
+    path = tmp_path / "maze.amz"
+    with pytest.raises(ValueError, match="header"):
+        write_binary_maze(generator, "", str(path))
+    assert not path.exists()
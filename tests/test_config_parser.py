@@ -0,0 +1,22 @@
+import pytest
+from parse.config_parser import parse_config
+
+CONFIG = {
+    "WIDTH": "20", "HEIGHT": "20", "ENTRY": "0,0", "EXIT": "19,19",
+    "OUTPUT_FILE": "out.amz", "PERFECT": "true",
+}
+
+
+@pytest.mark.parametrize("seed", [
+    "99999999999999999999", str(2**63), str(-2**63 - 1),
+])
+def test_seed_outside_int64_is_rejected(seed):
+    """The binary format stores the seed in a signed 64-bit field."""
+    with pytest.raises(ValueError, match="64-bit"):
+        parse_config({**CONFIG, "SEED": seed})
+
+
+@pytest.mark.parametrize("seed", [str(2**63 - 1), str(-2**63), "0"])
+def test_seed_inside_int64_is_kept(seed):
+    """The extreme values that fit are accepted unchanged."""
+    assert parse_config({**CONFIG, "SEED": seed})["seed"] == int(seed)
@@ -0,0 +1,68 @@
+from maze_app.disk_cache import MazeCache
+from maze_app.generator.MazeGenerator import MazeGenerator
+
+
+def longest_path_maze():
+    """A 15x15 maze whose configured entry sits where the '42' would
+    go first, so generation has to shift the pattern."""
+    return MazeGenerator(
+        15, 15, (5, 4), (14, 14), True, 11, longest_path=True
+    )
+
+
+def snapshot(generator):
+    """Everything a cache hit must reproduce."""
+    return (
+        bytes(generator.cells[0:len(generator.cells)]),
+        bytes(generator.pattern42),
+        generator.entry,
+        generator.exit,
+        generator.get_solution(),
+    )
+
+
+def test_longest_path_hit_matches_miss(tmp_path):
+    """A hit restores the '42' cells where generation reserved them."""
+    cache = MazeCache(str(tmp_path))
+    built = longest_path_maze()
+    assert not cache.fetch(built)
+    built.generate()
+    built.solve_cells()
+    cache.store(built)
+    assert built.entry != (5, 4)
+
+    loaded = longest_path_maze()
+    assert cache.fetch(loaded)
+    assert snapshot(loaded) == snapshot(built)
+    assert loaded.configured_ends == ((5, 4), (14, 14))
+
+
+def test_hit_after_another_maze(tmp_path):
+    """A generator reused for another seed still gets the right hit."""
+    cache = MazeCache(str(tmp_path))
+    built = longest_path_maze()
+    built.generate()
+    cache.store(built)
+    expected = snapshot(built)
+
+    reused = longest_path_maze()
+    reused.seed = 12
+    reused.generate()
+    reused.seed = 11
+    assert cache.fetch(reused)
+    assert snapshot(reused) == expected
+
+
+def test_unstorable_seed_is_skipped(tmp_path):
+    """A seed beyond the binary header is not cached, and no temporary
+    file is left behind."""
+    cache = MazeCache(str(tmp_path))
+    generator = MazeGenerator(15, 15, (0, 0), (14, 14), True, 2**64)
+    generator.generate()
+    generator.solve_cells()
+    cache.store(generator)
+    assert cache.stats["stores"] == 0
+    assert not cache.fetch(generator)
+    assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [
+        "stats.json"
+    ]
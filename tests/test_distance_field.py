@@ -0,0 +1,143 @@
+"""Distance fields must match a plain breadth-first search."""
+
+from collections import deque
+import pytest
+from maze_app.generator.MazeGenerator import ALGORITHMS, MazeGenerator
+
+
+def maze(perfect, seed, height=16, width=18, algorithm="wilson"):
+    """A seeded maze, with loops when not ``perfect``."""
+    generator = MazeGenerator(
+        height, width, (0, 0), (height - 1, width - 1), perfect, seed,
+        algorithm,
+    )
+    generator.generate()
+    return generator
+
+
+def brute_distances(generator, source):
+    """Steps from ``source`` to every (row, col), walking the grid rows."""
+    grid = generator.grid
+    dist = {source: 0}
+    queue = deque([source])
+    while queue:
+        f, c = queue.popleft()
+        for wall, nf, nc in ((1, f - 1, c), (2, f, c + 1),
+                             (4, f + 1, c), (8, f, c - 1)):
+            if not grid[f][c] & wall and (nf, nc) not in dist:
+                dist[nf, nc] = dist[f, c] + 1
+                queue.append((nf, nc))
+    return dist
+
+
+@pytest.mark.parametrize("perfect", (True, False))
+@pytest.mark.parametrize("source", ((0, 0), (9, 2), (15, 17)))
+def test_distances_match_bfs(perfect, source):
+    """Every cell gets its breadth-first distance, -1 if unreachable."""
+    generator = maze(perfect, 1)
+    field = generator.distance_field(source)
+    expected = brute_distances(generator, source)
+    w = generator.width
+    assert field.source == source[0] * w + source[1]
+    for i, d in enumerate(field.dist):
+        assert d == expected.get(divmod(i, w), -1)
+    assert sorted(field.order) == sorted(
+        f * w + c for f, c in expected
+    )
+    ordered = [field.dist[i] for i in field.order]
+    assert ordered == sorted(ordered)
+    assert field.dist[field.farthest()] == max(expected.values())
+
+
+@pytest.mark.parametrize("perfect", (True, False))
+def test_paths_follow_parents(perfect):
+    """Each path runs from the source to its target in dist + 1 cells,
+    one open wall at a time."""
+    generator = maze(perfect, 2)
+    field = generator.distance_field()
+    w = generator.width
+    moves = {-w: 1, 1: 2, w: 4, -1: 8}
+    for target, path in enumerate(field.paths(range(len(field.dist)))):
+        if field.dist[target] < 0:
+            assert path is None
+            continue
+        assert len(path) == field.dist[target] + 1
+        assert path[0] == field.source and path[-1] == target
+        assert all(
+            not generator.cells[a] & moves[b - a]
+            for a, b in zip(path, path[1:])
+        )
+
+
+def test_42_cells_are_unreachable():
+    """Reserved cells keep a distance and parent of -1."""
+    generator = maze(True, 3)
+    field = generator.distance_field()
+    reserved = [i for i, b in enumerate(generator.pattern42) if b]
+    assert reserved
+    for i in reserved:
+        assert field.dist[i] == -1 and field.parent[i] == -1
+        assert field.path(i) is None
+
+
+def test_paths_to_matches_solver():
+    """``paths_to`` gives the BFS solution for the exit and None for a
+    '42' cell, all from one cached field."""
+    generator = maze(False, 4)
+    reserved = min(generator.pattern42_coords)
+    way, blocked = generator.paths_to([generator.exit, reserved])
+    assert blocked is None
+    assert len(way) == len(generator.get_solution("way"))
+    assert way[0] == generator.entry and way[-1] == generator.exit
+
+
+def test_field_cache():
+    """The last field is reused for its source until the grid changes."""
+    generator = maze(True, 5)
+    field = generator.distance_field()
+    assert generator.distance_field((0, 0)) is field
+    other = generator.distance_field((3, 3))
+    assert other is not field and other.source == 3 * generator.width + 3
+    assert generator.distance_field((3, 3)) is other
+    generator._touch()
+    fresh = generator.distance_field((3, 3))
+    assert fresh is not other and fresh.version == generator.version
+    assert list(fresh.dist) == list(other.dist)
+
+
+def brute_diameter(generator):
+    """Largest distance between two open cells, from every source."""
+    return max(
+        max(brute_distances(generator, divmod(i, generator.width)).values())
+        for i, b in enumerate(generator.pattern42) if not b
+    )
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+@pytest.mark.parametrize("size", ((5, 7), (15, 15)))
+def test_diameter_is_longest(algorithm, size):
+    """On perfect mazes the double sweep finds the true diameter."""
+    for seed in (0, 1):
+        generator = maze(True, seed, *size, algorithm=algorithm)
+        path = generator.diameter()
+        assert len(path) - 1 == brute_diameter(generator)
+        field = generator.distance_field(divmod(path[0], size[1]))
+        assert field.dist[path[-1]] == len(path) - 1
+
+
+def test_longest_path_places_ends():
+    """With ``longest_path`` the entry and exit are the diameter ends,
+    and the next generation starts from the configured ones again."""
+    generator = MazeGenerator(
+        15, 15, (0, 0), (14, 14), True, 8, "dfs", longest_path=True
+    )
+    generator.generate()
+    path = generator.diameter()
+    ends = {divmod(path[0], 15), divmod(path[-1], 15)}
+    assert {generator.entry, generator.exit} == ends
+    assert len(generator.get_solution()) == len(path) - 1
+    assert len(path) - 1 == brute_diameter(generator)
+    generator.seed = 9
+    generator.generate()
+    assert generator.configured_ends == ((0, 0), (14, 14))
+    assert len(generator.get_solution()) == brute_diameter(generator)
@@ -0,0 +1,83 @@
+"""LOOP_DENSITY must open about its share of the walls that may go."""
+
+import pytest
+from maze_app.generator.MazeGenerator import ALGORITHMS, MazeGenerator
+
+SIZE = 60
+
+
+def pair(algorithm, seed, density):
+    """The perfect maze of a seed and its version with loops added.
+
+    The algorithm draws the same random values in both, so the only
+    difference is the walls removed by the loop injection.
+    """
+    mazes = []
+    for perfect in (True, False):
+        generator = MazeGenerator(
+            SIZE, SIZE, (0, 0), (SIZE - 1, SIZE - 1), perfect, seed,
+            algorithm, loop_density=None if perfect else density,
+        )
+        generator.generate()
+        mazes.append(generator)
+    return mazes
+
+
+def open_walls(generator):
+    """Passages between cells, each counted once."""
+    return sum(bin(15 & ~walls).count("1") for walls in generator.cells) // 2
+
+
+def removable(generator):
+    """Interior walls the injection may remove from a perfect maze.
+
+    Closed, away from the border and the '42', and not the last closed
+    wall of either of its cells.
+    """
+    h, w, cells = generator.height, generator.width, generator.cells
+    reserved = generator.pattern42
+    count = 0
+    for i, walls in enumerate(cells):
+        f, c = divmod(i, w)
+        for wall, opposite, j, inside in (
+            (2, 8, i + 1, 1 <= f <= h - 2 and 1 <= c <= w - 3),
+            (4, 1, i + w, 1 <= f <= h - 3 and 1 <= c <= w - 2),
+        ):
+            count += bool(
+                inside and walls & wall and walls != wall
+                and cells[j] != opposite
+                and not reserved[i] and not reserved[j]
+            )
+    return count
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_density_sets_removed_walls(algorithm):
+    """About ``density`` of the removable walls are opened."""
+    perfect, looped = pair(algorithm, 2, 0.1)
+    removed = open_walls(looped) - open_walls(perfect)
+    expected = 0.1 * removable(perfect)
+    assert 0.8 * expected <= removed <= 1.2 * expected
+
+
+@pytest.mark.parametrize("density", (0.05, 0.3))
+def test_loops_keep_maze_sound(density):
+    """Loops only remove walls: the '42' stays closed and the shared
+    walls of neighbouring cells still agree."""
+    perfect, looped = pair("kruskal", 9, density)
+    w = looped.width
+    for i, walls in enumerate(looped.cells):
+        assert walls & perfect.cells[i] == walls
+        if looped.pattern42[i]:
+            assert walls == 15
+        if i % w < w - 1:
+            assert bool(walls & 2) == bool(looped.cells[i + 1] & 8)
+        if i + w < len(looped.cells):
+            assert bool(walls & 4) == bool(looped.cells[i + w] & 1)
+
+
+def test_zero_density_opens_one_wall():
+    """With nothing drawn, one wall is still opened so the maze is
+    not perfect."""
+    perfect, looped = pair("prim", 3, 0.0)
+    assert open_walls(looped) == open_walls(perfect) + 1
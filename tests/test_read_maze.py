@@ -0,0 +1,41 @@
+import pytest
+from maze_app.output.read_maze import (
+    MazeFileError, load_hex_maze, validate_hex_maze,
+)
+
+
+def write_maze(tmp_path, text):
+    """Write ``text`` as a maze file and return its path."""
+    path = tmp_path / "maze.txt"
+    path.write_bytes(text.encode())
+    return str(path)
+
+
+def test_open_north_border_is_rejected(tmp_path):
+    """A connected maze whose first row is open to the north."""
+    name = write_maze(tmp_path, "C3\nD6\n\n0,0\n1,1\n\n")
+    with pytest.raises(MazeFileError, match=":1:1: north wall"):
+        load_hex_maze(name)
+    with pytest.raises(MazeFileError, match=":1:1: north wall"):
+        validate_hex_maze(name)
+
+
+@pytest.mark.parametrize("grid, where", [
+    ("93\nC4", ":2:2: east wall"),
+    ("93\nC2", ":2:2: south wall"),
+    ("13\n46", ":1:1: west wall"),
+])
+def test_open_border_is_rejected(tmp_path, grid, where):
+    """Open east, south and west border walls are reported in place."""
+    name = write_maze(tmp_path, grid + "\n\n0,0\n1,1\n\n")
+    with pytest.raises(MazeFileError, match=where):
+        load_hex_maze(name, packed=True)
+
+
+def test_closed_border_loads(tmp_path):
+    """The same maze with its border closed loads and solves."""
+    name = write_maze(tmp_path, "93\nC6\n\n0,0\n1,1\nES\n")
+    generator, way = load_hex_maze(name)
+    assert way == "ES"
+    assert generator.bfs() == [(0, 0), (0, 1), (1, 1)]
+    assert validate_hex_maze(name) == (2, 2)
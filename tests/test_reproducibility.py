@@ -0,0 +1,104 @@
+"""Seeded generation must be bit-for-bit reproducible.
+
+Every registered algorithm is run for a few seeds, perfect and
+imperfect, and a digest of its cells plus BFS solution is compared with
+the value pinned below. The same jobs are then run again from several
+threads at once, each with its own generator, and must give the same
+digests. After an intentional change to an algorithm, print a fresh
+``PINNED`` table with ``python3 -m tests.test_reproducibility``.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from maze_app.generator.MazeGenerator import ALGORITHMS, MazeGenerator
+
+SIZE = 25
+SEEDS = (0, 1, 42)
+
+PINNED = {
+    ('dfs', 0, True): 'e4f959ac33dba4c5',
+    ('dfs', 0, False): '83ab4d3bc9cfd5f8',
+    ('dfs', 1, True): '7d05a23008232a33',
+    ('dfs', 1, False): '2dc9729164f92d5c',
+    ('dfs', 42, True): 'a1a36ca9febe8364',
+    ('dfs', 42, False): 'e67b5a1d174f7912',
+    ('prim', 0, True): '12e8e708444d890f',
+    ('prim', 0, False): '975ff0bac3e21153',
+    ('prim', 1, True): '6afc9f9195cc6c9c',
+    ('prim', 1, False): 'afc464d6b5f22f17',
+    ('prim', 42, True): 'a49632e932b7607d',
+    ('prim', 42, False): '4178ea70088b85ab',
+    ('kruskal', 0, True): '6f3accdc4e44fc81',
+    ('kruskal', 0, False): 'ab58dc06ec794a1e',
+    ('kruskal', 1, True): 'a6a94a2ed1427506',
+    ('kruskal', 1, False): '45095597af23fc60',
+    ('kruskal', 42, True): '9d133f0326c8a67c',
+    ('kruskal', 42, False): '3fb0fbb8f1323e63',
+    ('wilson', 0, True): '27f24c0dfc81d1fb',
+    ('wilson', 0, False): '9b3b0b17377dd92c',
+    ('wilson', 1, True): 'f5c0891aed24b171',
+    ('wilson', 1, False): '8d0e09884090ff58',
+    ('wilson', 42, True): '1d35b5ad01f712df',
+    ('wilson', 42, False): '7aec40fdc5e12228',
+    ('eller', 0, True): '0e9c97a0c478cd2a',
+    ('eller', 0, False): '3e4eddf431fee5f7',
+    ('eller', 1, True): 'e3997974f42a111b',
+    ('eller', 1, False): 'a6ab25bcb75a897c',
+    ('eller', 42, True): '5c1c217e3b9c7454',
+    ('eller', 42, False): '6666edb4a8599980',
+    ('binary_tree', 0, True): 'b45be116894edd52',
+    ('binary_tree', 0, False): 'a5a736a19a7fab41',
+    ('binary_tree', 1, True): 'e93749c304553951',
+    ('binary_tree', 1, False): '53a5c0cc0143cc70',
+    ('binary_tree', 42, True): '7563933acc6b492c',
+    ('binary_tree', 42, False): '6054787377c52483',
+    ('sidewinder', 0, True): '5e4efb2b7eab09a6',
+    ('sidewinder', 0, False): '38deaa1c78fe8236',
+    ('sidewinder', 1, True): '607d37e62a385a3f',
+    ('sidewinder', 1, False): 'e833bebaf0c62e2d',
+    ('sidewinder', 42, True): '3ec572c88e19f6ca',
+    ('sidewinder', 42, False): '5c8ad447e86be454',
+}
+
+
+CASES = [
+    (algorithm, seed, perfect)
+    for algorithm in ALGORITHMS
+    for seed in SEEDS
+    for perfect in (True, False)
+]
+
+
+def digest(algorithm, seed, perfect):
+    """Generate one maze and return a short digest of cells and solution."""
+    generator = MazeGenerator(
+        SIZE, SIZE, (0, 0), (SIZE - 1, SIZE - 1), perfect, seed, algorithm
+    )
+    generator.generate()
+    way = generator.get_solution()
+    data = bytes(generator.cells) + str(way).encode()
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda c: "-".join(map(str, c)))
+def test_pinned_digest(case):
+    """A seed keeps producing the maze it produced when pinned."""
+    assert case in PINNED, f"unpinned case, digest {digest(*case)}"
+    assert digest(*case) == PINNED[case]
+
+
+def test_threads_match_serial_runs():
+    """Generators running side by side do not share random state."""
+    serial = [digest(*case) for case in CASES]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        threaded = list(pool.map(lambda case: digest(*case), CASES))
+    assert threaded == serial
+
+
+if __name__ == "__main__":
+    print("PINNED = {")
+    for algorithm, seed, perfect in CASES:
+        value = digest(algorithm, seed, perfect)
+        print(f"    ({algorithm!r}, {seed}, {perfect}): {value!r},")
+    print("}")
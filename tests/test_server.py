@@ -0,0 +1,69 @@
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from maze_app import server
+from maze_app.server import HTTPError, MazeServer, maze_config
+
+QUERY = {"width": "30", "height": "5", "entry": "0,0", "exit": "4,4"}
+
+
+def get(target):
+    """Serve ``GET target`` on a fresh server; return status and JSON."""
+    async def run():
+        with ThreadPoolExecutor(1) as pool:
+            app = MazeServer(pool)
+            listener = await asyncio.start_server(app.handle, "127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                reader, writer = await asyncio.open_connection(
+                    "127.0.0.1", port
+                )
+                writer.write(f"GET {target} HTTP/1.1\r\n\r\n".encode())
+                response = await reader.read()
+                writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("changes, message", [
+    ({"seed": "99999999999999999999"}, "64-bit"),
+    ({"entry": "20,0", "exit": "0,0"}, "entry (20,0) is outside"),
+    ({"exit": "6,2"}, "exit (6,2) is outside"),
+])
+def test_maze_config_rejects_out_of_range(changes, message):
+    """Values the worker cannot build are refused while parsing."""
+    with pytest.raises(HTTPError, match=re.escape(message)) as error:
+        maze_config({**QUERY, **changes})
+    assert error.value.status == 400
+
+
+@pytest.mark.parametrize("query", [
+    "width=30&height=5&entry=0,0&exit=4,4&seed=99999999999999999999",
+    "width=30&height=5&entry=20,0&exit=0,0",
+])
+def test_out_of_range_requests_get_400(query):
+    """Both inputs used to close the connection without a response."""
+    status, body = get(f"/generate?{query}")
+    assert status == 400
+    assert "error" in body
+
+
+def test_worker_crash_gets_500(monkeypatch):
+    """An unexpected worker exception is answered, not dropped."""
+    def crash(config):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(server, "build_maze", crash)
+    status, body = get("/generate?width=30&height=5&entry=0,0&exit=4,4")
+    assert status == 500
+    assert body == {"error": "internal error: RuntimeError"}
+
+
+def test_valid_request_still_served():
+    """A request inside the limits is generated as before."""
+    status, body = get("/generate?width=30&height=5&entry=0,0&exit=4,4"
+                       "&seed=7")
+    assert status == 200
+    assert body["solution_length"] > 0
@@ -0,0 +1,117 @@
+"""Registered solvers must agree on the mazes they are given."""
+
+import pytest
+from maze_app.generator.MazeGenerator import SOLVERS, MazeGenerator
+
+SHORTEST = ("bfs", "astar", "bidirectional")
+
+
+def maze(perfect, seed, solver="bfs", entry=(0, 0)):
+    """A 19x23 maze whose exit sits away from the corners."""
+    generator = MazeGenerator(
+        19, 23, entry, (12, 3), perfect, seed, "prim", solver
+    )
+    generator.generate()
+    return generator
+
+
+def solve(generator, solver):
+    """The flat-index solution of ``solver`` on ``generator``."""
+    generator.solver = solver
+    return generator.solve_cells()
+
+
+@pytest.mark.parametrize("perfect", (True, False))
+@pytest.mark.parametrize("seed", (0, 1, 2))
+def test_shortest_solvers_agree(perfect, seed):
+    """BFS, A* and bidirectional BFS find paths of the same length."""
+    generator = maze(perfect, seed)
+    lengths = {len(solve(generator, solver)) for solver in SHORTEST}
+    assert len(lengths) == 1
+    assert lengths == {generator.distance_field().dist[12 * 23 + 3] + 1}
+
+
+def test_bidirectional_from_the_exit():
+    """Starting on the exit is a one-cell path and one expansion."""
+    generator = maze(True, 0, "bidirectional", entry=(12, 3))
+    assert generator.solve_cells() == [12 * 23 + 3]
+    assert generator.nodes_expanded == 1
+
+
+def test_unknown_solver():
+    """A solver name missing from the registry is rejected."""
+    generator = maze(True, 0, "dijkstra")
+    assert "dijkstra" not in SOLVERS
+    with pytest.raises(ValueError):
+        generator.solve_cells()
+
+
+def walkable(generator, path):
+    """Whether ``path`` goes from entry to exit through open walls."""
+    w = generator.width
+    moves = {-w: 1, 1: 2, w: 4, -1: 8}
+    ends = (divmod(path[0], w), divmod(path[-1], w))
+    return ends == (generator.entry, generator.exit) and all(
+        b - a in moves and not generator.cells[a] & moves[b - a]
+        for a, b in zip(path, path[1:])
+    )
+
+
+@pytest.mark.parametrize("solver", sorted(SOLVERS))
+@pytest.mark.parametrize("perfect", (True, False))
+def test_flat_paths_are_walkable(solver, perfect):
+    """Every solver returns adjacent flat indices from entry to exit."""
+    generator = maze(perfect, 4, solver)
+    path = generator.solve_cells()
+    assert walkable(generator, path)
+    assert len(set(path)) == len(path)
+    assert generator.way_cells(generator.get_solution()) == path
+    assert generator.get_solution("way") == [divmod(i, 23) for i in path]
+
+
+@pytest.mark.parametrize("solver", sorted(SOLVERS))
+def test_walled_in_exit(solver):
+    """With the exit closed off there is no path."""
+    generator = maze(True, 5, solver)
+    generator.grid = [list(row) for row in generator.grid]
+    generator.grid[12][3] = 15
+    for f, c, wall in ((11, 3, 4), (13, 3, 1), (12, 2, 2), (12, 4, 8)):
+        generator.grid[f][c] |= wall
+    assert generator.solve_cells() is None
+
+
+def test_solution_cached_per_version():
+    """A second solve of the same grid returns the cached path."""
+    generator = maze(True, 6, "astar")
+    assert not generator.is_solved()
+    path = generator.solve_cells()
+    expanded = generator.nodes_expanded
+    assert generator.is_solved()
+    generator.nodes_expanded = 0
+    assert generator.solve_cells() is path
+    assert generator.nodes_expanded == expanded
+
+
+def test_cache_keyed_by_solver():
+    """Each solver keeps its own entry for the same grid."""
+    generator = maze(False, 6)
+    paths = {solver: solve(generator, solver) for solver in SOLVERS}
+    for solver, path in paths.items():
+        assert solve(generator, solver) is path
+
+
+def test_grid_changes_invalidate_cache():
+    """Regeneration, grid assignment and ``_touch`` drop the cache."""
+    generator = maze(True, 7)
+    path = generator.solve_cells()
+    version = generator.version
+    generator.generate()
+    assert generator.version > version and not generator.is_solved()
+    assert generator.solve_cells() == path
+    generator.grid = [list(row) for row in generator.grid]
+    assert not generator.is_solved()
+    path = generator.solve_cells()
+    generator._touch()
+    assert not generator.is_solved()
+    again = generator.solve_cells()
+    assert again == path and again is not path